@@ -15,6 +15,16 @@ public enum AllocatorSingleton {
         return rootAllocator.newChildAllocator(nextChildName(), 0, Long.MAX_VALUE);
     }
 
+    /** Bytes currently allocated by all child allocators. */
+    public static long getAllocatedMemory() {
+        return rootAllocator.getAllocatedMemory();
+    }
+
+    /** Highest number of bytes allocated at any one time so far. */
+    public static long getPeakMemoryAllocation() {
+        return rootAllocator.getPeakMemoryAllocation();
+    }
+
     private static String nextChildName() {
         return "Allocator-Child-" + childNumber.incrementAndGet();
     }
@@ -0,0 +1,57 @@
+package org.jaydebeapiarrow.extension;
+
+import java.util.Arrays;
+import java.util.List;
+
+import org.apache.arrow.memory.BufferAllocator;
+
+/**
+ * Entry point run by jaydebeapiarrow.build_cds_archive() under
+ * -XX:ArchiveClassesAtExit. It loads the classes a first query needs, so the
+ * dynamic Class Data Sharing archive written at exit covers them and later
+ * JVMs map them from the archive instead of parsing and verifying the jars.
+ *
+ * Arguments are extra class names to load, typically the JDBC driver class.
+ */
+public class CdsWarmup {
+
+    private static final List<String> CLASSES = Arrays.asList(
+            "org.jaydebeapiarrow.extension.JDBCUtils",
+            "org.jaydebeapiarrow.extension.ExplicitTypeMapper",
+            "org.jaydebeapiarrow.extension.ColumnMetaData",
+            "org.jaydebeapiarrow.extension.ConversionOptions",
+            "org.jaydebeapiarrow.extension.DriverProfile",
+            "org.jaydebeapiarrow.extension.TemporalSupport",
+            "org.jaydebeapiarrow.extension.TimeUtils",
+            "org.jaydebeapiarrow.extension.DictionaryBatchEncoder",
+            "org.jaydebeapiarrow.extension.consumer.OverriddenConsumer",
+            "org.jaydebeapiarrow.extension.consumer.DateConsumer",
+            "org.jaydebeapiarrow.extension.consumer.TimeConsumer",
+            "org.jaydebeapiarrow.extension.consumer.TimestampConsumer",
+            "org.jaydebeapiarrow.extension.consumer.TimestampTZConsumer",
+            "org.jaydebeapiarrow.extension.consumer.DecimalConsumer",
+            "org.jaydebeapiarrow.extension.consumer.LobConsumer",
+            "org.apache.arrow.adapter.jdbc.JdbcToArrow",
+            "org.apache.arrow.adapter.jdbc.JdbcToArrowUtils",
+            "org.apache.arrow.adapter.jdbc.JdbcToArrowConfigBuilder",
+            "org.apache.arrow.adapter.jdbc.ArrowVectorIterator",
+            "org.apache.arrow.adapter.jdbc.JdbcParameterBinder",
+            "org.apache.arrow.c.Data",
+            "org.apache.arrow.c.ArrowArray",
+            "org.apache.arrow.c.ArrowSchema",
+            "org.apache.arrow.vector.VectorSchemaRoot");
+
+    public static void main(String[] args) throws Exception {
+        ClassLoader loader = CdsWarmup.class.getClassLoader();
+        for (String name : CLASSES) {
+            Class.forName(name, true, loader);
+        }
+        for (String name : args) {
+            Class.forName(name, true, loader);
+        }
+        // Creating an allocator pulls in the memory manager and its Netty classes.
+        try (BufferAllocator allocator = AllocatorSingleton.getChildAllocator()) {
+            allocator.buffer(64).close();
+        }
+    }
+}
@@ -0,0 +1,259 @@
+package org.jaydebeapiarrow.extension;
+
+import java.sql.ResultSet;
+import java.sql.ResultSetMetaData;
+import java.sql.SQLException;
+import java.sql.SQLFeatureNotSupportedException;
+
+import org.jaydebeapiarrow.extension.consumer.LobConsumer;
+
+/**
+ * Snapshot of the ResultSetMetaData of a result set, read once per query.
+ *
+ * Both the DB-API {@code Cursor.description} on the Python side and the Arrow
+ * type mapping in {@link ExplicitTypeMapper} need the same per-column facts.
+ * Reading them once into flat arrays lets Python fetch everything with a single
+ * call per attribute instead of several JPype round trips per column, and keeps
+ * the type mapper from going back to the driver metadata on every pass.
+ *
+ * Arrays are 0-based; the accessor methods take 1-based JDBC column indices.
+ */
+public class ColumnMetaData {
+
+    public final int columnCount;
+    public final String[] names;
+    public final String[] labels;
+    public final String[] typeNames;
+    public final int[] types;
+    public final int[] displaySizes;
+    public final int[] precisions;
+    public final int[] scales;
+    public final int[] nullables;
+
+    private ColumnMetaData(int columnCount) {
+        this.columnCount = columnCount;
+        this.names = new String[columnCount];
+        this.labels = new String[columnCount];
+        this.typeNames = new String[columnCount];
+        this.types = new int[columnCount];
+        this.displaySizes = new int[columnCount];
+        this.precisions = new int[columnCount];
+        this.scales = new int[columnCount];
+        this.nullables = new int[columnCount];
+    }
+
+    public static ColumnMetaData of(ResultSet resultSet) throws SQLException {
+        return of(resultSet.getMetaData());
+    }
+
+    public static ColumnMetaData of(ResultSetMetaData metaData) throws SQLException {
+        ColumnMetaData snapshot = new ColumnMetaData(metaData.getColumnCount());
+        for (int i = 0; i < snapshot.columnCount; i++) {
+            int columnIndex = i + 1; // JDBC is 1-based
+            snapshot.types[i] = metaData.getColumnType(columnIndex);
+            snapshot.names[i] = metaData.getColumnName(columnIndex);
+            snapshot.labels[i] = metaData.getColumnLabel(columnIndex);
+            snapshot.typeNames[i] = metaData.getColumnTypeName(columnIndex);
+            // Size, precision, scale and nullability are informational only;
+            // some drivers reject them for particular types, so keep the
+            // JDBC "unknown" values rather than failing the whole query.
+            try {
+                snapshot.displaySizes[i] = metaData.getColumnDisplaySize(columnIndex);
+            } catch (SQLException e) {
+                snapshot.displaySizes[i] = 0;
+            }
+            try {
+                snapshot.precisions[i] = metaData.getPrecision(columnIndex);
+            } catch (SQLException e) {
+                snapshot.precisions[i] = 0;
+            }
+            try {
+                snapshot.scales[i] = metaData.getScale(columnIndex);
+            } catch (SQLException e) {
+                snapshot.scales[i] = 0;
+            }
+            try {
+                snapshot.nullables[i] = metaData.isNullable(columnIndex);
+            } catch (SQLException e) {
+                snapshot.nullables[i] = ResultSetMetaData.columnNullableUnknown;
+            }
+        }
+        return snapshot;
+    }
+
+    public int getColumnCount() {
+        return columnCount;
+    }
+
+    public String getColumnName(int columnIndex) {
+        return names[columnIndex - 1];
+    }
+
+    public String getColumnLabel(int columnIndex) {
+        return labels[columnIndex - 1];
+    }
+
+    public String getColumnTypeName(int columnIndex) {
+        return typeNames[columnIndex - 1];
+    }
+
+    public int getColumnType(int columnIndex) {
+        return types[columnIndex - 1];
+    }
+
+    public int getColumnDisplaySize(int columnIndex) {
+        return displaySizes[columnIndex - 1];
+    }
+
+    public int getPrecision(int columnIndex) {
+        return precisions[columnIndex - 1];
+    }
+
+    public int getScale(int columnIndex) {
+        return scales[columnIndex - 1];
+    }
+
+    public int isNullable(int columnIndex) {
+        return nullables[columnIndex - 1];
+    }
+
+    /**
+     * Return a ResultSetMetaData answering from this snapshot, for Arrow APIs
+     * that take one, so that they do not go back to the driver. Attributes
+     * the snapshot does not hold have their JDBC "unknown" values.
+     */
+    public ResultSetMetaData asResultSetMetaData() {
+        return new SnapshotMetaData();
+    }
+
+    private final class SnapshotMetaData implements ResultSetMetaData {
+
+        @Override
+        public int getColumnCount() {
+            return columnCount;
+        }
+
+        @Override
+        public boolean isAutoIncrement(int column) {
+            return false;
+        }
+
+        @Override
+        public boolean isCaseSensitive(int column) {
+            return true;
+        }
+
+        @Override
+        public boolean isSearchable(int column) {
+            return true;
+        }
+
+        @Override
+        public boolean isCurrency(int column) {
+            return false;
+        }
+
+        @Override
+        public int isNullable(int column) {
+            return ColumnMetaData.this.isNullable(column);
+        }
+
+        @Override
+        public boolean isSigned(int column) {
+            return true;
+        }
+
+        @Override
+        public int getColumnDisplaySize(int column) {
+            return ColumnMetaData.this.getColumnDisplaySize(column);
+        }
+
+        @Override
+        public String getColumnLabel(int column) {
+            return ColumnMetaData.this.getColumnLabel(column);
+        }
+
+        @Override
+        public String getColumnName(int column) {
+            return ColumnMetaData.this.getColumnName(column);
+        }
+
+        @Override
+        public String getSchemaName(int column) {
+            return "";
+        }
+
+        @Override
+        public int getPrecision(int column) {
+            return ColumnMetaData.this.getPrecision(column);
+        }
+
+        @Override
+        public int getScale(int column) {
+            return ColumnMetaData.this.getScale(column);
+        }
+
+        @Override
+        public String getTableName(int column) {
+            return "";
+        }
+
+        @Override
+        public String getCatalogName(int column) {
+            return "";
+        }
+
+        @Override
+        public int getColumnType(int column) {
+            return ColumnMetaData.this.getColumnType(column);
+        }
+
+        @Override
+        public String getColumnTypeName(int column) {
+            return ColumnMetaData.this.getColumnTypeName(column);
+        }
+
+        @Override
+        public boolean isReadOnly(int column) {
+            return true;
+        }
+
+        @Override
+        public boolean isWritable(int column) {
+            return false;
+        }
+
+        @Override
+        public boolean isDefinitelyWritable(int column) {
+            return false;
+        }
+
+        @Override
+        public String getColumnClassName(int column) throws SQLException {
+            throw new SQLFeatureNotSupportedException("Not part of the column metadata snapshot");
+        }
+
+        @Override
+        public <T> T unwrap(Class<T> iface) throws SQLException {
+            if (iface.isInstance(this)) {
+                return iface.cast(this);
+            }
+            throw new SQLException("Not a wrapper for " + iface.getName());
+        }
+
+        @Override
+        public boolean isWrapperFor(Class<?> iface) {
+            return iface.isInstance(this);
+        }
+    }
+
+    /** True if any column is a CLOB/BLOB-like large object. */
+    public boolean hasLargeObjectColumns() {
+        for (int type : types) {
+            if (LobConsumer.isLargeObjectType(type)) {
+                return true;
+            }
+        }
+        return false;
+    }
+}
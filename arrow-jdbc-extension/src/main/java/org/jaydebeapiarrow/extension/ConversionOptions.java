@@ -0,0 +1,146 @@
+package org.jaydebeapiarrow.extension;
+
+import java.util.Collections;
+import java.util.LinkedHashSet;
+import java.util.Locale;
+import java.util.Set;
+
+/**
+ * Per-query options controlling how result columns are converted to Arrow.
+ * Created on the Python side from the connection and cursor settings.
+ */
+public class ConversionOptions {
+
+    /** How DECIMAL/NUMERIC columns are read. */
+    public enum DecimalMode {
+        /* decimal128 with the column precision and scale */
+        EXACT,
+        /* int64 for columns with scale 0 and precision <= 18, decimal128 otherwise */
+        INT_WHEN_SCALE0,
+        /* float64 for every DECIMAL/NUMERIC column */
+        FLOAT64;
+
+        public static DecimalMode fromString(String mode) {
+            return valueOf(mode.trim().toUpperCase(Locale.ROOT));
+        }
+    }
+
+    /** Which string and binary columns use 64-bit offset (large) Arrow types. */
+    public enum LargeTypes {
+        /* utf8/binary for every column */
+        NONE,
+        /* large_utf8/large_binary for CLOB/NCLOB/LONGVARCHAR/LONGNVARCHAR/BLOB/LONGVARBINARY */
+        LOB,
+        /* large_utf8/large_binary for every string and binary column */
+        ALL;
+
+        public static LargeTypes fromString(String mode) {
+            return valueOf(mode.trim().toUpperCase(Locale.ROOT));
+        }
+    }
+
+    /** Unit of the Arrow time type TIME columns are read as. */
+    public enum TimePrecision {
+        /* time32[ms], the arrow-jdbc default */
+        MS,
+        /* time64[us], for drivers that return sub-millisecond TIME values */
+        US;
+
+        public static TimePrecision fromString(String unit) {
+            return valueOf(unit.trim().toUpperCase(Locale.ROOT));
+        }
+    }
+
+    public static final ConversionOptions DEFAULT = new ConversionOptions();
+
+    private DecimalMode decimalMode = DecimalMode.EXACT;
+    private final Set<String> dictionaryEncodeColumns = new LinkedHashSet<>();
+    private int lobMaxLength = -1;
+    private LargeTypes largeTypes = LargeTypes.NONE;
+    private boolean columnMetadata = false;
+    private TimePrecision timePrecision = TimePrecision.MS;
+
+    public DecimalMode getDecimalMode() {
+        return decimalMode;
+    }
+
+    public ConversionOptions setDecimalMode(String decimalMode) {
+        this.decimalMode = DecimalMode.fromString(decimalMode);
+        return this;
+    }
+
+    /** Upper-cased labels of the columns to dictionary-encode. */
+    public Set<String> getDictionaryEncodeColumns() {
+        return Collections.unmodifiableSet(dictionaryEncodeColumns);
+    }
+
+    public boolean hasDictionaryEncodeColumns() {
+        return !dictionaryEncodeColumns.isEmpty();
+    }
+
+    /**
+     * Dictionary-encode the VARCHAR column labelled 'columnName' (case-insensitive)
+     * in exported batches, see {@link DictionaryBatchEncoder}.
+     */
+    public ConversionOptions addDictionaryEncodeColumn(String columnName) {
+        dictionaryEncodeColumns.add(columnName.toUpperCase(Locale.ROOT));
+        return this;
+    }
+
+    /** Maximum characters/bytes read per large-object value, or -1 for no limit. */
+    public int getLobMaxLength() {
+        return lobMaxLength;
+    }
+
+    /**
+     * Truncate CLOB/BLOB-like values to 'lobMaxLength' characters (text) or
+     * bytes (binary) while reading, see {@link org.jaydebeapiarrow.extension.consumer.LobConsumer}.
+     * A negative value reads values completely.
+     */
+    public ConversionOptions setLobMaxLength(int lobMaxLength) {
+        this.lobMaxLength = lobMaxLength < 0 ? -1 : lobMaxLength;
+        return this;
+    }
+
+    public LargeTypes getLargeTypes() {
+        return largeTypes;
+    }
+
+    public ConversionOptions setLargeTypes(String largeTypes) {
+        this.largeTypes = LargeTypes.fromString(largeTypes);
+        return this;
+    }
+
+    public boolean hasColumnMetadata() {
+        return columnMetadata;
+    }
+
+    /**
+     * Add the driver-reported JDBC metadata (see ExplicitTypeMapper.createColumnMetadata)
+     * to the fields of fetched batches. Exported schemas always carry it.
+     */
+    public ConversionOptions setColumnMetadata(boolean columnMetadata) {
+        this.columnMetadata = columnMetadata;
+        return this;
+    }
+
+    public TimePrecision getTimePrecision() {
+        return timePrecision;
+    }
+
+    /** Read TIME columns as time32[ms] ("ms") or time64[us] ("us"). */
+    public ConversionOptions setTimePrecision(String timePrecision) {
+        this.timePrecision = TimePrecision.fromString(timePrecision);
+        return this;
+    }
+
+    @Override
+    public String toString() {
+        return "ConversionOptions(decimalMode=" + decimalMode
+                + ", dictionaryEncodeColumns=" + dictionaryEncodeColumns
+                + ", lobMaxLength=" + lobMaxLength
+                + ", largeTypes=" + largeTypes
+                + ", columnMetadata=" + columnMetadata
+                + ", timePrecision=" + timePrecision + ")";
+    }
+}
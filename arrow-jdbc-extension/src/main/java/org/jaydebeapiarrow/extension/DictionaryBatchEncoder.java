@@ -0,0 +1,139 @@
+package org.jaydebeapiarrow.extension;
+
+import java.nio.ByteBuffer;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Locale;
+import java.util.Map;
+import java.util.Set;
+import java.util.logging.Level;
+import java.util.logging.Logger;
+
+import org.apache.arrow.memory.BufferAllocator;
+import org.apache.arrow.vector.FieldVector;
+import org.apache.arrow.vector.IntVector;
+import org.apache.arrow.vector.VarCharVector;
+import org.apache.arrow.vector.VectorSchemaRoot;
+import org.apache.arrow.vector.dictionary.Dictionary;
+import org.apache.arrow.vector.dictionary.DictionaryProvider;
+import org.apache.arrow.vector.types.pojo.ArrowType;
+import org.apache.arrow.vector.types.pojo.DictionaryEncoding;
+import org.apache.arrow.vector.types.pojo.Field;
+import org.apache.arrow.vector.types.pojo.FieldType;
+
+/**
+ * Dictionary-encodes selected string columns of a batch before it is exported.
+ *
+ * Each selected VARCHAR column is replaced by an int32 index vector and a
+ * dictionary of its distinct values, built in a single pass over the batch.
+ * Dictionaries are per batch: consumers see a dictionary&lt;int32, utf8&gt;
+ * column whose dictionary may differ from one batch to the next, which
+ * pyarrow and pandas (category dtype) handle natively.
+ */
+public class DictionaryBatchEncoder {
+
+    private static final Logger logger = Logger.getLogger(DictionaryBatchEncoder.class.getName());
+
+    private static final ArrowType.Int INDEX_TYPE = new ArrowType.Int(32, true);
+
+    /**
+     * A batch with some columns replaced by their encoded form. Closing it
+     * releases the vectors created by the encoder; the columns that were not
+     * encoded still belong to the original root.
+     */
+    public static class EncodedBatch implements AutoCloseable {
+
+        private final VectorSchemaRoot root;
+        private final DictionaryProvider.MapDictionaryProvider provider;
+        private final List<FieldVector> created;
+
+        EncodedBatch(VectorSchemaRoot root, DictionaryProvider.MapDictionaryProvider provider, List<FieldVector> created) {
+            this.root = root;
+            this.provider = provider;
+            this.created = created;
+        }
+
+        public VectorSchemaRoot getRoot() {
+            return root;
+        }
+
+        public DictionaryProvider getProvider() {
+            return provider;
+        }
+
+        @Override
+        public void close() {
+            for (FieldVector vector : created) {
+                vector.close();
+            }
+        }
+    }
+
+    /**
+     * Encode the columns of 'root' whose name is in 'columnNames' (upper-cased).
+     * Columns that are not VARCHAR are left as they are.
+     */
+    public static EncodedBatch encode(VectorSchemaRoot root, Set<String> columnNames) {
+        List<FieldVector> vectors = new ArrayList<>(root.getFieldVectors());
+        List<FieldVector> created = new ArrayList<>();
+        DictionaryProvider.MapDictionaryProvider provider = new DictionaryProvider.MapDictionaryProvider();
+        try {
+            for (int i = 0; i < vectors.size(); i++) {
+                FieldVector vector = vectors.get(i);
+                String name = vector.getField().getName();
+                if (name == null || !columnNames.contains(name.toUpperCase(Locale.ROOT))) {
+                    continue;
+                }
+                if (!(vector instanceof VarCharVector)) {
+                    if (logger.isLoggable(Level.FINE)) {
+                        logger.fine("Not dictionary-encoding column " + name + " of type " + vector.getField().getType());
+                    }
+                    continue;
+                }
+                DictionaryEncoding encoding = new DictionaryEncoding(i, false, INDEX_TYPE);
+                VarCharVector dictionaryVector = new VarCharVector(name, vector.getAllocator());
+                created.add(dictionaryVector);
+                IntVector indices = encodeColumn((VarCharVector) vector, dictionaryVector, encoding, vector.getAllocator());
+                created.add(indices);
+                provider.put(new Dictionary(dictionaryVector, encoding));
+                vectors.set(i, indices);
+            }
+        } catch (RuntimeException e) {
+            for (FieldVector vector : created) {
+                vector.close();
+            }
+            throw e;
+        }
+        return new EncodedBatch(new VectorSchemaRoot(vectors), provider, created);
+    }
+
+    private static IntVector encodeColumn(VarCharVector values, VarCharVector dictionary,
+                                          DictionaryEncoding encoding, BufferAllocator allocator) {
+        Field source = values.getField();
+        Field field = new Field(source.getName(),
+                new FieldType(source.isNullable(), INDEX_TYPE, encoding, source.getMetadata()), null);
+        IntVector indices = new IntVector(field, allocator);
+        int valueCount = values.getValueCount();
+        indices.allocateNew(valueCount);
+        dictionary.allocateNew();
+
+        Map<ByteBuffer, Integer> positions = new HashMap<>();
+        for (int row = 0; row < valueCount; row++) {
+            if (values.isNull(row)) {
+                continue;
+            }
+            byte[] bytes = values.get(row);
+            Integer position = positions.get(ByteBuffer.wrap(bytes));
+            if (position == null) {
+                position = positions.size();
+                positions.put(ByteBuffer.wrap(bytes), position);
+                dictionary.setSafe(position, bytes);
+            }
+            indices.set(row, position);
+        }
+        dictionary.setValueCount(positions.size());
+        indices.setValueCount(valueCount);
+        return indices;
+    }
+}
@@ -0,0 +1,65 @@
+package org.jaydebeapiarrow.extension;
+
+import java.util.Locale;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+
+/**
+ * Java side of a Python {@code DriverProfile}: the per-driver type overrides
+ * applied by {@link ExplicitTypeMapper} ahead of its built-in rules.
+ *
+ * Override keys are a normalized type name ("NUMBER"), optionally followed by
+ * precision and scale ("NUMBER(19,0)"). A key with precision and scale takes
+ * precedence over the bare type name. The profile owns the type mapper and the
+ * {@link TemporalSupport} used for its connections, so the mapper's rule cache
+ * and the temporal fallback probe are shared across queries.
+ */
+public class DriverProfile {
+
+    private final String name;
+    private final Map<String, Integer> typeOverrides = new ConcurrentHashMap<>();
+    private final ExplicitTypeMapper typeMapper;
+    private final TemporalSupport temporalSupport = new TemporalSupport();
+
+    public DriverProfile(String name) {
+        this.name = name;
+        this.typeMapper = new ExplicitTypeMapper(this);
+    }
+
+    public String getName() {
+        return name;
+    }
+
+    public ExplicitTypeMapper getTypeMapper() {
+        return typeMapper;
+    }
+
+    public TemporalSupport getTemporalSupport() {
+        return temporalSupport;
+    }
+
+    public void addTypeOverride(String typeSpec, int jdbcType) {
+        typeOverrides.put(typeSpec.trim().toUpperCase(Locale.ROOT), jdbcType);
+    }
+
+    /**
+     * Return the JDBC type a column should be read as, or null to keep the
+     * default mapping.
+     */
+    public Integer findTypeOverride(String columnTypeName, int precision, int scale) {
+        if (typeOverrides.isEmpty() || columnTypeName == null) {
+            return null;
+        }
+        String normalizedTypeName = columnTypeName.trim().toUpperCase(Locale.ROOT);
+        Integer jdbcType = typeOverrides.get(normalizedTypeName + "(" + precision + "," + scale + ")");
+        if (jdbcType != null) {
+            return jdbcType;
+        }
+        return typeOverrides.get(normalizedTypeName);
+    }
+
+    @Override
+    public String toString() {
+        return "DriverProfile(" + name + ", " + typeOverrides + ")";
+    }
+}
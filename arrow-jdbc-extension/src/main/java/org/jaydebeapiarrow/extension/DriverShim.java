@@ -0,0 +1,71 @@
+package org.jaydebeapiarrow.extension;
+
+import java.sql.Connection;
+import java.sql.Driver;
+import java.sql.DriverPropertyInfo;
+import java.sql.SQLException;
+import java.sql.SQLFeatureNotSupportedException;
+import java.util.Properties;
+import java.util.logging.Logger;
+
+/**
+ * A java.sql.Driver that delegates to a driver loaded by another classloader.
+ *
+ * DriverManager only hands out drivers whose class is visible to the caller's
+ * classloader, so a driver loaded from a URLClassLoader after JVM start (the
+ * experimental dynamic_classpath option) is registered through this shim,
+ * which lives on the system classpath in the extension jar. Being plain Java,
+ * calls from DriverManager or connection pools never re-enter Python.
+ */
+public class DriverShim implements Driver {
+
+    private final Driver driver;
+
+    public DriverShim(Driver driver) {
+        this.driver = driver;
+    }
+
+    public Driver getDriver() {
+        return driver;
+    }
+
+    @Override
+    public Connection connect(String url, Properties info) throws SQLException {
+        return driver.connect(url, info);
+    }
+
+    @Override
+    public boolean acceptsURL(String url) throws SQLException {
+        return driver.acceptsURL(url);
+    }
+
+    @Override
+    public DriverPropertyInfo[] getPropertyInfo(String url, Properties info) throws SQLException {
+        return driver.getPropertyInfo(url, info);
+    }
+
+    @Override
+    public int getMajorVersion() {
+        return driver.getMajorVersion();
+    }
+
+    @Override
+    public int getMinorVersion() {
+        return driver.getMinorVersion();
+    }
+
+    @Override
+    public boolean jdbcCompliant() {
+        return driver.jdbcCompliant();
+    }
+
+    @Override
+    public Logger getParentLogger() throws SQLFeatureNotSupportedException {
+        return driver.getParentLogger();
+    }
+
+    @Override
+    public String toString() {
+        return "DriverShim(" + driver.getClass().getName() + ")";
+    }
+}
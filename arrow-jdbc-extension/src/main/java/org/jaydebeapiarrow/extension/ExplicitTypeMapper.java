@@ -2,6 +2,8 @@ package org.jaydebeapiarrow.extension;
 
 import java.sql.*;
 import java.util.*;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.logging.Level;
 import java.util.logging.Logger;
 
 import com.jakewharton.fliptables.FlipTable;
@@ -10,22 +12,199 @@ import org.apache.arrow.adapter.jdbc.JdbcFieldInfo;
 public class ExplicitTypeMapper {
 
     private static final Logger logger = Logger.getLogger(ExplicitTypeMapper.class.getName());
+
+    /* Arrow field metadata keys carrying the driver-reported column metadata,
+     * so that the DB-API description can be rebuilt from the Arrow schema. */
+    public static final String JDBC_TYPE_KEY = "JDBC_TYPE";
+    public static final String JDBC_DISPLAY_SIZE_KEY = "JDBC_DISPLAY_SIZE";
+    public static final String JDBC_PRECISION_KEY = "JDBC_PRECISION";
+    public static final String JDBC_SCALE_KEY = "JDBC_SCALE";
+    public static final String JDBC_NULLABLE_KEY = "JDBC_NULLABLE";
+
+    /** How a column is remapped, decided from its type code and type name alone. */
+    enum ColumnRule {
+        /* keep the default Arrow JDBC mapping */
+        NONE(null),
+        /* correctly marked as Decimal; precision and scale come from the column */
+        DECIMAL(null),
+        /* INTEGER columns whose name contains DECIMAL are inferred as Decimal */
+        DECIMAL_IF_NAMED(null),
+        DOUBLE(new JdbcFieldInfo(Types.DOUBLE)),
+        TIME(new JdbcFieldInfo(Types.TIME)),
+        TIMESTAMP(new JdbcFieldInfo(Types.TIMESTAMP)),
+        TIMESTAMP_WITH_TIMEZONE(new JdbcFieldInfo(Types.TIMESTAMP_WITH_TIMEZONE)),
+        VARCHAR(new JdbcFieldInfo(Types.VARCHAR));
+
+        final JdbcFieldInfo fieldInfo;
+
+        ColumnRule(JdbcFieldInfo fieldInfo) {
+            this.fieldInfo = fieldInfo;
+        }
+    }
+
+    /** Matches a normalized type name containing all of the given fragments. */
+    static final class FragmentRule {
+        final String[] fragments;
+        final ColumnRule rule;
+
+        FragmentRule(ColumnRule rule, String... fragments) {
+            this.rule = rule;
+            this.fragments = fragments;
+        }
+
+        boolean matches(String normalizedTypeName) {
+            for (String fragment : fragments) {
+                if (!normalizedTypeName.contains(fragment)) {
+                    return false;
+                }
+            }
+            return true;
+        }
+    }
+
+    /* Largest DECIMAL precision whose integral values always fit in an int64. */
+    private static final int MAX_INT64_DECIMAL_PRECISION = 18;
+    private static final JdbcFieldInfo BIGINT_FIELD_INFO = new JdbcFieldInfo(Types.BIGINT);
+
+    private static final Set<Integer> KNOWN_TYPE_CODES = new HashSet<>();
+
+    /* Rules applied to every column with the given type code. */
+    private static final Map<Integer, ColumnRule> CODE_RULES = new HashMap<>();
+
+    /* Rules keyed by "<type code>:<normalized type name>". */
+    private static final Map<String, ColumnRule> NAME_RULES = new HashMap<>();
+
+    /* JSON/JSONB/UUID/XML columns reported as Types.OTHER (e.g., PostgreSQL).
+     * Map to VARCHAR so they are read as strings via the default Arrow path. */
+    private static final List<FragmentRule> OTHER_FRAGMENT_RULES = Arrays.asList(
+            new FragmentRule(ColumnRule.VARCHAR, "JSON"),
+            new FragmentRule(ColumnRule.VARCHAR, "UUID"),
+            new FragmentRule(ColumnRule.VARCHAR, "XML"));
+
+    /* Columns whose JDBC type code is not recognized by the standard JDBCType
+     * enum are matched on their type NAME so this works driver-agnostically.
+     * Known cases: Oracle reports BINARY_DOUBLE as type 101, and
+     * TIMESTAMP WITH TIME ZONE as type 101 (ojdbc8) or 2013 (ojdbc11). */
+    private static final List<FragmentRule> UNKNOWN_CODE_FRAGMENT_RULES = Arrays.asList(
+            new FragmentRule(ColumnRule.DOUBLE, "BINARY_DOUBLE"),
+            new FragmentRule(ColumnRule.TIMESTAMP_WITH_TIMEZONE, "TIMESTAMP", "TIME ZONE"),
+            new FragmentRule(ColumnRule.TIMESTAMP, "TIMESTAMP"));
+
+    /* ARRAY element types keyed by the exact normalized type name.
+     * PostgreSQL: _int4, _int8, _float4, _float8, _varchar, _text, _bool
+     * Generic:    INT[], VARCHAR[], TIMESTAMP[], etc. */
+    private static final Map<String, Integer> ELEMENT_NAME_RULES = new HashMap<>();
+
+    /* ARRAY element types matched by type name fragment, first match wins.
+     * HSQLDB: INTEGER ARRAY, VARCHAR ARRAY, etc. */
+    private static final Map<String, Integer> ELEMENT_FRAGMENT_RULES = new LinkedHashMap<>();
+
+    private static final Map<String, ExplicitTypeMapper> DRIVER_MAPPERS = new ConcurrentHashMap<>();
+
+    static {
+        for (JDBCType jdbcType : JDBCType.values()) {
+            KNOWN_TYPE_CODES.add(jdbcType.getVendorTypeNumber());
+        }
+
+        CODE_RULES.put(Types.DECIMAL, ColumnRule.DECIMAL);
+        CODE_RULES.put(Types.NUMERIC, ColumnRule.DECIMAL);
+        CODE_RULES.put(Types.INTEGER, ColumnRule.DECIMAL_IF_NAMED);
+        /* SQLXML is not natively supported by the Arrow JDBC adapter.
+         * Map to VARCHAR so it is read as a string via getString(). */
+        CODE_RULES.put(Types.SQLXML, ColumnRule.VARCHAR);
+
+        /* TIMESTAMPTZ columns reported as Types.TIMESTAMP (e.g., PostgreSQL) */
+        NAME_RULES.put(cacheKey(Types.TIMESTAMP, "TIMESTAMPTZ"), ColumnRule.TIMESTAMP_WITH_TIMEZONE);
+        /* TIME columns misreported as VARCHAR (e.g., SQLite JDBC) */
+        NAME_RULES.put(cacheKey(Types.VARCHAR, "TIME"), ColumnRule.TIME);
+
+        for (String name : new String[]{"_INT4", "_INT", "INT[]", "INT ARRAY"}) {
+            ELEMENT_NAME_RULES.put(name, Types.INTEGER);
+        }
+        for (String name : new String[]{"_INT8", "BIGINT[]", "BIGINT ARRAY"}) {
+            ELEMENT_NAME_RULES.put(name, Types.BIGINT);
+        }
+        for (String name : new String[]{"_FLOAT4", "REAL[]", "FLOAT[]"}) {
+            ELEMENT_NAME_RULES.put(name, Types.REAL);
+        }
+        for (String name : new String[]{"_FLOAT8", "DOUBLE[]"}) {
+            ELEMENT_NAME_RULES.put(name, Types.DOUBLE);
+        }
+        for (String name : new String[]{"_BOOL", "BOOLEAN[]"}) {
+            ELEMENT_NAME_RULES.put(name, Types.BOOLEAN);
+        }
+        for (String name : new String[]{"_VARCHAR", "_TEXT"}) {
+            ELEMENT_NAME_RULES.put(name, Types.VARCHAR);
+        }
+        for (String name : new String[]{"DECIMAL[]", "NUMERIC[]"}) {
+            ELEMENT_NAME_RULES.put(name, Types.DECIMAL);
+        }
+        ELEMENT_NAME_RULES.put("DATE[]", Types.DATE);
+        ELEMENT_NAME_RULES.put("TIMESTAMPTZ[]", Types.TIMESTAMP_WITH_TIMEZONE);
+        ELEMENT_NAME_RULES.put("TIMESTAMP[]", Types.TIMESTAMP);
+
+        ELEMENT_FRAGMENT_RULES.put("INTEGER ARRAY", Types.INTEGER);
+        ELEMENT_FRAGMENT_RULES.put("BIGINT ARRAY", Types.BIGINT);
+        ELEMENT_FRAGMENT_RULES.put("REAL ARRAY", Types.REAL);
+        ELEMENT_FRAGMENT_RULES.put("DOUBLE PRECISION ARRAY", Types.DOUBLE);
+        ELEMENT_FRAGMENT_RULES.put("DOUBLE ARRAY", Types.DOUBLE);
+        ELEMENT_FRAGMENT_RULES.put("BOOLEAN ARRAY", Types.BOOLEAN);
+        ELEMENT_FRAGMENT_RULES.put("CHARACTER VARYING ARRAY", Types.VARCHAR);
+        ELEMENT_FRAGMENT_RULES.put("VARCHAR ARRAY", Types.VARCHAR);
+        ELEMENT_FRAGMENT_RULES.put("VARCHAR[]", Types.VARCHAR);
+        ELEMENT_FRAGMENT_RULES.put("TEXT ARRAY", Types.VARCHAR);
+        ELEMENT_FRAGMENT_RULES.put("TEXT[]", Types.VARCHAR);
+        ELEMENT_FRAGMENT_RULES.put("DECIMAL ARRAY", Types.DECIMAL);
+        ELEMENT_FRAGMENT_RULES.put("NUMERIC ARRAY", Types.DECIMAL);
+        ELEMENT_FRAGMENT_RULES.put("DATE ARRAY", Types.DATE);
+        ELEMENT_FRAGMENT_RULES.put("TIMESTAMP WITH TIME ZONE ARRAY", Types.TIMESTAMP_WITH_TIMEZONE);
+        ELEMENT_FRAGMENT_RULES.put("TIMESTAMP WITHOUT TIME ZONE ARRAY", Types.TIMESTAMP);
+        ELEMENT_FRAGMENT_RULES.put("TIMESTAMP ARRAY", Types.TIMESTAMP);
+    }
+
     private int defaultDecimalPrecision = 38;
     private int defaultDecimalScale = 17;
+    private final DriverProfile profile;
+
+    /* Resolved rules keyed by "<type code>:<raw type name>"; shared across queries
+     * when the mapper comes from forDriver(). */
+    private final Map<String, ColumnRule> columnRuleCache = new ConcurrentHashMap<>();
+    private final Map<String, JdbcFieldInfo> elementTypeCache = new ConcurrentHashMap<>();
+    private final Set<String> unknownElementTypeNames = ConcurrentHashMap.newKeySet();
 
     public ExplicitTypeMapper() {
+        this.profile = null;
+    }
+
+    public ExplicitTypeMapper(DriverProfile profile) {
+        this.profile = profile;
     }
 
     public ExplicitTypeMapper(int defaultDecimalPrecision, int defaultDecimalScale) {
+        this.profile = null;
         this.defaultDecimalScale = defaultDecimalScale;
         this.defaultDecimalPrecision = defaultDecimalPrecision;
     }
 
 
-    static Map<Integer, List<Integer>> parseMetaData(ResultSet resultSet) throws SQLException {
-        ResultSetMetaData metaData = resultSet.getMetaData();
-        List<String[]> tabularMetaData = new ArrayList<>();
-        Map<Integer, List<Integer>> parsedMetaData = new HashMap<>();
+    /**
+     * Return the shared mapper for a JDBC driver. The driver is identified by the
+     * implementation class of its result sets, which needs no JDBC round trip.
+     * Shared mappers keep their resolved type rules across queries, so the type
+     * name matching only runs once per distinct (type code, type name) per driver.
+     */
+    public static ExplicitTypeMapper forDriver(ResultSet resultSet) {
+        return forDriver(resultSet.getClass().getName());
+    }
+
+    public static ExplicitTypeMapper forDriver(String driverKey) {
+        return DRIVER_MAPPERS.computeIfAbsent(driverKey, key -> new ExplicitTypeMapper());
+    }
+
+    static void logMetaData(ColumnMetaData metaData) {
+        if (!logger.isLoggable(Level.FINE)) {
+            return;
+        }
 
         String[] headers = {
                 "columnName",
@@ -34,38 +213,70 @@ public class ExplicitTypeMapper {
                 "columnNullable",
         };
 
+        String[][] tabularMetaData = new String[metaData.getColumnCount()][];
         for (int columnIndex = 1; columnIndex <= metaData.getColumnCount(); columnIndex++) {
             int columnType = metaData.getColumnType(columnIndex);
-            String columnName = metaData.getColumnName(columnIndex);
             String columnTypeName = metaData.getColumnTypeName(columnIndex);
-            String inferredColumnTypeName;
-            try {
-                inferredColumnTypeName = JDBCType.valueOf(columnType).getName();
-            } catch (IllegalArgumentException e) {
-                inferredColumnTypeName = columnTypeName;
-            }
-            int columnNullable = metaData.isNullable(columnIndex);
-
-            String[] columnMetaData = {
-                    columnName,
+            String inferredColumnTypeName = KNOWN_TYPE_CODES.contains(columnType)
+                    ? JDBCType.valueOf(columnType).getName()
+                    : columnTypeName;
+            tabularMetaData[columnIndex - 1] = new String[]{
+                    metaData.getColumnName(columnIndex),
                     columnTypeName,
                     inferredColumnTypeName,
-                    ((Integer) columnNullable).toString(),
+                    Integer.toString(metaData.isNullable(columnIndex)),
             };
-            tabularMetaData.add(columnMetaData);
+        }
+
+        logger.fine("\n" + FlipTable.of(headers, tabularMetaData));
+    }
 
-            List<Integer> columnsWithSameType = parsedMetaData.getOrDefault(columnType, new ArrayList<Integer>());
-            columnsWithSameType.add(columnIndex);
-            parsedMetaData.put(columnType, columnsWithSameType);
+    private static String normalizeTypeName(String columnTypeName) {
+        return columnTypeName == null ? "" : columnTypeName.trim().toUpperCase(Locale.ROOT);
+    }
+
+    private static String cacheKey(int columnType, String columnTypeName) {
+        return columnType + ":" + columnTypeName;
+    }
+
+    /**
+     * Resolve the rule for a (type code, type name) pair. Exact rules are checked
+     * before fragment rules; the first matching fragment rule wins.
+     */
+    static ColumnRule resolveColumnRule(int columnType, String columnTypeName) {
+        String normalizedTypeName = normalizeTypeName(columnTypeName);
+
+        ColumnRule rule = NAME_RULES.get(cacheKey(columnType, normalizedTypeName));
+        if (rule != null) {
+            return rule;
+        }
+        rule = CODE_RULES.get(columnType);
+        if (rule != null) {
+            return rule;
         }
 
-        String[][] columnMetaDataArray = new String[tabularMetaData.size()][];
-        logger.fine("\n" + FlipTable.of(
-                headers,
-                tabularMetaData.toArray(columnMetaDataArray)
-        ));
+        List<FragmentRule> fragmentRules;
+        if (columnType == Types.OTHER) {
+            fragmentRules = OTHER_FRAGMENT_RULES;
+        }
+        else if (!KNOWN_TYPE_CODES.contains(columnType)) {
+            fragmentRules = UNKNOWN_CODE_FRAGMENT_RULES;
+        }
+        else {
+            return ColumnRule.NONE;
+        }
+        for (FragmentRule fragmentRule : fragmentRules) {
+            if (fragmentRule.matches(normalizedTypeName)) {
+                return fragmentRule.rule;
+            }
+        }
+        return ColumnRule.NONE;
+    }
 
-        return parsedMetaData;
+    private ColumnRule getColumnRule(int columnType, String columnTypeName) {
+        return columnRuleCache.computeIfAbsent(
+                cacheKey(columnType, columnTypeName),
+                key -> resolveColumnRule(columnType, columnTypeName));
     }
 
     private JdbcFieldInfo createDefaultDecimalFieldInfo(int precision, int scale) {
@@ -85,128 +296,116 @@ public class ExplicitTypeMapper {
         }
     }
 
+    /**
+     * Decimal columns read as native types when the decimal mode allows it:
+     * int64 when every value is integral and fits in a long, float64 when the
+     * caller trades exactness for speed.
+     */
+    private JdbcFieldInfo createDecimalFieldInfo(int precision, int scale, ConversionOptions.DecimalMode decimalMode) {
+        switch (decimalMode) {
+            case FLOAT64:
+                return ColumnRule.DOUBLE.fieldInfo;
+            case INT_WHEN_SCALE0:
+                if (scale == 0 && precision >= 1 && precision <= MAX_INT64_DECIMAL_PRECISION) {
+                    return BIGINT_FIELD_INFO;
+                }
+                // fall through
+            default:
+                return createDefaultDecimalFieldInfo(precision, scale);
+        }
+    }
+
     public Map<Integer, JdbcFieldInfo> createExplicitTypeMapping(ResultSet resultSet) throws SQLException {
-        Map<Integer, List<Integer>> parsedMetaData = parseMetaData(resultSet);
+        return createExplicitTypeMapping(ColumnMetaData.of(resultSet));
+    }
 
-        Map<Integer, JdbcFieldInfo> explicitMapping = new HashMap<>();
+    /**
+     * Build the per-column explicit type overrides in a single pass over the
+     * metadata snapshot. Columns without an override keep the default Arrow
+     * JDBC mapping.
+     */
+    public Map<Integer, JdbcFieldInfo> createExplicitTypeMapping(ColumnMetaData metaData) {
+        return createExplicitTypeMapping(metaData, ConversionOptions.DEFAULT);
+    }
 
-        /* correctly marked as Decimal */
-        List<Integer> decimalColumnIndices = parsedMetaData.getOrDefault(Types.DECIMAL, new ArrayList<>());
-        decimalColumnIndices.addAll(parsedMetaData.getOrDefault(Types.NUMERIC, new ArrayList<>()));
+    public Map<Integer, JdbcFieldInfo> createExplicitTypeMapping(ColumnMetaData metaData, ConversionOptions options) {
+        logMetaData(metaData);
+        boolean logFine = logger.isLoggable(Level.FINE);
 
-        /* inferred as Decimal */
-        for (int columnIndex: parsedMetaData.getOrDefault(Types.INTEGER, new ArrayList<>())) {
-            if (resultSet.getMetaData().getColumnName(columnIndex).contains("DECIMAL")) {
-                logger.fine(String.format("Inferred column %1s (%2s) as a Decimal", columnIndex, resultSet.getMetaData().getColumnName(columnIndex)));
-                decimalColumnIndices.add(columnIndex);
-            }
-        }
+        Map<Integer, JdbcFieldInfo> explicitMapping = new HashMap<>();
 
-        /* Detect columns whose JDBC type code is not recognized by the standard
-         * JDBCType enum. Use column type NAME matching instead of hardcoded type
-         * codes so this works driver-agnostically.
-         * Known cases: Oracle reports BINARY_DOUBLE as type 101, and
-         * TIMESTAMP WITH TIME ZONE as type 101 (ojdbc8) or 2013 (ojdbc11). */
-        for (int columnIndex = 1; columnIndex <= resultSet.getMetaData().getColumnCount(); columnIndex++) {
-            int columnType = resultSet.getMetaData().getColumnType(columnIndex);
-            String columnTypeName = resultSet.getMetaData().getColumnTypeName(columnIndex);
-            try {
-                JDBCType.valueOf(columnType);
-            } catch (IllegalArgumentException e) {
-                String upperTypeName = columnTypeName.toUpperCase();
-                if (upperTypeName.contains("BINARY_DOUBLE")) {
-                    explicitMapping.put(columnIndex, new JdbcFieldInfo(Types.DOUBLE));
-                    logger.fine(String.format(
-                            "Detected column %1s (%2s) as DOUBLE from type name '%3s' (JDBC type %4$s)",
-                            columnIndex, resultSet.getMetaData().getColumnName(columnIndex),
-                            columnTypeName, columnType));
-                } else if (upperTypeName.contains("TIMESTAMP") && upperTypeName.contains("TIME ZONE")) {
-                    explicitMapping.put(columnIndex, new JdbcFieldInfo(Types.TIMESTAMP_WITH_TIMEZONE));
-                    logger.fine(String.format(
-                            "Detected column %1s (%2s) as TIMESTAMP_WITH_TIMEZONE from type name '%3s' (JDBC type %4$s)",
-                            columnIndex, resultSet.getMetaData().getColumnName(columnIndex),
-                            columnTypeName, columnType));
-                } else if (upperTypeName.contains("TIMESTAMP")) {
-                    explicitMapping.put(columnIndex, new JdbcFieldInfo(Types.TIMESTAMP));
-                    logger.fine(String.format(
-                            "Detected column %1s (%2s) as TIMESTAMP from type name '%3s' (JDBC type %4$s)",
-                            columnIndex, resultSet.getMetaData().getColumnName(columnIndex),
-                            columnTypeName, columnType));
-                }
+        for (int columnIndex = 1; columnIndex <= metaData.getColumnCount(); columnIndex++) {
+            JdbcFieldInfo fieldInfo = resolveFieldInfo(metaData, columnIndex, options.getDecimalMode());
+            if (fieldInfo == null) {
+                continue;
             }
-        }
-
-        /* Detect TIMESTAMPTZ columns (e.g., PostgreSQL reports them as Types.TIMESTAMP) */
-        List<Integer> timestamptzColumnIndices = new ArrayList<>();
-        for (int columnIndex = 1; columnIndex <= resultSet.getMetaData().getColumnCount(); columnIndex++) {
-            int columnType = resultSet.getMetaData().getColumnType(columnIndex);
-            String columnTypeName = resultSet.getMetaData().getColumnTypeName(columnIndex);
-            if (columnType == Types.TIMESTAMP && "timestamptz".equalsIgnoreCase(columnTypeName)) {
-                timestamptzColumnIndices.add(columnIndex);
-                logger.fine(String.format("Detected column %1s (%2s) as TIMESTAMPTZ, overriding to TIMESTAMP_WITH_TIMEZONE",
-                        columnIndex, resultSet.getMetaData().getColumnName(columnIndex)));
+            explicitMapping.put(columnIndex, fieldInfo);
+
+            if (logFine) {
+                logger.fine(String.format(
+                        "Mapped column %d (%s) with type name '%s' (JDBC type %d) to %s (precision %d, scale %d)",
+                        columnIndex, metaData.getColumnName(columnIndex),
+                        metaData.getColumnTypeName(columnIndex), metaData.getColumnType(columnIndex),
+                        JDBCType.valueOf(fieldInfo.getJdbcType()).getName(),
+                        fieldInfo.getPrecision(), fieldInfo.getScale()));
             }
         }
-        for (int columnIndex : timestamptzColumnIndices) {
-            explicitMapping.put(columnIndex, new JdbcFieldInfo(Types.TIMESTAMP_WITH_TIMEZONE));
-        }
 
-        /* Detect TIME columns misreported as VARCHAR (e.g., SQLite JDBC) */
-        for (int columnIndex = 1; columnIndex <= resultSet.getMetaData().getColumnCount(); columnIndex++) {
-            int columnType = resultSet.getMetaData().getColumnType(columnIndex);
-            String columnTypeName = resultSet.getMetaData().getColumnTypeName(columnIndex);
-            if (columnType == Types.VARCHAR && "TIME".equalsIgnoreCase(columnTypeName)) {
-                explicitMapping.put(columnIndex, new JdbcFieldInfo(Types.TIME));
-                logger.fine(String.format("Detected column %1s (%2s) as TIME (was reported as VARCHAR)",
-                        columnIndex, resultSet.getMetaData().getColumnName(columnIndex)));
-            }
-        }
+        return explicitMapping;
+    }
 
-        /* Detect JSON/JSONB/UUID columns reported as Types.OTHER (e.g., PostgreSQL).
-         * Map to VARCHAR so they are read as strings via the default Arrow path. */
-        for (int columnIndex = 1; columnIndex <= resultSet.getMetaData().getColumnCount(); columnIndex++) {
-            int columnType = resultSet.getMetaData().getColumnType(columnIndex);
-            String columnTypeName = resultSet.getMetaData().getColumnTypeName(columnIndex);
-            if (columnType == Types.OTHER) {
-                String upperTypeName = columnTypeName.toUpperCase();
-                if (upperTypeName.contains("JSON") || upperTypeName.contains("UUID")
-                        || upperTypeName.contains("XML")) {
-                    explicitMapping.put(columnIndex, new JdbcFieldInfo(Types.VARCHAR));
-                    logger.fine(String.format(
-                            "Detected column %1s (%2s) as VARCHAR from type name '%3s' (JDBC type OTHER)",
-                            columnIndex, resultSet.getMetaData().getColumnName(columnIndex),
-                            columnTypeName));
+    private JdbcFieldInfo resolveFieldInfo(ColumnMetaData metaData, int columnIndex, ConversionOptions.DecimalMode decimalMode) {
+        int columnType = metaData.getColumnType(columnIndex);
+        String columnTypeName = metaData.getColumnTypeName(columnIndex);
+
+        /* driver profile overrides take precedence over the built-in rules */
+        if (profile != null) {
+            Integer overriddenType = profile.findTypeOverride(
+                    columnTypeName, metaData.getPrecision(columnIndex), metaData.getScale(columnIndex));
+            if (overriddenType != null) {
+                if (overriddenType == Types.DECIMAL || overriddenType == Types.NUMERIC) {
+                    return createDefaultDecimalFieldInfo(
+                            metaData.getPrecision(columnIndex), metaData.getScale(columnIndex));
                 }
+                return new JdbcFieldInfo(overriddenType);
             }
         }
 
-        /* Detect SQLXML columns - not natively supported by Arrow JDBC adapter.
-         * Map to VARCHAR so they are read as strings via getString(). */
-        List<Integer> xmlColumnIndices = parsedMetaData.getOrDefault(Types.SQLXML, new ArrayList<>());
-        for (int columnIndex : xmlColumnIndices) {
-            explicitMapping.put(columnIndex, new JdbcFieldInfo(Types.VARCHAR));
-            logger.fine(String.format(
-                    "Column %1s (%2s) is SQLXML type, mapping to VARCHAR for string retrieval.",
-                    columnIndex, resultSet.getMetaData().getColumnName(columnIndex)));
-        }
-
-        /* ARRAY columns are now read natively via the C Data Interface.
-         * Element type mapping is handled by createArraySubTypeMapping(). */
-
-        for (int columnIndex: decimalColumnIndices) {
-            int precision = resultSet.getMetaData().getPrecision(columnIndex);
-            int scale = resultSet.getMetaData().getScale(columnIndex);
-            String columnName = resultSet.getMetaData().getColumnName(columnIndex);
-            JdbcFieldInfo decimalFieldInfo = createDefaultDecimalFieldInfo(precision, scale);
-            explicitMapping.put(columnIndex, decimalFieldInfo);
-            logger.fine(String.format("Detected column %1s (%2s) as a Decimal: (%3s, %4s) -> (%5s, %6s)",
-                    columnIndex, columnName, precision, scale,
-                    decimalFieldInfo.getPrecision(), decimalFieldInfo.getScale()
-                    )
-            );
+        ColumnRule rule = getColumnRule(columnType, columnTypeName);
+        switch (rule) {
+            case NONE:
+                return null;
+            case DECIMAL_IF_NAMED:
+                /* inferred as Decimal */
+                if (!metaData.getColumnName(columnIndex).contains("DECIMAL")) {
+                    return null;
+                }
+                // fall through
+            case DECIMAL:
+                return createDecimalFieldInfo(
+                        metaData.getPrecision(columnIndex), metaData.getScale(columnIndex), decimalMode);
+            default:
+                return rule.fieldInfo;
         }
+    }
 
-        return explicitMapping;
+    /**
+     * Build the per-column Arrow field metadata. The values are the ones reported
+     * by the driver (before any explicit type override), matching what
+     * {@code Cursor.description} exposes.
+     */
+    public Map<Integer, Map<String, String>> createColumnMetadata(ColumnMetaData metaData) {
+        Map<Integer, Map<String, String>> columnMetadata = new HashMap<>();
+        for (int columnIndex = 1; columnIndex <= metaData.getColumnCount(); columnIndex++) {
+            Map<String, String> fieldMetadata = new HashMap<>();
+            fieldMetadata.put(JDBC_TYPE_KEY, Integer.toString(metaData.getColumnType(columnIndex)));
+            fieldMetadata.put(JDBC_DISPLAY_SIZE_KEY, Integer.toString(metaData.getColumnDisplaySize(columnIndex)));
+            fieldMetadata.put(JDBC_PRECISION_KEY, Integer.toString(metaData.getPrecision(columnIndex)));
+            fieldMetadata.put(JDBC_SCALE_KEY, Integer.toString(metaData.getScale(columnIndex)));
+            fieldMetadata.put(JDBC_NULLABLE_KEY, Integer.toString(metaData.isNullable(columnIndex)));
+            columnMetadata.put(columnIndex, fieldMetadata);
+        }
+        return columnMetadata;
     }
 
     /**
@@ -216,8 +415,22 @@ public class ExplicitTypeMapper {
      * builder consumes these via a dedicated setter.
      */
     public Map<Integer, JdbcFieldInfo> createArraySubTypeMapping(ResultSet resultSet) throws SQLException {
+        return createArraySubTypeMapping(ColumnMetaData.of(resultSet));
+    }
+
+    public Map<Integer, JdbcFieldInfo> createArraySubTypeMapping(ColumnMetaData metaData) {
+        return createArraySubTypeMapping(metaData, Collections.emptyMap());
+    }
+
+    /**
+     * Build the element type of each ARRAY column. 'baseTypes' holds element
+     * types reported by Array.getBaseType() for the current query, keyed by
+     * column index (see {@link #findUnresolvedArrayColumns(ColumnMetaData)});
+     * they take effect for columns whose type name does not name the element
+     * type. Columns resolved by neither fall back to VARCHAR elements.
+     */
+    public Map<Integer, JdbcFieldInfo> createArraySubTypeMapping(ColumnMetaData metaData, Map<Integer, Integer> baseTypes) {
         Map<Integer, JdbcFieldInfo> arraySubTypes = new HashMap<>();
-        ResultSetMetaData metaData = resultSet.getMetaData();
 
         for (int columnIndex = 1; columnIndex <= metaData.getColumnCount(); columnIndex++) {
             if (metaData.getColumnType(columnIndex) != Types.ARRAY) {
@@ -225,17 +438,47 @@ public class ExplicitTypeMapper {
             }
 
             String typeName = metaData.getColumnTypeName(columnIndex);
-            JdbcFieldInfo elementFieldInfo = inferElementJdbcType(typeName);
+            JdbcFieldInfo elementFieldInfo = lookupElementJdbcType(typeName);
+            String source = "type name";
+            if (elementFieldInfo == null) {
+                Integer baseType = baseTypes.get(columnIndex);
+                if (baseType != null && isSupportedElementType(baseType)) {
+                    elementFieldInfo = new JdbcFieldInfo(baseType);
+                    source = "Array.getBaseType()";
+                }
+                else {
+                    elementFieldInfo = fallbackElementJdbcType(typeName, baseType);
+                    source = "fallback";
+                }
+            }
             arraySubTypes.put(columnIndex, elementFieldInfo);
 
-            logger.fine(String.format(
-                    "ARRAY column %d (%s) element type inferred as %s from type name '%s'",
-                    columnIndex, metaData.getColumnName(columnIndex),
-                    JDBCType.valueOf(elementFieldInfo.getJdbcType()).getName(), typeName));
+            if (logger.isLoggable(Level.FINE)) {
+                logger.fine(String.format(
+                        "ARRAY column %d (%s) element type inferred as %s from %s, type name '%s'",
+                        columnIndex, metaData.getColumnName(columnIndex),
+                        JDBCType.valueOf(elementFieldInfo.getJdbcType()).getName(), source, typeName));
+            }
         }
         return arraySubTypes;
     }
 
+    /**
+     * Return the ARRAY columns whose element type can not be told from the type
+     * name. Their element type is read from Array.getBaseType() on the first row
+     * before conversion starts (see JDBCUtils.convertResultSetToIterator).
+     */
+    public List<Integer> findUnresolvedArrayColumns(ColumnMetaData metaData) {
+        List<Integer> columns = new ArrayList<>();
+        for (int columnIndex = 1; columnIndex <= metaData.getColumnCount(); columnIndex++) {
+            if (metaData.getColumnType(columnIndex) == Types.ARRAY
+                    && lookupElementJdbcType(metaData.getColumnTypeName(columnIndex)) == null) {
+                columns.add(columnIndex);
+            }
+        }
+        return columns;
+    }
+
     /**
      * Infer the JDBC element type of a SQL ARRAY column from its type name.
      * SQL ARRAYs are homogeneous, so one element type describes the whole column.
@@ -243,58 +486,60 @@ public class ExplicitTypeMapper {
      * for any JDBC type, so elements come through as strings.
      */
     /*package*/ JdbcFieldInfo inferElementJdbcType(String columnTypeName) {
-        String upper = columnTypeName.toUpperCase().trim();
-
-        // PostgreSQL: _int4, _int8, _float4, _float8, _varchar, _text, _bool
-        // HSQLDB:     INTEGER ARRAY, VARCHAR ARRAY, etc.
-        // Generic:    INT[], VARCHAR[], TIMESTAMP[], etc.
+        JdbcFieldInfo elementFieldInfo = lookupElementJdbcType(columnTypeName);
+        return elementFieldInfo != null ? elementFieldInfo : fallbackElementJdbcType(columnTypeName, null);
+    }
 
-        if (upper.equals("_INT4") || upper.equals("_INT") || upper.contains("INTEGER ARRAY")
-                || upper.equals("INT[]") || upper.equals("INT ARRAY")) {
-            return new JdbcFieldInfo(Types.INTEGER);
-        }
-        if (upper.equals("_INT8") || upper.contains("BIGINT ARRAY")
-                || upper.equals("BIGINT[]") || upper.equals("BIGINT ARRAY")) {
-            return new JdbcFieldInfo(Types.BIGINT);
-        }
-        if (upper.equals("_FLOAT4") || upper.contains("REAL ARRAY")
-                || upper.equals("REAL[]") || upper.equals("FLOAT[]")) {
-            return new JdbcFieldInfo(Types.REAL);
-        }
-        if (upper.equals("_FLOAT8") || upper.contains("DOUBLE PRECISION ARRAY")
-                || upper.contains("DOUBLE ARRAY") || upper.equals("DOUBLE[]")) {
-            return new JdbcFieldInfo(Types.DOUBLE);
-        }
-        if (upper.equals("_BOOL") || upper.contains("BOOLEAN ARRAY")
-                || upper.equals("BOOLEAN[]")) {
-            return new JdbcFieldInfo(Types.BOOLEAN);
-        }
-        if (upper.equals("_VARCHAR") || upper.equals("_TEXT")
-                || upper.contains("CHARACTER VARYING ARRAY")
-                || upper.contains("VARCHAR ARRAY") || upper.contains("VARCHAR[]")
-                || upper.contains("TEXT ARRAY") || upper.contains("TEXT[]")) {
-            return new JdbcFieldInfo(Types.VARCHAR);
-        }
-        if (upper.contains("DECIMAL ARRAY") || upper.contains("NUMERIC ARRAY")
-                || upper.equals("DECIMAL[]") || upper.equals("NUMERIC[]")) {
-            return new JdbcFieldInfo(Types.DECIMAL);
+    /** Resolve an element type from the type name alone, or null if the name does not tell. */
+    private JdbcFieldInfo lookupElementJdbcType(String columnTypeName) {
+        String key = String.valueOf(columnTypeName);
+        JdbcFieldInfo cached = elementTypeCache.get(key);
+        if (cached != null || unknownElementTypeNames.contains(key)) {
+            return cached;
         }
-        if (upper.contains("DATE ARRAY") || upper.equals("DATE[]")) {
-            return new JdbcFieldInfo(Types.DATE);
+
+        String upper = normalizeTypeName(columnTypeName);
+        Integer elementType = ELEMENT_NAME_RULES.get(upper);
+        if (elementType == null) {
+            for (Map.Entry<String, Integer> fragmentRule : ELEMENT_FRAGMENT_RULES.entrySet()) {
+                if (upper.contains(fragmentRule.getKey())) {
+                    elementType = fragmentRule.getValue();
+                    break;
+                }
+            }
         }
-        if (upper.contains("TIMESTAMP WITH TIME ZONE ARRAY")
-                || upper.equals("TIMESTAMPTZ[]")) {
-            return new JdbcFieldInfo(Types.TIMESTAMP_WITH_TIMEZONE);
+        if (elementType == null) {
+            unknownElementTypeNames.add(key);
+            return null;
         }
-        if (upper.contains("TIMESTAMP ARRAY") || upper.equals("TIMESTAMP[]")
-                || upper.contains("TIMESTAMP WITHOUT TIME ZONE ARRAY")) {
-            return new JdbcFieldInfo(Types.TIMESTAMP);
+        final int resolvedType = elementType;
+        return elementTypeCache.computeIfAbsent(key, k -> new JdbcFieldInfo(resolvedType));
+    }
+
+    /**
+     * Nested arrays and structured types have no single-level Arrow mapping in
+     * arrow-jdbc, so such elements are read as strings like unknown types.
+     */
+    private static boolean isSupportedElementType(int jdbcType) {
+        switch (jdbcType) {
+            case Types.ARRAY:
+            case Types.STRUCT:
+            case Types.REF:
+            case Types.DISTINCT:
+            case Types.JAVA_OBJECT:
+            case Types.OTHER:
+            case Types.NULL:
+                return false;
+            default:
+                return true;
         }
+    }
 
+    private static JdbcFieldInfo fallbackElementJdbcType(String columnTypeName, Integer baseType) {
         logger.warning(String.format(
-                "Unknown ARRAY element type name '%s', defaulting to VARCHAR element type. "
+                "Unknown ARRAY element type name '%s'%s, defaulting to VARCHAR element type. "
                 + "Array elements will be returned as strings.",
-                columnTypeName));
+                columnTypeName, baseType != null ? " (base type " + baseType + ")" : ""));
         return new JdbcFieldInfo(Types.VARCHAR);
     }
 
@@ -0,0 +1,38 @@
+package org.jaydebeapiarrow.extension;
+
+/**
+ * Time spent in ArrowVectorIterator.next() for one query, i.e. reading rows
+ * from the JDBC ResultSet and filling the Arrow vectors, measured in Java
+ * with System.nanoTime() (see {@link JDBCUtils#nextBatch}).
+ *
+ * One instance belongs to one cursor's query and is not thread safe.
+ */
+public class FetchStats {
+
+    private long fetchNanos = 0;
+    private long batches = 0;
+    private long rows = 0;
+
+    void recordFetch(long nanos, int rowCount) {
+        fetchNanos += nanos;
+        batches++;
+        rows += rowCount;
+    }
+
+    public long getFetchNanos() {
+        return fetchNanos;
+    }
+
+    public long getBatches() {
+        return batches;
+    }
+
+    public long getRows() {
+        return rows;
+    }
+
+    @Override
+    public String toString() {
+        return "FetchStats(fetchNanos=" + fetchNanos + ", batches=" + batches + ", rows=" + rows + ")";
+    }
+}
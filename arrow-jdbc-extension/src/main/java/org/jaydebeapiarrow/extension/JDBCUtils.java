@@ -18,11 +18,17 @@
 package org.jaydebeapiarrow.extension;
 
 import java.math.RoundingMode;
+import java.sql.Array;
 import java.sql.PreparedStatement;
 import java.sql.ResultSet;
+import java.sql.SQLException;
+import java.sql.Types;
 import java.util.Calendar;
-import java.util.TimeZone;
+import java.util.Collections;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
+import java.util.WeakHashMap;
 import java.util.logging.Logger;
 
 import org.apache.arrow.c.ArrowArray;
@@ -32,8 +38,10 @@ import org.apache.arrow.c.Data;
 import org.apache.arrow.memory.BufferAllocator;
 import org.apache.arrow.vector.ipc.ArrowReader;
 import org.apache.arrow.adapter.jdbc.ArrowVectorIterator;
+import org.apache.arrow.adapter.jdbc.JdbcFieldInfo;
 import org.apache.arrow.adapter.jdbc.JdbcParameterBinder;
 import org.apache.arrow.adapter.jdbc.JdbcToArrow;
+import org.apache.arrow.adapter.jdbc.JdbcToArrowUtils;
 import org.apache.arrow.vector.DateDayVector;
 import org.apache.arrow.vector.DateMilliVector;
 import org.apache.arrow.vector.FieldVector;
@@ -43,6 +51,7 @@ import org.apache.arrow.vector.TimeNanoVector;
 import org.apache.arrow.vector.TimeSecVector;
 import org.apache.arrow.vector.TimeStampVector;
 import org.apache.arrow.vector.VectorSchemaRoot;
+import org.apache.arrow.vector.types.pojo.Schema;
 import org.apache.arrow.adapter.jdbc.JdbcToArrowConfig;
 import org.apache.arrow.adapter.jdbc.JdbcToArrowConfigBuilder;
 import org.apache.arrow.adapter.jdbc.binder.TimeStampBinder;
@@ -50,6 +59,7 @@ import org.apache.arrow.adapter.jdbc.binder.DateDayBinder;
 import org.apache.arrow.adapter.jdbc.binder.DateMilliBinder;
 import org.jaydebeapiarrow.extension.binder.Time32BinderWithCalendar;
 import org.jaydebeapiarrow.extension.binder.Time64BinderWithCalendar;
+import org.jaydebeapiarrow.extension.consumer.LobConsumer;
 import org.jaydebeapiarrow.extension.consumer.OverriddenConsumer;
 
 
@@ -57,7 +67,33 @@ public class JDBCUtils {
 
     private static final Logger logger = Logger.getLogger(JDBCUtils.class.getName());
 
-    private static final Calendar utcCalendar = Calendar.getInstance(TimeZone.getTimeZone("UTC"));
+    /**
+     * ARRAY element types resolved for a result set. The schema export and the
+     * iterator of a query share them, so the first row is peeked and unknown
+     * element types are reported once per result set.
+     */
+    private static final class ArrayTypes {
+        final Map<Integer, JdbcFieldInfo> subTypes;
+        /* next() was called once to read Array.getBaseType() */
+        final boolean peeked;
+        final boolean hasFirstRow;
+
+        ArrayTypes(Map<Integer, JdbcFieldInfo> subTypes, boolean peeked, boolean hasFirstRow) {
+            this.subTypes = subTypes;
+            this.peeked = peeked;
+            this.hasFirstRow = hasFirstRow;
+        }
+
+        /* The same types once an iterator has replayed the peeked row. */
+        ArrayTypes replayed() {
+            return new ArrayTypes(subTypes, false, false);
+        }
+    }
+
+    private static final ArrayTypes NO_ARRAY_TYPES = new ArrayTypes(Collections.emptyMap(), false, false);
+
+    /* Keyed by result set; entries go away with their result set. */
+    private static final Map<ResultSet, ArrayTypes> ARRAY_TYPES = Collections.synchronizedMap(new WeakHashMap<>());
 
     public JDBCUtils() {}
 
@@ -74,11 +110,42 @@ public class JDBCUtils {
         return new long[]{arrowArray.memoryAddress(), arrowSchema.memoryAddress()};
     }
 
+    /**
+     * Like {@link #exportNextBatch(VectorSchemaRoot)}, dictionary-encoding the
+     * columns selected in 'options' first. The export retains the buffers of the
+     * encoded vectors, so they are released here once the batch is exported.
+     */
+    public static long[] exportNextBatch(VectorSchemaRoot root, ConversionOptions options) throws Exception {
+        if (options == null || !options.hasDictionaryEncodeColumns()) {
+            return exportNextBatch(root);
+        }
+        BufferAllocator allocator = AllocatorSingleton.getChildAllocator();
+        try (DictionaryBatchEncoder.EncodedBatch encoded = DictionaryBatchEncoder.encode(root, options.getDictionaryEncodeColumns())) {
+            ArrowArray arrowArray = ArrowArray.allocateNew(allocator);
+            ArrowSchema arrowSchema = ArrowSchema.allocateNew(allocator);
+            Data.exportVectorSchemaRoot(allocator, encoded.getRoot(), encoded.getProvider(), arrowArray, arrowSchema);
+            return new long[]{arrowArray.memoryAddress(), arrowSchema.memoryAddress()};
+        }
+    }
+
+    /**
+     * Return the next batch of 'iterator', adding the time spent reading and
+     * converting it to 'stats'.
+     */
+    public static VectorSchemaRoot nextBatch(ArrowVectorIterator iterator, FetchStats stats) {
+        long start = System.nanoTime();
+        VectorSchemaRoot root = iterator.next();
+        stats.recordFetch(System.nanoTime() - start, root.getRowCount());
+        return root;
+    }
+
     public static void prepareStatementFromStream(long cStreamPointer, PreparedStatement statement, boolean isBatch) throws Exception {
         try (final ArrowArrayStream stream = ArrowArrayStream.wrap(cStreamPointer);
             BufferAllocator allocator = AllocatorSingleton.getChildAllocator();
             final ArrowReader input = Data.importArrayStream(allocator, stream)) {
             VectorSchemaRoot root = input.getVectorSchemaRoot();
+            // Binders of one statement share a Calendar; it is not shared across statements.
+            Calendar utcCalendar = TimeUtils.newUtcCalendar();
             
             // Setup
             JdbcParameterBinder.Builder builder = JdbcParameterBinder.builder(statement, root);
@@ -150,24 +217,162 @@ public class JDBCUtils {
         }
     }
 
+    /**
+     * Read the metadata of a result set once. The snapshot is shared by the
+     * Python-side DB-API description and the Arrow type mapping, so the
+     * per-column JDBC metadata getters are only called once per query.
+     */
+    public static ColumnMetaData readColumnMetaData(ResultSet resultSet) throws SQLException {
+        return ColumnMetaData.of(resultSet);
+    }
+
     public static ArrowVectorIterator convertResultSetToIterator(ResultSet resultSet, int batchSize) throws Exception {
+        return convertResultSetToIterator(resultSet, batchSize, ColumnMetaData.of(resultSet));
+    }
+
+    public static ArrowVectorIterator convertResultSetToIterator(ResultSet resultSet, int batchSize, ColumnMetaData metaData) throws Exception {
+        return convertResultSetToIterator(resultSet, batchSize, metaData, null);
+    }
+
+    public static ArrowVectorIterator convertResultSetToIterator(ResultSet resultSet, int batchSize, ColumnMetaData metaData, DriverProfile profile) throws Exception {
+        return convertResultSetToIterator(resultSet, batchSize, metaData, profile, null);
+    }
+
+    public static ArrowVectorIterator convertResultSetToIterator(ResultSet resultSet, int batchSize, ColumnMetaData metaData, DriverProfile profile, ConversionOptions options) throws Exception {
+        ArrayTypes arrayTypes = resolveArrayTypes(resultSet, metaData, getTypeMapper(resultSet, profile), true);
+        BufferAllocator allocator = AllocatorSingleton.getChildAllocator();
+        JdbcToArrowConfig arrow_jdbc_config = createArrowConfig(allocator, batchSize, resultSet, metaData, profile, options,
+                arrayTypes.subTypes, options != null && options.hasColumnMetadata());
+        ResultSet source = arrayTypes.peeked ? PeekedResultSet.wrap(resultSet, arrayTypes.hasFirstRow) : resultSet;
+        return JdbcToArrow.sqlToArrowVectorIterator(source, arrow_jdbc_config);
+    }
+
+    /**
+     * Return the ARRAY element types of 'resultSet', resolving them on the first
+     * call for the result set. Element types the type names do not tell are read
+     * with Array.getBaseType() from the first row, which is peeked for that and
+     * replayed by the first iterator only: 'forIterator' hands the peeked row
+     * out, and iterators created later (e.g. after the result set was
+     * exhausted) read the result set as it is. The resolution holds for this
+     * query only: some drivers report the same type name (e.g. "ARRAY")
+     * whatever the element type.
+     */
+    private static ArrayTypes resolveArrayTypes(ResultSet resultSet, ColumnMetaData metaData, ExplicitTypeMapper typeMapper,
+                                                boolean forIterator) throws SQLException {
+        if (!hasArrayColumns(metaData)) {
+            return NO_ARRAY_TYPES;
+        }
+        synchronized (ARRAY_TYPES) {
+            ArrayTypes arrayTypes = ARRAY_TYPES.get(resultSet);
+            if (arrayTypes == null) {
+                List<Integer> unresolvedArrays = typeMapper.findUnresolvedArrayColumns(metaData);
+                boolean peeked = !unresolvedArrays.isEmpty();
+                boolean hasFirstRow = peeked && resultSet.next();
+                Map<Integer, Integer> baseTypes = hasFirstRow ? readArrayBaseTypes(resultSet, unresolvedArrays) : Collections.emptyMap();
+                arrayTypes = new ArrayTypes(typeMapper.createArraySubTypeMapping(metaData, baseTypes), peeked, hasFirstRow);
+                ARRAY_TYPES.put(resultSet, arrayTypes);
+            }
+            if (forIterator && arrayTypes.peeked) {
+                ARRAY_TYPES.put(resultSet, arrayTypes.replayed());
+            }
+            return arrayTypes;
+        }
+    }
+
+    private static boolean hasArrayColumns(ColumnMetaData metaData) {
+        for (int type : metaData.types) {
+            if (type == Types.ARRAY) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    /** Read Array.getBaseType() of the current row for each of 'columns' that is not NULL. */
+    private static Map<Integer, Integer> readArrayBaseTypes(ResultSet resultSet, List<Integer> columns) {
+        Map<Integer, Integer> baseTypes = new HashMap<>();
+        for (int columnIndex : columns) {
+            try {
+                Array array = resultSet.getArray(columnIndex);
+                if (array != null) {
+                    baseTypes.put(columnIndex, array.getBaseType());
+                }
+            }
+            catch (SQLException | UnsupportedOperationException e) {
+                logger.fine("Can not read the ARRAY base type of column " + columnIndex + ": " + e.getMessage());
+            }
+        }
+        return baseTypes;
+    }
+
+    public static long exportSchema(ResultSet resultSet) throws Exception {
+        return exportSchema(resultSet, ColumnMetaData.of(resultSet));
+    }
+
+    /**
+     * Export the Arrow schema a result set will be converted to, without reading
+     * any rows. Returns the schemaAddress — Python imports via pa.Schema._import_from_c().
+     * Fields carry the driver-reported JDBC metadata (see ExplicitTypeMapper.createColumnMetadata).
+     * The schema is built from the 'metaData' snapshot, without reading the driver metadata again.
+     * With ARRAY columns whose element type is only known from Array.getBaseType(),
+     * the first row is peeked; the iterator created later replays it.
+     */
+    public static long exportSchema(ResultSet resultSet, ColumnMetaData metaData) throws Exception {
+        return exportSchema(resultSet, metaData, null);
+    }
+
+    public static long exportSchema(ResultSet resultSet, ColumnMetaData metaData, DriverProfile profile) throws Exception {
+        return exportSchema(resultSet, metaData, profile, null);
+    }
+
+    public static long exportSchema(ResultSet resultSet, ColumnMetaData metaData, DriverProfile profile, ConversionOptions options) throws Exception {
+        ArrayTypes arrayTypes = resolveArrayTypes(resultSet, metaData, getTypeMapper(resultSet, profile), false);
         BufferAllocator allocator = AllocatorSingleton.getChildAllocator();
-        ExplicitTypeMapper typeMapper = new ExplicitTypeMapper();
-        OverriddenConsumer overriden_consumer = new OverriddenConsumer();
-        JdbcToArrowConfig arrow_jdbc_config = (
+        JdbcToArrowConfig arrow_jdbc_config = createArrowConfig(allocator, JdbcToArrowConfig.DEFAULT_TARGET_BATCH_SIZE, resultSet, metaData, profile, options,
+                arrayTypes.subTypes, true);
+        Schema schema = JdbcToArrowUtils.jdbcToArrowSchema(metaData.asResultSetMetaData(), arrow_jdbc_config);
+        ArrowSchema arrowSchema = ArrowSchema.allocateNew(allocator);
+        Data.exportSchema(allocator, schema, null, arrowSchema);
+        return arrowSchema.memoryAddress();
+    }
+
+    private static ExplicitTypeMapper getTypeMapper(ResultSet resultSet, DriverProfile profile) {
+        return profile != null ? profile.getTypeMapper() : ExplicitTypeMapper.forDriver(resultSet);
+    }
+
+    /**
+     * 'columnMetadata' adds the driver-reported JDBC metadata to the Arrow fields;
+     * the exported schema always has it, fetched batches only on request.
+     */
+    private static JdbcToArrowConfig createArrowConfig(BufferAllocator allocator, int batchSize, ResultSet resultSet, ColumnMetaData metaData, DriverProfile profile, ConversionOptions options,
+                                                       Map<Integer, JdbcFieldInfo> arraySubTypes, boolean columnMetadata) {
+        if (options == null) {
+            options = ConversionOptions.DEFAULT;
+        }
+        ExplicitTypeMapper typeMapper = getTypeMapper(resultSet, profile);
+        TemporalSupport temporalSupport = profile != null ? profile.getTemporalSupport() : TemporalSupport.forDriver(resultSet);
+        // Per top-level column; ARRAY element consumers are built by
+        // OverriddenConsumer and never read large objects with a limit.
+        final int[] lobMaxLengths = new int[metaData.columnCount];
+        for (int i = 0; i < lobMaxLengths.length; i++) {
+            lobMaxLengths[i] = LobConsumer.isLargeObjectType(metaData.types[i]) ? options.getLobMaxLength() : -1;
+        }
+        OverriddenConsumer overriden_consumer = new OverriddenConsumer(options);
+        return (
             new JdbcToArrowConfigBuilder()
             .setAllocator(allocator)
-            .setCalendar(utcCalendar)
+            .setCalendar(TimeUtils.newUtcCalendar())
             .setTargetBatchSize(batchSize)
             .setBigDecimalRoundingMode(RoundingMode.HALF_UP)
-            .setExplicitTypesByColumnIndex(typeMapper.createExplicitTypeMapping(resultSet))
-            .setArraySubTypeByColumnIndexMap(typeMapper.createArraySubTypeMapping(resultSet))
+            .setExplicitTypesByColumnIndex(typeMapper.createExplicitTypeMapping(metaData, options))
+            .setArraySubTypeByColumnIndexMap(arraySubTypes)
+            .setColumnMetadataByColumnIndex(columnMetadata ? typeMapper.createColumnMetadata(metaData) : null)
             .setJdbcToArrowTypeConverter((jdbcFieldInfo) -> overriden_consumer.getJdbcToArrowTypeConverter(jdbcFieldInfo))
-            .setJdbcConsumerGetter(OverriddenConsumer::getConsumer)
+            .setJdbcConsumerGetter((arrowType, columnIndex, nullable, vector, config) ->
+                    OverriddenConsumer.getConsumer(arrowType, columnIndex, nullable, vector, config, temporalSupport,
+                            columnIndex <= lobMaxLengths.length ? lobMaxLengths[columnIndex - 1] : -1))
             .build()
         );
-        ArrowVectorIterator iterator = JdbcToArrow.sqlToArrowVectorIterator(resultSet, arrow_jdbc_config);
-        return iterator;
     }
 
 }
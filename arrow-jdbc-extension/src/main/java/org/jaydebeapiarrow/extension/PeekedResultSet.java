@@ -0,0 +1,50 @@
+package org.jaydebeapiarrow.extension;
+
+import java.lang.reflect.InvocationHandler;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.lang.reflect.Proxy;
+import java.sql.ResultSet;
+
+/**
+ * A ResultSet whose cursor was already moved to the first row.
+ *
+ * Reading ARRAY element types with Array.getBaseType() needs a row, but the
+ * Arrow iterator expects a result set positioned before the first row. The
+ * wrapper answers the first next() with the outcome of the call that was
+ * already made and delegates everything else, so the peeked row is converted
+ * like any other without buffering it.
+ */
+final class PeekedResultSet implements InvocationHandler {
+
+    private final ResultSet delegate;
+    private final boolean hasFirstRow;
+    private boolean replayed = false;
+
+    private PeekedResultSet(ResultSet delegate, boolean hasFirstRow) {
+        this.delegate = delegate;
+        this.hasFirstRow = hasFirstRow;
+    }
+
+    /** Wrap 'resultSet', on which next() was called once and returned 'hasFirstRow'. */
+    static ResultSet wrap(ResultSet resultSet, boolean hasFirstRow) {
+        return (ResultSet) Proxy.newProxyInstance(
+                PeekedResultSet.class.getClassLoader(),
+                new Class<?>[]{ResultSet.class},
+                new PeekedResultSet(resultSet, hasFirstRow));
+    }
+
+    @Override
+    public Object invoke(Object proxy, Method method, Object[] args) throws Throwable {
+        if (!replayed && "next".equals(method.getName()) && method.getParameterCount() == 0) {
+            replayed = true;
+            return hasFirstRow;
+        }
+        try {
+            return method.invoke(delegate, args);
+        }
+        catch (InvocationTargetException e) {
+            throw e.getCause();
+        }
+    }
+}
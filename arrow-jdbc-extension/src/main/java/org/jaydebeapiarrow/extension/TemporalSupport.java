@@ -0,0 +1,107 @@
+package org.jaydebeapiarrow.extension;
+
+import java.sql.ResultSet;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicBoolean;
+
+/**
+ * Which temporal read strategy a driver supports, learned once per driver.
+ *
+ * {@link TimeUtils} reads dates, times and timestamps with
+ * getObject(..., java.time class) and falls back to the legacy
+ * getDate/getTime/getTimestamp accessors when the driver rejects that. The
+ * first rejection flips the matching flag here, and because the flags are
+ * shared by every consumer created for the driver, later batches and queries
+ * go straight to the supported accessor instead of paying for another thrown
+ * exception per column.
+ *
+ * Timestamps with and without time zone have separate flags: some drivers
+ * (PostgreSQL timestamptz) only reject LocalDateTime for the former.
+ */
+public class TemporalSupport {
+
+    /**
+     * Read strategy for one column kind of a driver. Either flag sends reads
+     * to the legacy getter; only a rejected getObject counts as a fallback
+     * (see {@link TimeUtils#getLegacyFallbackCounts()}).
+     */
+    public static final class Strategy {
+
+        /* getObject(..., java.time class) is rejected by the driver */
+        private final AtomicBoolean legacy = new AtomicBoolean(false);
+        /* getObject throws NullPointerException for SQL NULL (DB2) */
+        private final AtomicBoolean nullPointerOnNull = new AtomicBoolean(false);
+
+        public boolean useLegacy() {
+            return legacy.get() || nullPointerOnNull.get();
+        }
+
+        /** Switch to the legacy getter; true for the call that switched. */
+        boolean switchToLegacy() {
+            return legacy.compareAndSet(false, true);
+        }
+
+        /** Note that getObject throws NullPointerException for SQL NULL. */
+        void markNullPointerOnNull() {
+            nullPointerOnNull.set(true);
+        }
+
+        public boolean isLegacy() {
+            return legacy.get();
+        }
+
+        public boolean isNullPointerOnNull() {
+            return nullPointerOnNull.get();
+        }
+
+        @Override
+        public String toString() {
+            return legacy.get() ? "legacy" : nullPointerOnNull.get() ? "legacy(null)" : "getObject";
+        }
+    }
+
+    private static final Map<String, TemporalSupport> DRIVER_SUPPORT = new ConcurrentHashMap<>();
+
+    private final Strategy legacyDate = new Strategy();
+    private final Strategy legacyTime = new Strategy();
+    private final Strategy legacyTimestamp = new Strategy();
+    private final Strategy legacyTimestampTZ = new Strategy();
+
+    /**
+     * Return the shared instance for the driver that produced 'resultSet',
+     * keyed by the ResultSet implementation class like
+     * {@link ExplicitTypeMapper#forDriver(ResultSet)}.
+     */
+    public static TemporalSupport forDriver(ResultSet resultSet) {
+        return forDriver(resultSet.getClass().getName());
+    }
+
+    public static TemporalSupport forDriver(String driverKey) {
+        return DRIVER_SUPPORT.computeIfAbsent(driverKey, key -> new TemporalSupport());
+    }
+
+    public Strategy legacyDate() {
+        return legacyDate;
+    }
+
+    public Strategy legacyTime() {
+        return legacyTime;
+    }
+
+    public Strategy legacyTimestamp() {
+        return legacyTimestamp;
+    }
+
+    public Strategy legacyTimestampTZ() {
+        return legacyTimestampTZ;
+    }
+
+    @Override
+    public String toString() {
+        return "TemporalSupport(date=" + legacyDate
+                + ", time=" + legacyTime
+                + ", timestamp=" + legacyTimestamp
+                + ", timestampTZ=" + legacyTimestampTZ + ")";
+    }
+}
@@ -8,7 +8,8 @@ import java.time.LocalDateTime;
 import java.time.LocalTime;
 import java.time.ZoneOffset;
 import java.util.Calendar;
-import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.TimeZone;
+import java.util.concurrent.atomic.AtomicLong;
 import java.util.logging.Level;
 import java.util.logging.Logger;
 
@@ -20,13 +21,48 @@ import java.util.logging.Logger;
  * columns (TIMESTAMP_WITH_TIMEZONE), the JDBC driver performs TZ conversion when
  * getTimestamp(column, calendar) is called with a UTC Calendar. For timezone-naive
  * columns (TIMESTAMP), the raw local time is interpreted as-is.
+ *
+ * Thread safety: java.util.Calendar is mutable and drivers write into the
+ * Calendar passed to getDate/getTimestamp. Each consumer and each binding call
+ * therefore owns its Calendar (see {@link #newUtcCalendar()}); a Calendar must
+ * never be shared between result sets that may be read concurrently.
+ *
+ * The strategies passed to the parse methods are shared per driver (see
+ * {@link TemporalSupport}), so the getObject probe fails at most once per
+ * driver and column kind rather than once per consumer. Each such switch is
+ * counted, see {@link #getLegacyFallbackCounts()}. A NullPointerException
+ * from getObject (DB2 on SQL NULL) also switches the driver to the legacy
+ * getter, which handles NULL, but is not counted as a fallback.
  */
 public class TimeUtils {
 
-    private static final Logger logger = Logger.getLogger(ExplicitTypeMapper.class.getName());
+    private static final Logger logger = Logger.getLogger(TimeUtils.class.getName());
+
+    private static final TimeZone UTC = TimeZone.getTimeZone("UTC");
+
+    private static final AtomicLong dateLegacyFallbacks = new AtomicLong();
+    private static final AtomicLong timeLegacyFallbacks = new AtomicLong();
+    private static final AtomicLong timestampLegacyFallbacks = new AtomicLong();
+
+    /**
+     * Return how often a strategy was switched to legacy, i.e. a driver fell
+     * back from getObject to the legacy getters, as {date, time, timestamp}.
+     */
+    public static long[] getLegacyFallbackCounts() {
+        return new long[] {
+            dateLegacyFallbacks.get(),
+            timeLegacyFallbacks.get(),
+            timestampLegacyFallbacks.get()
+        };
+    }
+
+    /** Return a new UTC Calendar, to be confined to one consumer or binder. */
+    public static Calendar newUtcCalendar() {
+        return Calendar.getInstance(UTC);
+    }
 
-    public static long parseDateAsMilliSeconds(ResultSet resultSet, int columnIndexInResultSet, Calendar calendar, AtomicBoolean useLegacy) throws SQLException {
-        if (useLegacy.get()) {
+    public static long parseDateAsMilliSeconds(ResultSet resultSet, int columnIndexInResultSet, Calendar calendar, TemporalSupport.Strategy strategy) throws SQLException {
+        if (strategy.useLegacy()) {
             return parseDateLegacy(resultSet, columnIndexInResultSet, calendar);
         }
         try {
@@ -37,7 +73,8 @@ public class TimeUtils {
             return 0;
         }
         catch (SQLException e) {
-            if (useLegacy.compareAndSet(false, true)) {
+            if (strategy.switchToLegacy()) {
+                dateLegacyFallbacks.incrementAndGet();
                 logger.log(Level.WARNING, "Can not consume date using getObject (possibly due to lack of support for LocalDate). Falling back to legacy consumption.", e);
             }
             return parseDateLegacy(resultSet, columnIndexInResultSet, calendar);
@@ -46,7 +83,9 @@ public class TimeUtils {
             // DB2's JDBC driver can throw NPE from getObject(..., LocalDate.class)
             // when the value is SQL NULL. Fall back to getDate(), which reports
             // null through ResultSet.wasNull().
-            useLegacy.compareAndSet(false, true);
+            // getObject works for non-NULL values, so this is not counted as a
+            // fallback, but later values skip the exception and use the legacy getter.
+            strategy.markNullPointerOnNull();
             return parseDateLegacy(resultSet, columnIndexInResultSet, calendar);
         }
     }
@@ -59,19 +98,20 @@ public class TimeUtils {
         return 0;
     }
 
-    public static int parseTimeAsMilliSeconds(ResultSet resultSet, int columnIndexInResultSet, Calendar calendar, AtomicBoolean useLegacy) throws SQLException {
-        if (useLegacy.get()) {
+    public static int parseTimeAsMilliSeconds(ResultSet resultSet, int columnIndexInResultSet, Calendar calendar, TemporalSupport.Strategy strategy) throws SQLException {
+        if (strategy.useLegacy()) {
             return parseTimeLegacy(resultSet, columnIndexInResultSet, calendar);
         }
         try {
             LocalTime time = resultSet.getObject(columnIndexInResultSet, LocalTime.class);
             if (time != null) {
-                return time.toSecondOfDay() * 1000;
+                return (int) (time.toNanoOfDay() / 1_000_000L);
             }
             return 0;
         }
         catch (SQLException e) {
-            if (useLegacy.compareAndSet(false, true)) {
+            if (strategy.switchToLegacy()) {
+                timeLegacyFallbacks.incrementAndGet();
                 logger.log(Level.WARNING, "Can not consume time using getObject (possibly due to lack of support for LocalTime). Falling back to legacy consumption.", e);
             }
             return parseTimeLegacy(resultSet, columnIndexInResultSet, calendar);
@@ -80,21 +120,61 @@ public class TimeUtils {
             // DB2's JDBC driver can throw NPE from getObject(..., LocalTime.class)
             // when the value is SQL NULL. Fall back to getTime(), which reports
             // null through ResultSet.wasNull().
-            useLegacy.compareAndSet(false, true);
+            // getObject works for non-NULL values, so this is not counted as a
+            // fallback, but later values skip the exception and use the legacy getter.
+            strategy.markNullPointerOnNull();
             return parseTimeLegacy(resultSet, columnIndexInResultSet, calendar);
         }
     }
 
     private static int parseTimeLegacy(ResultSet resultSet, int columnIndexInResultSet, Calendar calendar) throws SQLException {
+        return (int) (parseTimeLegacyMicros(resultSet, columnIndexInResultSet) / 1000L);
+    }
+
+    public static long parseTimeAsMicroSeconds(ResultSet resultSet, int columnIndexInResultSet, Calendar calendar, TemporalSupport.Strategy strategy) throws SQLException {
+        if (strategy.useLegacy()) {
+            return parseTimeLegacyMicros(resultSet, columnIndexInResultSet);
+        }
+        try {
+            LocalTime time = resultSet.getObject(columnIndexInResultSet, LocalTime.class);
+            if (time != null) {
+                return time.toNanoOfDay() / 1000L;
+            }
+            return 0;
+        }
+        catch (SQLException e) {
+            if (strategy.switchToLegacy()) {
+                timeLegacyFallbacks.incrementAndGet();
+                logger.log(Level.WARNING, "Can not consume time using getObject (possibly due to lack of support for LocalTime). Falling back to legacy consumption.", e);
+            }
+            return parseTimeLegacyMicros(resultSet, columnIndexInResultSet);
+        }
+        catch (NullPointerException e) {
+            // DB2's JDBC driver can throw NPE from getObject(..., LocalTime.class)
+            // when the value is SQL NULL. Fall back to getTime(), which reports
+            // null through ResultSet.wasNull().
+            // getObject works for non-NULL values, so this is not counted as a
+            // fallback, but later values skip the exception and use the legacy getter.
+            strategy.markNullPointerOnNull();
+            return parseTimeLegacyMicros(resultSet, columnIndexInResultSet);
+        }
+    }
+
+    /**
+     * java.sql.Time.toLocalTime() drops the milliseconds, so add them back from
+     * the millisecond value the Time carries.
+     */
+    private static long parseTimeLegacyMicros(ResultSet resultSet, int columnIndexInResultSet) throws SQLException {
         Time time = resultSet.getTime(columnIndexInResultSet);
         if (time != null) {
-            return time.toLocalTime().toSecondOfDay() * 1000;
+            long millisOfSecond = Math.floorMod(time.getTime(), 1000L);
+            return time.toLocalTime().toSecondOfDay() * 1_000_000L + millisOfSecond * 1000L;
         }
         return 0;
     }
 
-    public static long parseTimestampAsMicroSeconds(ResultSet resultSet, int columnIndexInResultSet, Calendar calendar, AtomicBoolean useLegacy) throws SQLException {
-        if (useLegacy.get()) {
+    public static long parseTimestampAsMicroSeconds(ResultSet resultSet, int columnIndexInResultSet, Calendar calendar, TemporalSupport.Strategy strategy) throws SQLException {
+        if (strategy.useLegacy()) {
             return parseTimestampLegacy(resultSet, columnIndexInResultSet, calendar);
         }
         try {
@@ -107,7 +187,8 @@ public class TimeUtils {
             return 0;
         }
         catch (SQLException e) {
-            if (useLegacy.compareAndSet(false, true)) {
+            if (strategy.switchToLegacy()) {
+                timestampLegacyFallbacks.incrementAndGet();
                 logger.log(Level.WARNING, "Can not consume timestamp using getObject (possibly due to lack of support for LocalDateTime). Falling back to legacy consumption.", e);
             }
             return parseTimestampLegacy(resultSet, columnIndexInResultSet, calendar);
@@ -116,7 +197,9 @@ public class TimeUtils {
             // DB2's JDBC driver can throw NPE from getObject(..., LocalDateTime.class)
             // when the value is SQL NULL. Fall back to getTimestamp(), which reports
             // null through ResultSet.wasNull().
-            useLegacy.compareAndSet(false, true);
+            // getObject works for non-NULL values, so this is not counted as a
+            // fallback, but later values skip the exception and use the legacy getter.
+            strategy.markNullPointerOnNull();
             return parseTimestampLegacy(resultSet, columnIndexInResultSet, calendar);
         }
     }
@@ -21,7 +21,6 @@ import java.sql.ResultSet;
 import java.sql.SQLException;
 import java.util.Calendar;
 import java.util.concurrent.TimeUnit;
-import java.util.concurrent.atomic.AtomicBoolean;
 import java.util.logging.Logger;
 
 import org.apache.arrow.adapter.jdbc.consumer.BaseConsumer;
@@ -30,6 +29,7 @@ import org.apache.arrow.vector.DateDayVector;
 import org.apache.arrow.vector.DateMilliVector;
 
 import org.jaydebeapiarrow.extension.ExplicitTypeMapper;
+import org.jaydebeapiarrow.extension.TemporalSupport;
 import org.jaydebeapiarrow.extension.TimeUtils;
 
 public class DateConsumer {
@@ -41,10 +41,19 @@ public class DateConsumer {
      */
     public static JdbcConsumer<DateDayVector> createConsumer(
             DateDayVector vector, int index, boolean nullable, Calendar calendar) {
+        return createConsumer(vector, index, nullable, calendar, new TemporalSupport.Strategy());
+    }
+
+    /**
+     * Creates a consumer for {@link DateMilliVector} that shares the
+     * temporal read strategy 'strategy' with other consumers of the same driver.
+     */
+    public static JdbcConsumer<DateDayVector> createConsumer(
+            DateDayVector vector, int index, boolean nullable, Calendar calendar, TemporalSupport.Strategy strategy) {
         if (nullable) {
-            return new NullableDateConsumer(vector, index, calendar);
+            return new NullableDateConsumer(vector, index, calendar, strategy);
         } else {
-            return new NonNullableDateConsumer(vector, index, calendar);
+            return new NonNullableDateConsumer(vector, index, calendar, strategy);
         }
     }
 
@@ -54,7 +63,7 @@ public class DateConsumer {
     static class NullableDateConsumer extends BaseConsumer<DateDayVector> {
 
         protected final Calendar calendar;
-        private final AtomicBoolean useLegacy = new AtomicBoolean(false);
+        private final TemporalSupport.Strategy strategy;
 
         /**
          * Instantiate a DateConsumer.
@@ -67,13 +76,21 @@ public class DateConsumer {
          * Instantiate a DateConsumer.
          */
         public NullableDateConsumer(DateDayVector vector, int index, Calendar calendar) {
+            this(vector, index, calendar, new TemporalSupport.Strategy());
+        }
+
+        /**
+         * Instantiate a DateConsumer.
+         */
+        public NullableDateConsumer(DateDayVector vector, int index, Calendar calendar, TemporalSupport.Strategy strategy) {
             super(vector, index);
             this.calendar = calendar;
+            this.strategy = strategy;
         }
 
         @Override
         public void consume(ResultSet resultSet) throws SQLException {
-            long millis = TimeUtils.parseDateAsMilliSeconds(resultSet, columnIndexInResultSet, calendar, useLegacy);
+            long millis = TimeUtils.parseDateAsMilliSeconds(resultSet, columnIndexInResultSet, calendar, strategy);
             if (!resultSet.wasNull()) {
                 // for fixed width vectors, we have allocated enough memory proactively,
                 // so there is no need to call the setSafe method here.
@@ -89,7 +106,7 @@ public class DateConsumer {
     static class NonNullableDateConsumer extends BaseConsumer<DateDayVector> {
 
         protected final Calendar calendar;
-        private final AtomicBoolean useLegacy = new AtomicBoolean(false);
+        private final TemporalSupport.Strategy strategy;
 
         /**
          * Instantiate a DateConsumer.
@@ -102,13 +119,21 @@ public class DateConsumer {
          * Instantiate a DateConsumer.
          */
         public NonNullableDateConsumer(DateDayVector vector, int index, Calendar calendar) {
+            this(vector, index, calendar, new TemporalSupport.Strategy());
+        }
+
+        /**
+         * Instantiate a DateConsumer.
+         */
+        public NonNullableDateConsumer(DateDayVector vector, int index, Calendar calendar, TemporalSupport.Strategy strategy) {
             super(vector, index);
             this.calendar = calendar;
+            this.strategy = strategy;
         }
 
         @Override
         public void consume(ResultSet resultSet) throws SQLException {
-            long millis = TimeUtils.parseDateAsMilliSeconds(resultSet, columnIndexInResultSet, calendar, useLegacy);
+            long millis = TimeUtils.parseDateAsMilliSeconds(resultSet, columnIndexInResultSet, calendar, strategy);
             // for fixed width vectors, we have allocated enough memory proactively,
             // so there is no need to call the setSafe method here.
             vector.set(currentIndex, Math.toIntExact(TimeUnit.MILLISECONDS.toDays(millis)));
@@ -36,9 +36,34 @@ import org.apache.arrow.vector.DecimalVector;
  *
  * This consumer normalizes values via BigDecimal.valueOf() to get a clean
  * decimal representation before setting the scale to match the vector.
+ *
+ * Columns with a precision of at most 18 digits take a faster path: their
+ * unscaled values always fit in a long, which is written into the vector
+ * directly instead of going through BigDecimal.precision() and
+ * DecimalVector.set(BigDecimal), and without going through BigInteger.
+ * Scale-0 columns on that path are read with getLong() once the first value
+ * shows that the driver stores exact decimals (see {@link #canReadWithGetLong});
+ * getLong() would truncate the fractional values of drivers returning
+ * Integer/Double per value (SQLite) instead of rounding them. The fast path
+ * can be disabled with -Djaydebeapiarrow.decimal.fastPath=false.
  */
 public class DecimalConsumer {
 
+    /* Largest precision whose unscaled values always fit in a long. */
+    static final int MAX_LONG_PRECISION = 18;
+
+    static final boolean FAST_PATH_ENABLED =
+            !"false".equalsIgnoreCase(System.getProperty("jaydebeapiarrow.decimal.fastPath"));
+
+    private static final long[] POWERS_OF_TEN = new long[MAX_LONG_PRECISION + 1];
+
+    static {
+        POWERS_OF_TEN[0] = 1L;
+        for (int i = 1; i <= MAX_LONG_PRECISION; i++) {
+            POWERS_OF_TEN[i] = POWERS_OF_TEN[i - 1] * 10L;
+        }
+    }
+
     public static JdbcConsumer<DecimalVector> createConsumer(
             DecimalVector vector, int index, boolean nullable, RoundingMode roundingMode) {
         return createConsumer(vector, index, nullable, roundingMode, vector.getScale(), 38);
@@ -46,6 +71,13 @@ public class DecimalConsumer {
 
     public static JdbcConsumer<DecimalVector> createConsumer(
             DecimalVector vector, int index, boolean nullable, RoundingMode roundingMode, int scale, int precision) {
+        if (FAST_PATH_ENABLED && precision <= MAX_LONG_PRECISION) {
+            if (nullable) {
+                return new NullableLongDecimalConsumer(vector, index, roundingMode, scale, precision);
+            } else {
+                return new NonNullableLongDecimalConsumer(vector, index, roundingMode, scale, precision);
+            }
+        }
         if (nullable) {
             return new NullableDecimalConsumer(vector, index, roundingMode, scale, precision);
         } else {
@@ -137,6 +169,122 @@ public class DecimalConsumer {
         }
     }
 
+    /**
+     * Consumer for precision <= 18, writing the unscaled long value directly.
+     */
+    static class NullableLongDecimalConsumer implements JdbcConsumer<DecimalVector> {
+
+        private final RoundingMode roundingMode;
+        private final int scale;
+        private final int precision;
+        private final int columnIndexInResultSet;
+        private DecimalVector vector;
+        private int currentIndex;
+        /* Decided from the first non-NULL value of a scale-0 column */
+        private boolean probed;
+        private boolean readsLong = false;
+
+        public NullableLongDecimalConsumer(DecimalVector vector, int index, RoundingMode roundingMode, int scale, int precision) {
+            this.vector = vector;
+            this.columnIndexInResultSet = index;
+            this.roundingMode = roundingMode;
+            this.scale = scale;
+            this.precision = precision;
+            this.probed = scale != 0;
+        }
+
+        @Override
+        public void consume(ResultSet resultSet) throws SQLException {
+            try {
+                if (readsLong) {
+                    long value = resultSet.getLong(columnIndexInResultSet);
+                    if (!resultSet.wasNull()) {
+                        vector.set(currentIndex, validateUnscaledFitsVector(value, precision));
+                    }
+                } else {
+                    Object value = resultSet.getObject(columnIndexInResultSet);
+                    if (value != null) {
+                        if (!probed) {
+                            probed = true;
+                            readsLong = canReadWithGetLong(value);
+                        }
+                        vector.set(currentIndex, validateUnscaledFitsVector(
+                                toUnscaledLong(toBigDecimal(value), scale, roundingMode), precision));
+                    }
+                }
+            } catch (ArithmeticException | IllegalArgumentException e) {
+                throw createDecimalConversionException(e, currentIndex, columnIndexInResultSet, precision, scale);
+            }
+            currentIndex++;
+        }
+
+        @Override
+        public void resetValueVector(DecimalVector vector) {
+            this.vector = vector;
+            this.currentIndex = 0;
+        }
+
+        @Override
+        public void close() {
+        }
+    }
+
+    /**
+     * Non-nullable consumer for precision <= 18, writing the unscaled long value directly.
+     */
+    static class NonNullableLongDecimalConsumer implements JdbcConsumer<DecimalVector> {
+
+        private final RoundingMode roundingMode;
+        private final int scale;
+        private final int precision;
+        private final int columnIndexInResultSet;
+        private DecimalVector vector;
+        private int currentIndex;
+        /* Decided from the first value of a scale-0 column */
+        private boolean probed;
+        private boolean readsLong = false;
+
+        public NonNullableLongDecimalConsumer(DecimalVector vector, int index, RoundingMode roundingMode, int scale, int precision) {
+            this.vector = vector;
+            this.columnIndexInResultSet = index;
+            this.roundingMode = roundingMode;
+            this.scale = scale;
+            this.precision = precision;
+            this.probed = scale != 0;
+        }
+
+        @Override
+        public void consume(ResultSet resultSet) throws SQLException {
+            try {
+                long unscaled;
+                if (readsLong) {
+                    unscaled = resultSet.getLong(columnIndexInResultSet);
+                } else {
+                    Object value = resultSet.getObject(columnIndexInResultSet);
+                    if (!probed) {
+                        probed = true;
+                        readsLong = canReadWithGetLong(value);
+                    }
+                    unscaled = toUnscaledLong(toBigDecimal(value), scale, roundingMode);
+                }
+                vector.set(currentIndex, validateUnscaledFitsVector(unscaled, precision));
+            } catch (ArithmeticException | IllegalArgumentException e) {
+                throw createDecimalConversionException(e, currentIndex, columnIndexInResultSet, precision, scale);
+            }
+            currentIndex++;
+        }
+
+        @Override
+        public void resetValueVector(DecimalVector vector) {
+            this.vector = vector;
+            this.currentIndex = 0;
+        }
+
+        @Override
+        public void close() {
+        }
+    }
+
     private static SQLException createDecimalConversionException(
             RuntimeException cause, int rowIndex, int columnIndex, int precision, int scale) {
         return new SQLException(String.format(
@@ -158,12 +306,47 @@ public class DecimalConsumer {
         }
     }
 
+    private static long validateUnscaledFitsVector(long unscaled, int precision) {
+        long limit = POWERS_OF_TEN[precision];
+        if (unscaled >= limit || unscaled <= -limit) {
+            throw new IllegalArgumentException(String.format(
+                    "value %d (unscaled) exceeds Arrow decimal precision %d",
+                    unscaled, precision));
+        }
+        return unscaled;
+    }
+
+    /**
+     * Rescale to the vector scale and return the unscaled value. Throws
+     * ArithmeticException if it does not fit in a long. Moving the point
+     * gives a scale-0 BigDecimal, whose longValueExact() returns the compact
+     * value without the BigInteger that unscaledValue() allocates.
+     */
+    static long toUnscaledLong(BigDecimal bd, int scale, RoundingMode roundingMode) {
+        return bd.setScale(scale, roundingMode).movePointRight(scale).longValueExact();
+    }
+
+    /**
+     * True if the values of a scale-0 column whose first value is 'first' can
+     * be read with getLong(): a BigDecimal without fraction digits means the
+     * driver stores exact decimals of the declared scale, so getLong() neither
+     * truncates nor needs rounding. Drivers returning Integer/Long/Double per
+     * value may return a fraction later and keep the rounding BigDecimal path.
+     */
+    static boolean canReadWithGetLong(Object first) {
+        return first instanceof BigDecimal && ((BigDecimal) first).scale() <= 0;
+    }
+
     /**
      * Retrieves a BigDecimal from the ResultSet, normalizing the value if the
      * JDBC driver returns a Double or Integer instead of a BigDecimal.
      */
     static BigDecimal getCleanBigDecimal(ResultSet resultSet, int columnIndex) throws SQLException {
-        Object obj = resultSet.getObject(columnIndex);
+        return toBigDecimal(resultSet.getObject(columnIndex));
+    }
+
+    /** Normalize a value returned by getObject() to a BigDecimal, see {@link #getCleanBigDecimal}. */
+    static BigDecimal toBigDecimal(Object obj) {
         if (obj == null) {
             return null;
         }
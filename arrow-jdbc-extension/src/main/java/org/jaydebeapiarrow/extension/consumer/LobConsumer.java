@@ -0,0 +1,250 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.jaydebeapiarrow.extension.consumer;
+
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.Reader;
+import java.nio.charset.StandardCharsets;
+import java.sql.ResultSet;
+import java.sql.SQLException;
+import java.sql.Types;
+import java.util.Arrays;
+
+import org.apache.arrow.adapter.jdbc.consumer.BaseConsumer;
+import org.apache.arrow.adapter.jdbc.consumer.JdbcConsumer;
+import org.apache.arrow.vector.BaseLargeVariableWidthVector;
+import org.apache.arrow.vector.BaseVariableWidthVector;
+import org.apache.arrow.vector.FieldVector;
+import org.apache.arrow.vector.LargeVarBinaryVector;
+import org.apache.arrow.vector.LargeVarCharVector;
+import org.apache.arrow.vector.VarBinaryVector;
+import org.apache.arrow.vector.VarCharVector;
+
+/**
+ * Consumers for large-object columns (CLOB/NCLOB/LONGVARCHAR and
+ * BLOB/LONGVARBINARY) that read at most a fixed number of characters or
+ * bytes per value.
+ *
+ * The default consumers read each value completely through getString() or
+ * getBinaryStream(), so a batch holds every LOB in full. These consumers
+ * read through getCharacterStream()/getBinaryStream() and stop at the limit,
+ * so the memory of a batch is bounded by the limit times the batch size.
+ *
+ * The same consumers write into {@link LargeVarCharVector} and
+ * {@link LargeVarBinaryVector} (64-bit offsets), which also have full-value
+ * consumers here since arrow-jdbc has none for the large types. The binary
+ * one streams values of any length, beyond the 2GB of a byte array.
+ */
+public class LobConsumer {
+
+    private static final int BUFFER_SIZE = 8192;
+
+    public static boolean isLargeObjectType(int jdbcType) {
+        switch (jdbcType) {
+            case Types.CLOB:
+            case Types.NCLOB:
+            case Types.LONGVARCHAR:
+            case Types.LONGNVARCHAR:
+            case Types.BLOB:
+            case Types.LONGVARBINARY:
+                return true;
+            default:
+                return false;
+        }
+    }
+
+    /**
+     * Creates a consumer for {@link VarCharVector} reading at most 'maxLength'
+     * characters of each value.
+     */
+    public static JdbcConsumer<VarCharVector> createConsumer(VarCharVector vector, int index, int maxLength) {
+        return new TruncatingCharacterConsumer<>(vector, index, maxLength);
+    }
+
+    /**
+     * Creates a consumer for {@link VarBinaryVector} reading at most 'maxLength'
+     * bytes of each value.
+     */
+    public static JdbcConsumer<VarBinaryVector> createConsumer(VarBinaryVector vector, int index, int maxLength) {
+        return new TruncatingBinaryConsumer<>(vector, index, maxLength);
+    }
+
+    /**
+     * Creates a consumer for {@link LargeVarCharVector} reading at most
+     * 'maxLength' characters of each value, or whole values if 'maxLength'
+     * is negative.
+     */
+    public static JdbcConsumer<LargeVarCharVector> createConsumer(LargeVarCharVector vector, int index, int maxLength) {
+        if (maxLength < 0) {
+            return new LargeVarCharConsumer(vector, index);
+        }
+        return new TruncatingCharacterConsumer<>(vector, index, maxLength);
+    }
+
+    /**
+     * Creates a consumer for {@link LargeVarBinaryVector} reading at most
+     * 'maxLength' bytes of each value, or whole values if 'maxLength' is
+     * negative.
+     */
+    public static JdbcConsumer<LargeVarBinaryVector> createConsumer(LargeVarBinaryVector vector, int index, int maxLength) {
+        if (maxLength < 0) {
+            return new LargeVarBinaryConsumer(vector, index);
+        }
+        return new TruncatingBinaryConsumer<>(vector, index, maxLength);
+    }
+
+    static void setBytes(FieldVector vector, int index, byte[] value, int length) {
+        if (vector instanceof BaseLargeVariableWidthVector) {
+            ((BaseLargeVariableWidthVector) vector).setSafe(index, value, 0, length);
+        } else {
+            ((BaseVariableWidthVector) vector).setSafe(index, value, 0, length);
+        }
+    }
+
+    static class TruncatingCharacterConsumer<V extends FieldVector> extends BaseConsumer<V> {
+
+        private final int maxLength;
+
+        public TruncatingCharacterConsumer(V vector, int index, int maxLength) {
+            super(vector, index);
+            this.maxLength = maxLength;
+        }
+
+        @Override
+        public void consume(ResultSet resultSet) throws SQLException {
+            try (Reader reader = resultSet.getCharacterStream(columnIndexInResultSet)) {
+                if (reader != null && !resultSet.wasNull()) {
+                    char[] chars = new char[Math.min(maxLength, BUFFER_SIZE)];
+                    StringBuilder value = new StringBuilder();
+                    int read;
+                    while (value.length() < maxLength
+                            && (read = reader.read(chars, 0, Math.min(chars.length, maxLength - value.length()))) != -1) {
+                        value.append(chars, 0, read);
+                    }
+                    // Do not cut a surrogate pair in half.
+                    int length = value.length();
+                    if (length > 0 && Character.isHighSurrogate(value.charAt(length - 1))) {
+                        value.setLength(length - 1);
+                    }
+                    byte[] bytes = value.toString().getBytes(StandardCharsets.UTF_8);
+                    setBytes(vector, currentIndex, bytes, bytes.length);
+                }
+            } catch (IOException e) {
+                throw new SQLException("Could not read character stream of column " + columnIndexInResultSet, e);
+            }
+            currentIndex++;
+        }
+    }
+
+    static class TruncatingBinaryConsumer<V extends FieldVector> extends BaseConsumer<V> {
+
+        private final int maxLength;
+
+        public TruncatingBinaryConsumer(V vector, int index, int maxLength) {
+            super(vector, index);
+            this.maxLength = maxLength;
+        }
+
+        @Override
+        public void consume(ResultSet resultSet) throws SQLException {
+            try (InputStream stream = resultSet.getBinaryStream(columnIndexInResultSet)) {
+                if (stream != null && !resultSet.wasNull()) {
+                    byte[] value = new byte[Math.min(maxLength, BUFFER_SIZE)];
+                    int length = 0;
+                    int read;
+                    while (length < maxLength
+                            && (read = stream.read(value, length, value.length - length)) != -1) {
+                        length += read;
+                        if (length == value.length && length < maxLength) {
+                            value = Arrays.copyOf(value, (int) Math.min(maxLength, value.length * 2L));
+                        }
+                    }
+                    setBytes(vector, currentIndex, value, length);
+                }
+            } catch (IOException e) {
+                throw new SQLException("Could not read binary stream of column " + columnIndexInResultSet, e);
+            }
+            currentIndex++;
+        }
+    }
+
+    /**
+     * Streams whole binary values into a {@link LargeVarBinaryVector}. The
+     * first chunk is set as the value, later chunks are appended to the data
+     * buffer and the end offset moved, so a value is not limited to the 2GB
+     * of a Java byte array.
+     */
+    static class LargeVarBinaryConsumer extends BaseConsumer<LargeVarBinaryVector> {
+
+        public LargeVarBinaryConsumer(LargeVarBinaryVector vector, int index) {
+            super(vector, index);
+        }
+
+        @Override
+        public void consume(ResultSet resultSet) throws SQLException {
+            try (InputStream stream = resultSet.getBinaryStream(columnIndexInResultSet)) {
+                if (stream != null && !resultSet.wasNull()) {
+                    byte[] chunk = new byte[BUFFER_SIZE];
+                    int read = readChunk(stream, chunk);
+                    vector.setSafe(currentIndex, chunk, 0, read);
+                    long end = vector.getEndOffset(currentIndex);
+                    while (read == chunk.length && (read = readChunk(stream, chunk)) > 0) {
+                        while (vector.getDataBuffer().capacity() < end + read) {
+                            vector.reallocDataBuffer();
+                        }
+                        vector.getDataBuffer().setBytes(end, chunk, 0, read);
+                        end += read;
+                        vector.getOffsetBuffer().setLong(
+                                (long) (currentIndex + 1) * BaseLargeVariableWidthVector.OFFSET_WIDTH, end);
+                    }
+                }
+            } catch (IOException e) {
+                throw new SQLException("Could not read binary stream of column " + columnIndexInResultSet, e);
+            }
+            currentIndex++;
+        }
+
+        /** Fill 'chunk' from 'stream'; returns fewer bytes only at the end of the stream. */
+        private static int readChunk(InputStream stream, byte[] chunk) throws IOException {
+            int length = 0;
+            int read;
+            while (length < chunk.length && (read = stream.read(chunk, length, chunk.length - length)) != -1) {
+                length += read;
+            }
+            return length;
+        }
+    }
+
+    /** Reads whole string values with getString() into a {@link LargeVarCharVector}. */
+    static class LargeVarCharConsumer extends BaseConsumer<LargeVarCharVector> {
+
+        public LargeVarCharConsumer(LargeVarCharVector vector, int index) {
+            super(vector, index);
+        }
+
+        @Override
+        public void consume(ResultSet resultSet) throws SQLException {
+            String value = resultSet.getString(columnIndexInResultSet);
+            if (value != null) {
+                vector.setSafe(currentIndex, value.getBytes(StandardCharsets.UTF_8));
+            }
+            currentIndex++;
+        }
+    }
+}
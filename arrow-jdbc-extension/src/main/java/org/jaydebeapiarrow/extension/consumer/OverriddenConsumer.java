@@ -19,32 +19,86 @@ package org.jaydebeapiarrow.extension.consumer;
 
 import java.math.RoundingMode;
 import java.util.Calendar;
-import java.util.TimeZone;
 import java.sql.Types;
 
 import org.apache.arrow.adapter.jdbc.JdbcFieldInfo;
 import org.apache.arrow.adapter.jdbc.JdbcToArrowConfig;
 import org.apache.arrow.adapter.jdbc.JdbcToArrowUtils;
+import org.apache.arrow.adapter.jdbc.consumer.ArrayConsumer;
 import org.apache.arrow.adapter.jdbc.consumer.JdbcConsumer;
 
 import org.apache.arrow.vector.*;
+import org.apache.arrow.vector.complex.ListVector;
 import org.apache.arrow.vector.types.pojo.ArrowType;
 import org.apache.arrow.vector.types.pojo.ArrowType.Timestamp;
 import org.apache.arrow.vector.types.TimeUnit;
+import org.jaydebeapiarrow.extension.ConversionOptions;
+import org.jaydebeapiarrow.extension.TemporalSupport;
+import org.jaydebeapiarrow.extension.TimeUtils;
 
 public class OverriddenConsumer {
 
-    private static final Calendar UTC_CALENDAR = Calendar.getInstance(TimeZone.getTimeZone("UTC"));
+    /** Column of Array.getResultSet() that holds the element value. */
+    private static final int ARRAY_VALUE_COLUMN = 2;
+
+    private final ConversionOptions options;
 
     public OverriddenConsumer() {
+        this(ConversionOptions.DEFAULT);
+    }
+
+    public OverriddenConsumer(ConversionOptions options) {
+        this.options = options != null ? options : ConversionOptions.DEFAULT;
+    }
+
+    /**
+     * Return large_utf8/large_binary for the string and binary columns selected
+     * by {@link ConversionOptions#getLargeTypes()}, or null for the regular types.
+     * Large types use 64-bit offsets, so a batch of wide values does not
+     * overflow the 2 GB limit of utf8/binary.
+     */
+    private ArrowType getLargeArrowType(int jdbcType) {
+        ConversionOptions.LargeTypes largeTypes = options.getLargeTypes();
+        if (largeTypes == ConversionOptions.LargeTypes.NONE) {
+            return null;
+        }
+        switch (jdbcType) {
+            case Types.CLOB:
+            case Types.NCLOB:
+            case Types.LONGVARCHAR:
+            case Types.LONGNVARCHAR:
+                return new ArrowType.LargeUtf8();
+            case Types.BLOB:
+            case Types.LONGVARBINARY:
+                return new ArrowType.LargeBinary();
+            case Types.CHAR:
+            case Types.NCHAR:
+            case Types.VARCHAR:
+            case Types.NVARCHAR:
+                return largeTypes == ConversionOptions.LargeTypes.ALL ? new ArrowType.LargeUtf8() : null;
+            case Types.BINARY:
+            case Types.VARBINARY:
+                return largeTypes == ConversionOptions.LargeTypes.ALL ? new ArrowType.LargeBinary() : null;
+            default:
+                return null;
+        }
     }
 
     public ArrowType getJdbcToArrowTypeConverter(final JdbcFieldInfo fieldInfo) {
+        ArrowType largeType = getLargeArrowType(fieldInfo.getJdbcType());
+        if (largeType != null) {
+            return largeType;
+        }
         switch (fieldInfo.getJdbcType()) {
             case Types.TIMESTAMP_WITH_TIMEZONE:
                 return new ArrowType.Timestamp(TimeUnit.MICROSECOND, "UTC");
             case Types.TIMESTAMP:
                 return new ArrowType.Timestamp(TimeUnit.MICROSECOND, null);
+            case Types.TIME:
+                if (options.getTimePrecision() == ConversionOptions.TimePrecision.US) {
+                    return new ArrowType.Time(TimeUnit.MICROSECOND, 64);
+                }
+                return new ArrowType.Time(TimeUnit.MILLISECOND, 32);
             case Types.DECIMAL:
             case Types.NUMERIC:
                 int precision = fieldInfo.getPrecision();
@@ -59,8 +113,32 @@ public class OverriddenConsumer {
 
     public static JdbcConsumer getConsumer(ArrowType arrowType, int columnIndex, boolean nullable,
                                     FieldVector vector, JdbcToArrowConfig config) {
+        return getConsumer(arrowType, columnIndex, nullable, vector, config, new TemporalSupport());
+    }
 
-        Calendar calendar = UTC_CALENDAR;
+    /**
+     * Like {@link #getConsumer(ArrowType, int, boolean, FieldVector, JdbcToArrowConfig)},
+     * with temporal consumers sharing the legacy fallback flags of 'temporalSupport'
+     * so a driver that rejects getObject(..., java.time class) is probed only once.
+     */
+    public static JdbcConsumer getConsumer(ArrowType arrowType, int columnIndex, boolean nullable,
+                                    FieldVector vector, JdbcToArrowConfig config,
+                                    TemporalSupport temporalSupport) {
+        return getConsumer(arrowType, columnIndex, nullable, vector, config, temporalSupport, -1);
+    }
+
+    /**
+     * Like {@link #getConsumer(ArrowType, int, boolean, FieldVector, JdbcToArrowConfig, TemporalSupport)}.
+     * A non-negative 'lobMaxLength' marks the column as a large object whose
+     * values are read up to that many characters or bytes (see {@link LobConsumer}).
+     */
+    public static JdbcConsumer getConsumer(ArrowType arrowType, int columnIndex, boolean nullable,
+                                    FieldVector vector, JdbcToArrowConfig config,
+                                    TemporalSupport temporalSupport, int lobMaxLength) {
+
+        // Consumers are created per iterator, so a Calendar per consumer keeps
+        // concurrently read result sets from sharing mutable Calendar state.
+        Calendar calendar = TimeUtils.newUtcCalendar();
 
         switch (arrowType.getTypeID()) {
             /*
@@ -73,16 +151,49 @@ public class OverriddenConsumer {
              * implementations ensure consistent behavior across different JDBC drivers.
              */
             case Date:
-                return DateConsumer.createConsumer((DateDayVector) vector, columnIndex, nullable, calendar);
+                return DateConsumer.createConsumer((DateDayVector) vector, columnIndex, nullable, calendar,
+                        temporalSupport.legacyDate());
             case Time:
-                return TimeConsumer.createConsumer((TimeMilliVector) vector, columnIndex, nullable);
+                if (vector instanceof TimeMicroVector) {
+                    return TimeConsumer.createConsumer((TimeMicroVector) vector, columnIndex, nullable,
+                            temporalSupport.legacyTime());
+                }
+                return TimeConsumer.createConsumer((TimeMilliVector) vector, columnIndex, nullable,
+                        temporalSupport.legacyTime());
             case Timestamp:
                 if (((ArrowType.Timestamp) arrowType).getTimezone() == null) {
-                    return TimestampConsumer.createConsumer((TimeStampMicroVector) vector, columnIndex, nullable);
+                    return TimestampConsumer.createConsumer((TimeStampMicroVector) vector, columnIndex, nullable, calendar,
+                            temporalSupport.legacyTimestamp());
                 }
                 else {
-                    return TimestampTZConsumer.createConsumer((TimeStampMicroTZVector) vector, columnIndex, nullable, calendar);
+                    return TimestampTZConsumer.createConsumer((TimeStampMicroTZVector) vector, columnIndex, nullable, calendar,
+                            temporalSupport.legacyTimestampTZ());
+                }
+            case Utf8:
+                if (lobMaxLength >= 0) {
+                    return LobConsumer.createConsumer((VarCharVector) vector, columnIndex, lobMaxLength);
                 }
+                return JdbcToArrowUtils.getConsumer(arrowType, columnIndex, nullable, vector, config);
+            case Binary:
+                if (lobMaxLength >= 0) {
+                    return LobConsumer.createConsumer((VarBinaryVector) vector, columnIndex, lobMaxLength);
+                }
+                return JdbcToArrowUtils.getConsumer(arrowType, columnIndex, nullable, vector, config);
+            case LargeUtf8:
+                return LobConsumer.createConsumer((LargeVarCharVector) vector, columnIndex, lobMaxLength);
+            case LargeBinary:
+                return LobConsumer.createConsumer((LargeVarBinaryVector) vector, columnIndex, lobMaxLength);
+            case List:
+                // Elements are read from Array.getResultSet(), whose second
+                // column holds the value. Building the element consumer here
+                // keeps it out of the per-column consumer getter, which is
+                // keyed by the top-level column index.
+                ListVector listVector = (ListVector) vector;
+                FieldVector elementVector = listVector.getDataVector();
+                JdbcConsumer elementConsumer = getConsumer(elementVector.getField().getType(),
+                        ARRAY_VALUE_COLUMN, elementVector.getField().isNullable(), elementVector, config,
+                        temporalSupport, -1);
+                return ArrayConsumer.createConsumer(listVector, elementConsumer, columnIndex, nullable);
             case Decimal:
                 ArrowType.Decimal decimalType = (ArrowType.Decimal) arrowType;
                 return DecimalConsumer.createConsumer(
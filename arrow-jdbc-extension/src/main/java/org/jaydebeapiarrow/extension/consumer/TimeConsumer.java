@@ -19,12 +19,13 @@ package org.jaydebeapiarrow.extension.consumer;
 
 import java.sql.ResultSet;
 import java.sql.SQLException;
-import java.util.concurrent.atomic.AtomicBoolean;
 
 import org.apache.arrow.adapter.jdbc.consumer.JdbcConsumer;
 import org.apache.arrow.adapter.jdbc.consumer.BaseConsumer;
+import org.apache.arrow.vector.TimeMicroVector;
 import org.apache.arrow.vector.TimeMilliVector;
 
+import org.jaydebeapiarrow.extension.TemporalSupport;
 import org.jaydebeapiarrow.extension.TimeUtils;
 
 
@@ -33,22 +34,50 @@ public abstract class TimeConsumer {
     }
 
     public static JdbcConsumer<TimeMilliVector> createConsumer(TimeMilliVector vector, int index, boolean nullable) {
+        return createConsumer(vector, index, nullable, new TemporalSupport.Strategy());
+    }
+
+    /**
+     * Creates a consumer for {@link TimeMilliVector} that shares the
+     * temporal read strategy 'strategy' with other consumers of the same driver.
+     */
+    public static JdbcConsumer<TimeMilliVector> createConsumer(TimeMilliVector vector, int index, boolean nullable, TemporalSupport.Strategy strategy) {
+        return (nullable ?
+                new NullableTimeConsumer(vector, index, strategy) :
+                new NonNullableTimeConsumer(vector, index, strategy)
+        );
+    }
+
+    /**
+     * Creates a consumer for {@link TimeMicroVector}, keeping the sub-second
+     * part of the value (time64[us]).
+     */
+    public static JdbcConsumer<TimeMicroVector> createConsumer(TimeMicroVector vector, int index, boolean nullable) {
+        return createConsumer(vector, index, nullable, new TemporalSupport.Strategy());
+    }
+
+    /**
+     * Creates a consumer for {@link TimeMicroVector} that shares the
+     * temporal read strategy 'strategy' with other consumers of the same driver.
+     */
+    public static JdbcConsumer<TimeMicroVector> createConsumer(TimeMicroVector vector, int index, boolean nullable, TemporalSupport.Strategy strategy) {
         return (nullable ?
-                new NullableTimeConsumer(vector, index) :
-                new NonNullableTimeConsumer(vector, index)
+                new NullableTimeMicroConsumer(vector, index, strategy) :
+                new NonNullableTimeMicroConsumer(vector, index, strategy)
         );
     }
 
     static class NonNullableTimeConsumer extends BaseConsumer<TimeMilliVector> {
 
-        private final AtomicBoolean useLegacy = new AtomicBoolean(false);
+        private final TemporalSupport.Strategy strategy;
 
-        public NonNullableTimeConsumer(TimeMilliVector vector, int index) {
+        public NonNullableTimeConsumer(TimeMilliVector vector, int index, TemporalSupport.Strategy strategy) {
             super(vector, index);
+            this.strategy = strategy;
         }
 
         public void consume(ResultSet resultSet) throws SQLException {
-            int millis = TimeUtils.parseTimeAsMilliSeconds(resultSet, columnIndexInResultSet, null, useLegacy);
+            int millis = TimeUtils.parseTimeAsMilliSeconds(resultSet, columnIndexInResultSet, null, strategy);
             vector.set(this.currentIndex, millis);
             ++this.currentIndex;
         }
@@ -56,18 +85,53 @@ public abstract class TimeConsumer {
 
     static class NullableTimeConsumer extends BaseConsumer<TimeMilliVector> {
 
-        private final AtomicBoolean useLegacy = new AtomicBoolean(false);
+        private final TemporalSupport.Strategy strategy;
 
-        public NullableTimeConsumer(TimeMilliVector vector, int index) {
+        public NullableTimeConsumer(TimeMilliVector vector, int index, TemporalSupport.Strategy strategy) {
             super(vector, index);
+            this.strategy = strategy;
         }
 
         public void consume(ResultSet resultSet) throws SQLException {
-            int millis = TimeUtils.parseTimeAsMilliSeconds(resultSet, columnIndexInResultSet, null, useLegacy);
+            int millis = TimeUtils.parseTimeAsMilliSeconds(resultSet, columnIndexInResultSet, null, strategy);
             if (!resultSet.wasNull()) {
                 vector.set(this.currentIndex, millis);
             }
             ++this.currentIndex;
         }
     }
+
+    static class NonNullableTimeMicroConsumer extends BaseConsumer<TimeMicroVector> {
+
+        private final TemporalSupport.Strategy strategy;
+
+        public NonNullableTimeMicroConsumer(TimeMicroVector vector, int index, TemporalSupport.Strategy strategy) {
+            super(vector, index);
+            this.strategy = strategy;
+        }
+
+        public void consume(ResultSet resultSet) throws SQLException {
+            long micros = TimeUtils.parseTimeAsMicroSeconds(resultSet, columnIndexInResultSet, null, strategy);
+            vector.set(this.currentIndex, micros);
+            ++this.currentIndex;
+        }
+    }
+
+    static class NullableTimeMicroConsumer extends BaseConsumer<TimeMicroVector> {
+
+        private final TemporalSupport.Strategy strategy;
+
+        public NullableTimeMicroConsumer(TimeMicroVector vector, int index, TemporalSupport.Strategy strategy) {
+            super(vector, index);
+            this.strategy = strategy;
+        }
+
+        public void consume(ResultSet resultSet) throws SQLException {
+            long micros = TimeUtils.parseTimeAsMicroSeconds(resultSet, columnIndexInResultSet, null, strategy);
+            if (!resultSet.wasNull()) {
+                vector.set(this.currentIndex, micros);
+            }
+            ++this.currentIndex;
+        }
+    }
 }
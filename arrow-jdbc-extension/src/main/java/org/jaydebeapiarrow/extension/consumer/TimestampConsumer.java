@@ -19,12 +19,13 @@ package org.jaydebeapiarrow.extension.consumer;
 
 import java.sql.ResultSet;
 import java.sql.SQLException;
-import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.Calendar;
 
 import org.apache.arrow.vector.TimeStampMicroVector;
 import org.apache.arrow.adapter.jdbc.consumer.JdbcConsumer;
 import org.apache.arrow.adapter.jdbc.consumer.BaseConsumer;
 
+import org.jaydebeapiarrow.extension.TemporalSupport;
 import org.jaydebeapiarrow.extension.TimeUtils;
 
 /**
@@ -38,10 +39,29 @@ public abstract class TimestampConsumer {
      */
     public static JdbcConsumer<TimeStampMicroVector> createConsumer(
             TimeStampMicroVector vector, int index, boolean nullable) {
+        return createConsumer(vector, index, nullable, TimeUtils.newUtcCalendar());
+    }
+
+    /**
+     * Creates a consumer for {@link TimeStampMicroVector}. The calendar is only
+     * used by the legacy getTimestamp() path and must not be shared with other
+     * consumers.
+     */
+    public static JdbcConsumer<TimeStampMicroVector> createConsumer(
+            TimeStampMicroVector vector, int index, boolean nullable, Calendar calendar) {
+        return createConsumer(vector, index, nullable, calendar, new TemporalSupport.Strategy());
+    }
+
+    /**
+     * Creates a consumer for {@link TimeStampMicroVector} that shares the
+     * temporal read strategy 'strategy' with other consumers of the same driver.
+     */
+    public static JdbcConsumer<TimeStampMicroVector> createConsumer(
+            TimeStampMicroVector vector, int index, boolean nullable, Calendar calendar, TemporalSupport.Strategy strategy) {
         if (nullable) {
-            return new NullableTimestampConsumer(vector, index);
+            return new NullableTimestampConsumer(vector, index, calendar, strategy);
         } else {
-            return new NonNullableTimestampConsumer(vector, index);
+            return new NonNullableTimestampConsumer(vector, index, calendar, strategy);
         }
     }
 
@@ -50,18 +70,21 @@ public abstract class TimestampConsumer {
      */
     static class NullableTimestampConsumer extends BaseConsumer<TimeStampMicroVector> {
 
-        private final AtomicBoolean useLegacy = new AtomicBoolean(false);
+        private final Calendar calendar;
+        private final TemporalSupport.Strategy strategy;
 
         /**
          * Instantiate a TimestampConsumer.
          */
-        public NullableTimestampConsumer(TimeStampMicroVector vector, int index) {
+        public NullableTimestampConsumer(TimeStampMicroVector vector, int index, Calendar calendar, TemporalSupport.Strategy strategy) {
             super(vector, index);
+            this.calendar = calendar;
+            this.strategy = strategy;
         }
 
         @Override
         public void consume(ResultSet resultSet) throws SQLException {
-            long microTimeStamp = TimeUtils.parseTimestampAsMicroSeconds(resultSet, columnIndexInResultSet, null, useLegacy);
+            long microTimeStamp = TimeUtils.parseTimestampAsMicroSeconds(resultSet, columnIndexInResultSet, calendar, strategy);
             if (!resultSet.wasNull()) {
                 // for fixed width vectors, we have allocated enough memory proactively,
                 // so there is no need to call the setSafe method here.
@@ -76,18 +99,21 @@ public abstract class TimestampConsumer {
      */
     static class NonNullableTimestampConsumer extends BaseConsumer<TimeStampMicroVector> {
 
-        private final AtomicBoolean useLegacy = new AtomicBoolean(false);
+        private final Calendar calendar;
+        private final TemporalSupport.Strategy strategy;
 
         /**
          * Instantiate a TimestampConsumer.
          */
-        public NonNullableTimestampConsumer(TimeStampMicroVector vector, int index) {
+        public NonNullableTimestampConsumer(TimeStampMicroVector vector, int index, Calendar calendar, TemporalSupport.Strategy strategy) {
             super(vector, index);
+            this.calendar = calendar;
+            this.strategy = strategy;
         }
 
         @Override
         public void consume(ResultSet resultSet) throws SQLException {
-            long microTimeStamp = TimeUtils.parseTimestampAsMicroSeconds(resultSet, columnIndexInResultSet, null, useLegacy);
+            long microTimeStamp = TimeUtils.parseTimestampAsMicroSeconds(resultSet, columnIndexInResultSet, calendar, strategy);
             vector.set(currentIndex, microTimeStamp);
             currentIndex++;
         }
@@ -21,12 +21,12 @@ import org.apache.arrow.adapter.jdbc.consumer.BaseConsumer;
 import org.apache.arrow.adapter.jdbc.consumer.JdbcConsumer;
 import org.apache.arrow.util.Preconditions;
 import org.apache.arrow.vector.TimeStampMicroTZVector;
+import org.jaydebeapiarrow.extension.TemporalSupport;
 import org.jaydebeapiarrow.extension.TimeUtils;
 
 import java.sql.ResultSet;
 import java.sql.SQLException;
 import java.util.Calendar;
-import java.util.concurrent.atomic.AtomicBoolean;
 
 
 /**
@@ -46,11 +46,20 @@ public abstract class TimestampTZConsumer {
      */
     public static JdbcConsumer<TimeStampMicroTZVector> createConsumer(
             TimeStampMicroTZVector vector, int index, boolean nullable, Calendar calendar) {
+        return createConsumer(vector, index, nullable, calendar, new TemporalSupport.Strategy());
+    }
+
+    /**
+     * Creates a consumer for {@link TimeStampMicroTZVector} that shares the
+     * temporal read strategy 'strategy' with other consumers of the same driver.
+     */
+    public static JdbcConsumer<TimeStampMicroTZVector> createConsumer(
+            TimeStampMicroTZVector vector, int index, boolean nullable, Calendar calendar, TemporalSupport.Strategy strategy) {
         Preconditions.checkArgument(calendar != null, "Calendar cannot be null");
         if (nullable) {
-            return new NullableTimestampConsumer(vector, index, calendar);
+            return new NullableTimestampConsumer(vector, index, calendar, strategy);
         } else {
-            return new NonNullableTimestampConsumer(vector, index, calendar);
+            return new NonNullableTimestampConsumer(vector, index, calendar, strategy);
         }
     }
 
@@ -59,20 +68,20 @@ public abstract class TimestampTZConsumer {
      */
     static class NullableTimestampConsumer extends BaseConsumer<TimeStampMicroTZVector> {
         protected final Calendar calendar;
-        private final AtomicBoolean useLegacy = new AtomicBoolean(false);
+        private final TemporalSupport.Strategy strategy;
 
         /**
          * Instantiate a TimestampConsumer.
          */
-        public NullableTimestampConsumer(TimeStampMicroTZVector vector, int index, Calendar calendar) {
+        public NullableTimestampConsumer(TimeStampMicroTZVector vector, int index, Calendar calendar, TemporalSupport.Strategy strategy) {
             super(vector, index);
             this.calendar = calendar;
-
+            this.strategy = strategy;
         }
 
         @Override
         public void consume(ResultSet resultSet) throws SQLException {
-            long microTimeStamp = TimeUtils.parseTimestampAsMicroSeconds(resultSet, columnIndexInResultSet, calendar, useLegacy);
+            long microTimeStamp = TimeUtils.parseTimestampAsMicroSeconds(resultSet, columnIndexInResultSet, calendar, strategy);
             if (!resultSet.wasNull()) {
                 // for fixed width vectors, we have allocated enough memory proactively,
                 // so there is no need to call the setSafe method here.
@@ -88,21 +97,22 @@ public abstract class TimestampTZConsumer {
     static class NonNullableTimestampConsumer extends BaseConsumer<TimeStampMicroTZVector> {
 
         protected final Calendar calendar;
-        private final AtomicBoolean useLegacy = new AtomicBoolean(false);
+        private final TemporalSupport.Strategy strategy;
 
         /**
          * Instantiate a TimestampConsumer.
          */
-        public NonNullableTimestampConsumer(TimeStampMicroTZVector vector, int index, Calendar calendar) {
+        public NonNullableTimestampConsumer(TimeStampMicroTZVector vector, int index, Calendar calendar, TemporalSupport.Strategy strategy) {
             super(vector, index);
             this.calendar = calendar;
+            this.strategy = strategy;
         }
 
         @Override
         public void consume(ResultSet resultSet) throws SQLException {
             // for fixed width vectors, we have allocated enough memory proactively,
             // so there is no need to call the setSafe method here.
-            long microTimeStamp = TimeUtils.parseTimestampAsMicroSeconds(resultSet, columnIndexInResultSet, calendar, useLegacy);
+            long microTimeStamp = TimeUtils.parseTimestampAsMicroSeconds(resultSet, columnIndexInResultSet, calendar, strategy);
             vector.set(currentIndex, microTimeStamp);
             currentIndex++;
         }
@@ -0,0 +1,118 @@
+"""
+Benchmark DECIMAL/NUMERIC fetch throughput of the decimal consumers.
+
+Compares the long-based consumer used for precision <= 18 against the
+BigDecimal consumer (forced with -Djaydebeapiarrow.decimal.fastPath=false).
+Each mode runs in its own process because the switch is read at JVM start.
+
+Usage:
+    python benchmark/decimal_benchmark.py --rows 1000000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import psycopg2
+
+JDBC_DRIVER_PATH = os.path.abspath("test/jars/postgresql-42.7.2.jar")
+JDBC_CLASS = "org.postgresql.Driver"
+DB_HOST = os.environ.get("BENCH_DB_HOST", "localhost")
+DB_PORT = os.environ.get("BENCH_DB_PORT", "15432")
+DB_NAME = os.environ.get("BENCH_DB_NAME", "test_db")
+DB_USER = os.environ.get("BENCH_DB_USER", "user")
+DB_PASS = os.environ.get("BENCH_DB_PASS", "password")
+JDBC_URL = f"jdbc:postgresql://{DB_HOST}:{DB_PORT}/{DB_NAME}"
+QUERY = "SELECT * FROM benchmark_decimal"
+ITERATIONS = 3
+
+MODES = {
+    "long": [],
+    "bigdecimal": ["-Djaydebeapiarrow.decimal.fastPath=false"],
+}
+
+
+def prepare_data(row_count):
+    conn = psycopg2.connect(host=DB_HOST, port=DB_PORT, dbname=DB_NAME,
+                            user=DB_USER, password=DB_PASS)
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        cur.execute("DROP TABLE IF EXISTS benchmark_decimal")
+        cur.execute("""
+            CREATE TABLE benchmark_decimal (
+                id NUMERIC(18, 0),
+                amount NUMERIC(12, 2),
+                rate NUMERIC(10, 4),
+                quantity NUMERIC(9, 0)
+            )
+        """)
+        cur.execute(f"""
+            INSERT INTO benchmark_decimal
+            SELECT g,
+                   round((random() * 1000000)::numeric, 2),
+                   round(random()::numeric, 4),
+                   (random() * 1000)::int
+            FROM generate_series(1, {row_count}) AS g
+        """)
+        cur.execute("ANALYZE benchmark_decimal")
+    finally:
+        cur.close()
+        conn.close()
+
+
+def run_worker(mode):
+    import jaydebeapiarrow
+
+    conn = jaydebeapiarrow.connect(JDBC_CLASS, JDBC_URL, [DB_USER, DB_PASS],
+                                   jars=[JDBC_DRIVER_PATH], jvm_args=MODES[mode])
+    durations = []
+    rows = 0
+    try:
+        for i in range(ITERATIONS):
+            start = time.time()
+            with conn.cursor() as curs:
+                curs.execute(QUERY)
+                table = curs.fetch_arrow_table()
+            dur = time.time() - start
+            durations.append(dur)
+            rows = table.num_rows
+            print(f"  Run {i+1}: {dur:.4f}s ({rows} rows)", flush=True)
+    finally:
+        conn.close()
+    print(f"RESULT {sum(durations) / len(durations):.4f} {rows}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000, help="Number of rows to generate")
+    parser.add_argument("--mode", choices=sorted(MODES), help="Run a single mode (worker)")
+    args = parser.parse_args()
+
+    if args.mode:
+        run_worker(args.mode)
+        return
+
+    print(f"Preparing {args.rows} rows in benchmark_decimal...", flush=True)
+    prepare_data(args.rows)
+
+    results = {}
+    for mode in MODES:
+        print(f"Mode: {mode}", flush=True)
+        out = subprocess.run([sys.executable, __file__, "--mode", mode],
+                             capture_output=True, text=True, check=True).stdout
+        print(out, end="")
+        avg, rows = out.strip().splitlines()[-1].split()[1:]
+        results[mode] = (float(avg), int(rows))
+
+    baseline = results["bigdecimal"][0]
+    print(f"\n{'Mode':<12} | {'Time (s)':<10} | Speedup")
+    print("-" * 36)
+    for mode, (avg, rows) in results.items():
+        speedup = baseline / avg if avg else 0
+        print(f"{mode:<12} | {avg:<10.4f} | {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark JVM startup: time from interpreter start to the first fetched row.
+
+Each run is a fresh Python process that imports jaydebeapiarrow, connects to
+an in-memory HSQLDB database and fetches one row, so the JVM start and the
+first class loading are included. Runs without a CDS archive are compared
+with runs that use one created by jaydebeapiarrow.build_cds_archive().
+
+The HSQLDB jar is taken from --jar, or from CLASSPATH when omitted.
+
+Usage:
+    python benchmark/startup_benchmark.py --jar test/jars/hsqldb.jar --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+JDBC_CLASS = "org.hsqldb.jdbcDriver"
+JDBC_URL = "jdbc:hsqldb:mem:startup_bench"
+
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import jaydebeapiarrow
+imported = time.perf_counter()
+jars, jvm_cds = json.loads(sys.argv[1])
+conn = jaydebeapiarrow.connect(%r, %r, ['SA', ''], jars=jars, jvm_cds=jvm_cds)
+connected = time.perf_counter()
+with conn.cursor() as cursor:
+    cursor.execute("VALUES (1)")
+    cursor.fetchall()
+done = time.perf_counter()
+conn.close()
+print(json.dumps([imported - start, connected - start, done - start]))
+""" % (JDBC_CLASS, JDBC_URL)
+
+
+def run_once(jars, jvm_cds):
+    wall_start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", CHILD_SCRIPT, json.dumps([jars, jvm_cds])],
+                            stdout=subprocess.PIPE, check=True)
+    wall = time.perf_counter() - wall_start
+    imported, connected, first_row = json.loads(result.stdout.decode().strip().splitlines()[-1])
+    return imported, connected, first_row, wall
+
+
+def report(label, timings):
+    columns = list(zip(*timings))
+    print(f"{label:<12}"
+          f" import {statistics.median(columns[0]):7.3f}s"
+          f"  connect {statistics.median(columns[1]):7.3f}s"
+          f"  first row {statistics.median(columns[2]):7.3f}s"
+          f"  process {statistics.median(columns[3]):7.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jar", action="append", default=[], help="JDBC driver jar (repeatable)")
+    parser.add_argument("--runs", type=int, default=5, help="Process starts per configuration")
+    args = parser.parse_args()
+    jars = [os.path.abspath(j) for j in args.jar]
+
+    import jaydebeapiarrow
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = os.path.join(tmp, "jaydebeapiarrow.jsa")
+        t0 = time.perf_counter()
+        jaydebeapiarrow.build_cds_archive(archive, JDBC_CLASS, jars=jars)
+        print(f"CDS archive built in {time.perf_counter() - t0:.2f}s "
+              f"({os.path.getsize(archive) / 1e6:.1f} MB)")
+
+        # Warm the OS page cache so both configurations read jars from memory.
+        run_once(jars, None)
+        print(f"Median of {args.runs} runs (times from interpreter start):")
+        report("no CDS", [run_once(jars, None) for _ in range(args.runs)])
+        report("CDS", [run_once(jars, archive) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark fetch latency on a temporal-heavy table.
+
+The table mixes DATE, TIME, TIMESTAMP and TIMESTAMPTZ columns. The
+PostgreSQL driver rejects getObject(..., LocalDateTime.class) for
+timestamptz, so the timestamptz consumers fall back to getTimestamp().
+That fallback is probed once per driver; the benchmark reports the first
+query separately from the following ones, and runs both many small queries
+(where a per-query probe would dominate) and one full scan.
+
+Usage:
+    python benchmark/temporal_benchmark.py --rows 1000000 --queries 500
+"""
+import argparse
+import os
+import time
+
+import psycopg2
+
+JDBC_DRIVER_PATH = os.path.abspath("test/jars/postgresql-42.7.2.jar")
+JDBC_CLASS = "org.postgresql.Driver"
+DB_HOST = os.environ.get("BENCH_DB_HOST", "localhost")
+DB_PORT = os.environ.get("BENCH_DB_PORT", "15432")
+DB_NAME = os.environ.get("BENCH_DB_NAME", "test_db")
+DB_USER = os.environ.get("BENCH_DB_USER", "user")
+DB_PASS = os.environ.get("BENCH_DB_PASS", "password")
+JDBC_URL = f"jdbc:postgresql://{DB_HOST}:{DB_PORT}/{DB_NAME}"
+SMALL_QUERY = "SELECT * FROM benchmark_temporal LIMIT 10"
+FULL_QUERY = "SELECT * FROM benchmark_temporal"
+ITERATIONS = 3
+
+
+def prepare_data(row_count):
+    conn = psycopg2.connect(host=DB_HOST, port=DB_PORT, dbname=DB_NAME,
+                            user=DB_USER, password=DB_PASS)
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        cur.execute("DROP TABLE IF EXISTS benchmark_temporal")
+        cur.execute("""
+            CREATE TABLE benchmark_temporal (
+                d DATE,
+                t TIME,
+                ts TIMESTAMP,
+                ts2 TIMESTAMP,
+                tstz TIMESTAMPTZ,
+                tstz2 TIMESTAMPTZ
+            )
+        """)
+        cur.execute(f"""
+            INSERT INTO benchmark_temporal
+            SELECT DATE '2000-01-01' + (g % 10000),
+                   TIME '00:00:00' + (g % 86400) * INTERVAL '1 second',
+                   TIMESTAMP '2000-01-01' + g * INTERVAL '1 second',
+                   TIMESTAMP '2000-01-01' + g * INTERVAL '1 millisecond',
+                   TIMESTAMPTZ '2000-01-01 00:00:00+00' + g * INTERVAL '1 second',
+                   TIMESTAMPTZ '2000-01-01 00:00:00+00' + g * INTERVAL '1 millisecond'
+            FROM generate_series(1, {row_count}) AS g
+        """)
+        cur.execute("ANALYZE benchmark_temporal")
+    finally:
+        cur.close()
+        conn.close()
+
+
+def fetch(conn, query):
+    with conn.cursor() as curs:
+        curs.execute(query)
+        return curs.fetch_arrow_table().num_rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000, help="Number of rows to generate")
+    parser.add_argument("--queries", type=int, default=500, help="Number of small queries to run")
+    args = parser.parse_args()
+
+    print(f"Preparing {args.rows} rows in benchmark_temporal...", flush=True)
+    prepare_data(args.rows)
+
+    import jaydebeapiarrow
+
+    conn = jaydebeapiarrow.connect(JDBC_CLASS, JDBC_URL, [DB_USER, DB_PASS],
+                                   jars=[JDBC_DRIVER_PATH])
+    try:
+        start = time.time()
+        fetch(conn, SMALL_QUERY)
+        first = time.time() - start
+
+        start = time.time()
+        for _ in range(args.queries):
+            fetch(conn, SMALL_QUERY)
+        small = (time.time() - start) / args.queries
+
+        durations = []
+        rows = 0
+        for i in range(ITERATIONS):
+            start = time.time()
+            rows = fetch(conn, FULL_QUERY)
+            dur = time.time() - start
+            durations.append(dur)
+            print(f"  Full scan run {i+1}: {dur:.4f}s ({rows} rows)", flush=True)
+    finally:
+        conn.close()
+
+    print(f"\n{'Measurement':<28} | Time (ms)")
+    print("-" * 42)
+    print(f"{'First small query':<28} | {first * 1000:.3f}")
+    print(f"{'Small query (avg)':<28} | {small * 1000:.3f}")
+    print(f"{'Full scan (avg)':<28} | {sum(durations) / len(durations) * 1000:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,28 +21,44 @@
 # 1. Remove py2 & Jython support
 # 2. Enforce typing for Decimal and temporal types
 
-import importlib.metadata
+# Importing the package only loads the standard library modules below.
+# pyarrow (through lib/arrow_utils.py) and jpype are imported on the first
+# connect() or fetch, and __version__ is looked up on first access, so
+# code that only needs the type objects or exceptions stays cheap to
+# import. See __getattr__ and _arrow_utils().
 import re
-
-__version__ = importlib.metadata.version("JayDeBeApiArrow")
-_ver_match = re.match(r"^(\d+)\.(\d+)\.(\d+)", __version__)
-__version_info__ = tuple(int(x) for x in _ver_match.groups()) if _ver_match else (0, 0, 0)
-
 import datetime
 from decimal import Decimal
 import glob
+import json
 import os
 import threading
 import time
 import sys
 import warnings
 
-from jaydebeapiarrow.lib.arrow_utils import \
-    convert_jdbc_rs_to_arrow_iterator, \
-    read_rows_from_arrow_iterator, \
-    create_pyarrow_batches_from_list, \
-    add_pyarrow_batches_to_statement, \
-    fetch_next_batch
+from jaydebeapiarrow.lib.stats import \
+    QueryStats, \
+    add_trace_hook, \
+    remove_trace_hook, \
+    emit as _emit_trace, \
+    log_query as _log_query, \
+    summarize_parameters as _summarize_parameters
+from jaydebeapiarrow.lib import metrics as _metrics
+from jaydebeapiarrow.lib.metrics import REGISTRY as METRICS
+from jaydebeapiarrow.lib.tracing import \
+    enable_tracing, \
+    disable_tracing, \
+    span as _trace_span, \
+    traced as _traced, \
+    traced_generator as _traced_generator
+from jaydebeapiarrow.lib.driver_profiles import \
+    DriverProfile, \
+    register_driver_profile, \
+    unregister_driver_profile, \
+    get_driver_profile, \
+    select_driver_profile, \
+    DEFAULT_PROFILE
 
 
 def _is_jvm_started():
@@ -117,9 +133,12 @@ old_jpype = False
 # isJVMStarted() return False and both attempt to start the JVM,
 # causing a crash.  The lock is only held briefly to check/set the
 # flag; startJVM() runs _outside_ the lock to avoid potential
-# deadlocks if JPype spawns threads during initialisation.
+# deadlocks if JPype spawns threads during initialisation.  Threads that
+# find the JVM starting wait on _jvm_start_done, which the starting thread
+# sets when it is done, whether startup succeeded or not.
 _jvm_startup_lock = threading.Lock()
 _jvm_starting = False
+_jvm_start_done = None
 
 def _build_java_exception_message(exc):
     """Build a clean error message from a Java exception, walking the cause
@@ -178,7 +197,7 @@ def _dynamic_load_driver(jclassname, jars):
     Java's DriverManager refuses to use drivers not loaded by the system
     classloader.  This function works around that restriction by creating a
     URLClassLoader for the new JARs, instantiating the driver through it, and
-    registering a ``DriverShim`` proxy (loaded on the system classloader) with
+    registering a ``DriverShim`` (a Java class on the system classloader) with
     DriverManager.
 
     Args:
@@ -186,7 +205,8 @@ def _dynamic_load_driver(jclassname, jars):
         jars: List of JAR file paths to load the driver from.
 
     Returns:
-        The URLClassLoader used to load the driver.
+        (url_cl, driver): the URLClassLoader used to load the driver and
+        the driver instance.
     """
     import jpype
 
@@ -200,48 +220,251 @@ def _dynamic_load_driver(jclassname, jars):
     driver_cls = url_cl.loadClass(jclassname)
     driver = driver_cls.getDeclaredConstructor().newInstance()
 
-    # Create a DriverShim proxy and register it with DriverManager.
-    # The shim is a Python-implemented java.sql.Driver that delegates
-    # every call to the real driver loaded via URLClassLoader.
-    # DriverManager accepts the shim because it is loaded by the system CL.
-
-    @jpype.JImplements("java.sql.Driver")
-    class DriverShim:
-        def __init__(self, _driver):
-            self._driver = _driver
-        @jpype.JOverride
-        def connect(self, u, info):
-            return self._driver.connect(u, info)
-        @jpype.JOverride
-        def acceptsURL(self, u):
-            return self._driver.acceptsURL(u)
-        @jpype.JOverride
-        def getPropertyInfo(self, u, info):
-            return self._driver.getPropertyInfo(u, info)
-        @jpype.JOverride
-        def getMajorVersion(self):
-            return self._driver.getMajorVersion()
-        @jpype.JOverride
-        def getMinorVersion(self):
-            return self._driver.getMinorVersion()
-        @jpype.JOverride
-        def jdbcCompliant(self):
-            return self._driver.jdbcCompliant()
-        @jpype.JOverride
-        def getParentLogger(self):
-            return self._driver.getParentLogger()
-
+    # Register a DriverShim delegating to the real driver with DriverManager.
+    # The shim is a Java class from the extension jar, so DriverManager
+    # accepts it (it is loaded by the system CL) and calls through it do not
+    # bounce back into Python.
+    DriverShim = jpype.JClass('org.jaydebeapiarrow.extension.DriverShim')
     jpype.java.sql.DriverManager.registerDriver(DriverShim(driver))
 
-    # Update thread context classloader so the driver can find its own resources
-    jpype.java.lang.Thread.currentThread().setContextClassLoader(url_cl)
+    return url_cl, driver
+
+def _find_registered_driver(jclassname):
+    """Load 'jclassname' on the system classloader, which registers it with
+    DriverManager, and return the registered instance, or None if the class
+    is not a registered java.sql.Driver.
+    """
+    import jpype
+    jpype.JClass(jclassname)
+    drivers = jpype.java.sql.DriverManager.getDrivers()
+    while drivers.hasMoreElements():
+        driver = drivers.nextElement()
+        if driver.getClass().getName() == jclassname:
+            return driver
+    return None
+
+# Loaded drivers keyed by (jclassname, jars); jars is None unless the
+# driver was loaded with dynamic_classpath.  Values are (class_loader,
+# driver), class_loader being None for drivers on the system classpath.
+# Reusing the entry avoids a URLClassLoader and a DriverShim per connect(),
+# which kept every loaded copy of the driver classes alive.
+_driver_cache = {}
+_driver_cache_lock = threading.Lock()
+
+def _load_driver(jclassname, jars, dynamic):
+    key = (jclassname, tuple(jars) if dynamic else None)
+    with _driver_cache_lock:
+        entry = _driver_cache.get(key)
+        if entry is None:
+            if dynamic:
+                entry = _dynamic_load_driver(jclassname, jars)
+            else:
+                entry = (None, _find_registered_driver(jclassname))
+            _driver_cache[key] = entry
+            _metrics.DRIVER_CACHE_MISSES.inc()
+        else:
+            _metrics.DRIVER_CACHE_HITS.inc()
+    return entry
+
+def _driver_properties(driver_args):
+    """Build the java.util.Properties DriverManager.getConnection would
+    pass to Driver.connect, or None for argument forms it does not map.
+    """
+    import jpype
+    info = jpype.java.util.Properties()
+    if isinstance(driver_args, dict):
+        for k, v in driver_args.items():
+            info.setProperty(k, v)
+    elif len(driver_args) == 2:
+        user, password = driver_args
+        if user is not None:
+            info.setProperty('user', user)
+        if password is not None:
+            info.setProperty('password', password)
+    elif len(driver_args) != 0:
+        return None
+    return info
+
 
-    return url_cl
+def _jvm_startup_args(libs, jvm_args=None, jvm_cds=None):
+    args = []
 
+    if libs:
+        # path to shared libraries
+        libs_path = os.path.pathsep.join(libs)
+        args.append('-Djava.library.path=%s' % libs_path)
+
+    # Known issue: some JDBC drivers (notably IBM Db2) use the JVM's
+    # default charset for string conversion.  When the default is not
+    # UTF-8, non-ASCII characters (German umlauts, CJK, emoji) cause
+    # CharConversionException during result-set traversal.  Users who
+    # encounter this should pass jvm_args=['-Dfile.encoding=UTF-8']
+    # when calling connect().
+    # TODO: document this encoding requirement in user-facing docs
+    # and consider exposing a dedicated encoding parameter in connect().
+
+    # Add-opens for Apache Arrow on Java 9+
+    args.append('--add-opens=java.base/java.nio=ALL-UNNAMED')
+    # Drill's javassist needs reflective access to ClassLoader.defineClass
+    args.append('--add-opens=java.base/java.lang=ALL-UNNAMED')
+    if jvm_cds:
+        if os.path.exists(jvm_cds):
+            args.append('-XX:SharedArchiveFile=%s' % jvm_cds)
+        else:
+            import logging
+            logging.getLogger(__name__).warning(
+                "CDS archive %s not found; starting the JVM without it. "
+                "Create it with build_cds_archive().", jvm_cds)
+    # User-supplied extra JVM arguments (e.g. logging suppression)
+    args.extend(jvm_args or [])
+    return args
+
+def _build_classpath(jars):
+    """Return the JVM classpath: 'jars', then CLASSPATH, then the extension
+    jar, without duplicates. The order is kept stable across processes, as a
+    CDS archive is only used when the classpath matches the one it was
+    created with.
+    """
+    class_path = []
+    if jars:
+        class_path.extend(jars)
+    class_path.extend(_get_classpath())
+    class_path.extend(_get_arrow_jar_paths())
+    return list(dict.fromkeys(class_path))
+
+def _claim_jvm_start():
+    """Decide whether the calling thread starts the JVM. Returns
+    (should_start, done_event); done_event is None if the JVM is running.
+    """
+    global _jvm_starting, _jvm_start_done
+    # Brief lock: decide who starts the JVM (if needed).
+    with _jvm_startup_lock:
+        if _is_jvm_started():
+            return False, None
+        elif _jvm_starting:
+            # Another thread is already starting the JVM; wait for it.
+            return False, _jvm_start_done
+        else:
+            _jvm_starting = True
+            _jvm_start_done = threading.Event()
+            return True, _jvm_start_done
 
-def _jdbc_connect_jpype(jclassname, url, driver_args, jars, libs, jvm_args=None, experimental=None):
+def _run_jvm_start(done, jars, libs, jvm_args=None, jvm_cds=None):
+    """Start the JVM after _claim_jvm_start() returned should_start."""
     import jpype
     global _jvm_starting, _jvm_started_pid
+    try:
+        class_path = _build_classpath(jars)
+        args = _jvm_startup_args(libs, jvm_args, jvm_cds)
+
+        # jvm_path = ('/usr/lib/jvm/java-6-openjdk'
+        #             '/jre/lib/i386/client/libjvm.so')
+        jvm_path = jpype.getDefaultJVMPath()
+        global old_jpype
+        if hasattr(jpype, '__version__'):
+            try:
+                ver_match = re.match(r'\d+\.\d+', jpype.__version__)
+                if ver_match:
+                    jpype_ver = float(ver_match.group(0))
+                    if jpype_ver < 0.7:
+                        old_jpype = True
+            except ValueError:
+                pass
+        if old_jpype:
+            jpype.startJVM(jvm_path, *args,
+                           classpath=class_path)
+        else:
+            jpype.startJVM(jvm_path, *args, ignoreUnrecognized=True,
+                           convertStrings=True,
+                           classpath=class_path)
+        _jvm_started_pid = os.getpid()
+    finally:
+        with _jvm_startup_lock:
+            _jvm_starting = False
+        done.set()
+
+def _wait_for_jvm(done):
+    """Wait until the thread starting the JVM is done. If its startup
+    failed, return anyway so the caller sees the original exception (or
+    retries on the next connect()).
+    """
+    if done is not None and not done.wait(120) and not _is_jvm_started():
+        raise RuntimeError("Timed out waiting for JVM to start")
+
+def _attach_thread():
+    import jpype
+    if not jpype.java.lang.Thread.isAttached():
+        jpype.java.lang.Thread.attach()
+        jpype.java.lang.Thread.currentThread().setContextClassLoader(jpype.java.lang.ClassLoader.getSystemClassLoader())
+
+def _start_jvm_jpype(jars, libs, jvm_args=None, jvm_cds=None):
+    """Start the JVM unless it is running, or wait for the thread that is
+    starting it.
+    """
+    should_start, done = _claim_jvm_start()
+    if should_start:
+        _run_jvm_start(done, jars, libs, jvm_args=jvm_args, jvm_cds=jvm_cds)
+    else:
+        _wait_for_jvm(done)
+    _attach_thread()
+
+def _preload_classes():
+    """Load the classes and modules the first query needs, so it does not
+    pay for loading them.
+    """
+    import jpype
+    jpype.JClass('org.jaydebeapiarrow.extension.CdsWarmup').main(jpype.JArray(jpype.JString)([]))
+    import pyarrow.jvm
+
+def start_jvm(jars=None, libs=None, jvm_args=None, jvm_cds=None, background=True):
+    """Start the JVM ahead of the first connect().
+
+    The arguments mean the same as for connect(). Besides starting the JVM,
+    this loads the extension, Arrow and consumer classes and pyarrow.jvm, so
+    the first query does not load them either. With background=True
+    (default) the work runs on a daemon thread and the started thread is
+    returned; a connect() made meanwhile waits for the JVM instead of
+    starting another one. With background=False this returns None once the
+    JVM is ready.
+
+    Does nothing if the JVM is already running or being started.
+    """
+    if isinstance(jars, str):
+        jars = [jars]
+    if isinstance(libs, str):
+        libs = [libs]
+    should_start, done = _claim_jvm_start()
+    if not should_start:
+        if not background:
+            _wait_for_jvm(done)
+        return None
+
+    def run():
+        import jpype
+        try:
+            _run_jvm_start(done, jars, libs, jvm_args=jvm_args, jvm_cds=jvm_cds)
+            _attach_thread()
+            _preload_classes()
+        except Exception:
+            if not background:
+                raise
+            import logging
+            logging.getLogger(__name__).warning(
+                "Background JVM start failed; connect() will start it", exc_info=True)
+        finally:
+            if background and _is_jvm_started() and jpype.java.lang.Thread.isAttached():
+                jpype.java.lang.Thread.detach()
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name='jaydebeapiarrow-jvm-start', daemon=True)
+    thread.start()
+    return thread
+
+def _jdbc_connect_jpype(jclassname, url, driver_args, jars, libs, jvm_args=None, experimental=None,
+                        jvm_cds=None):
+    import jpype
 
     _experimental = experimental or {}
 
@@ -256,104 +479,29 @@ def _jdbc_connect_jpype(jclassname, url, driver_args, jars, libs, jvm_args=None,
                 "lazy connections)." % (_jvm_started_pid, os.getpid())
             )
 
-    # Brief lock: decide who starts the JVM (if needed).
-    with _jvm_startup_lock:
-        if _is_jvm_started():
-            should_start = False
-        elif _jvm_starting:
-            # Another thread is already starting the JVM; wait for it.
-            should_start = False
-        else:
-            _jvm_starting = True
-            should_start = True
-
-    if should_start:
-        try:
-            class_path = []
-            if jars:
-                class_path.extend(jars)
-            class_path.extend(_get_classpath())
-            class_path.extend(_get_arrow_jar_paths())
-            class_path = list(set(class_path))
-
-            args = []
-
-            if libs:
-                # path to shared libraries
-                libs_path = os.path.pathsep.join(libs)
-                args.append('-Djava.library.path=%s' % libs_path)
-
-            # Known issue: some JDBC drivers (notably IBM Db2) use the JVM's
-            # default charset for string conversion.  When the default is not
-            # UTF-8, non-ASCII characters (German umlauts, CJK, emoji) cause
-            # CharConversionException during result-set traversal.  Users who
-            # encounter this should pass jvm_args=['-Dfile.encoding=UTF-8']
-            # when calling connect().
-            # TODO: document this encoding requirement in user-facing docs
-            # and consider exposing a dedicated encoding parameter in connect().
-
-            # Add-opens for Apache Arrow on Java 9+
-            args.append('--add-opens=java.base/java.nio=ALL-UNNAMED')
-            # Drill's javassist needs reflective access to ClassLoader.defineClass
-            args.append('--add-opens=java.base/java.lang=ALL-UNNAMED')
-            # User-supplied extra JVM arguments (e.g. logging suppression)
-            args.extend(jvm_args or [])
-
-            # jvm_path = ('/usr/lib/jvm/java-6-openjdk'
-            #             '/jre/lib/i386/client/libjvm.so')
-            jvm_path = jpype.getDefaultJVMPath()
-            global old_jpype
-            if hasattr(jpype, '__version__'):
-                try:
-                    ver_match = re.match(r'\d+\.\d+', jpype.__version__)
-                    if ver_match:
-                        jpype_ver = float(ver_match.group(0))
-                        if jpype_ver < 0.7:
-                            old_jpype = True
-                except ValueError:
-                    pass
-            if old_jpype:
-                jpype.startJVM(jvm_path, *args,
-                               classpath=class_path)
-            else:
-                jpype.startJVM(jvm_path, *args, ignoreUnrecognized=True,
-                               convertStrings=True,
-                               classpath=class_path)
-            _jvm_started_pid = os.getpid()
-        finally:
-            with _jvm_startup_lock:
-                _jvm_starting = False
-    elif not _is_jvm_started():
-        # Another thread is starting the JVM; spin-wait until ready.
-        waited = 0
-        while not _is_jvm_started():
-            if not _jvm_starting:
-                # Startup thread failed; bail out so the caller sees the
-                # original exception (or retries on the next connect()).
-                break
-            time.sleep(0.05)
-            waited += 0.05
-            if waited > 120:
-                raise RuntimeError("Timed out waiting for JVM to start")
-    if not jpype.java.lang.Thread.isAttached():
-        jpype.java.lang.Thread.attach()
-        jpype.java.lang.Thread.currentThread().setContextClassLoader(jpype.java.lang.ClassLoader.getSystemClassLoader())
+    _start_jvm_jpype(jars, libs, jvm_args=jvm_args, jvm_cds=jvm_cds)
     try:
         import pyarrow.jvm
     except ImportError as e:
         raise RuntimeError(f"Failed to import pyarrow.jvm ({e}). Looks like JVM is not started. Thisis required for jaydebeapiarrow to work.")
 
-    # register driver for DriverManager
-    if _experimental.get('dynamic_classpath') and jars and _is_jvm_started():
-        _dynamic_load_driver(jclassname, jars)
-    else:
-        jpype.JClass(jclassname)
-
+    # Load (or reuse) the driver and connect through it directly instead of
+    # letting DriverManager try every registered driver.
+    dynamic = bool(_experimental.get('dynamic_classpath') and jars and _is_jvm_started())
+    class_loader, driver = _load_driver(jclassname, jars, dynamic)
+    if class_loader is not None:
+        # Update thread context classloader so the driver can find its own resources
+        jpype.java.lang.Thread.currentThread().setContextClassLoader(class_loader)
+
+    info = _driver_properties(driver_args)
+    if driver is not None and info is not None:
+        jconn = driver.connect(url, info)
+        if jconn is not None:
+            return jconn
+
+    # The driver does not accept the URL (another registered driver may),
+    # or the arguments need DriverManager's own handling.
     if isinstance(driver_args, dict):
-        Properties = jpype.java.util.Properties
-        info = Properties()
-        for k, v in driver_args.items():
-            info.setProperty(k, v)
         dargs = [ info ]
     else:
         dargs = driver_args
@@ -367,10 +515,23 @@ def _get_classpath():
         orig_cp = os.environ['CLASSPATH']
     except KeyError:
         return []
-    expanded_cp = []
-    for i in orig_cp.split(os.path.pathsep):
-        expanded_cp.extend(_jar_glob(i))
-    return _deduplicate_jars(expanded_cp)
+    from jaydebeapiarrow.lib import classpath_cache
+    return classpath_cache.resolve(orig_cp, _deduplicate_jars)
+
+def resolved_classpath(jars=None):
+    """Return the classpath the JVM is (or would be) started with for
+    'jars': the given jars, the expanded CLASSPATH entries and the
+    arrow-jdbc-extension jar, in order. Wildcard CLASSPATH entries come from
+    the persistent classpath cache when their directories are unchanged.
+    """
+    if isinstance(jars, str):
+        jars = [jars]
+    return _build_classpath(jars)
+
+def clear_classpath_cache():
+    """Forget the cached CLASSPATH expansions of every process."""
+    from jaydebeapiarrow.lib import classpath_cache
+    classpath_cache.clear()
 
 def _deduplicate_jars(jars):
     """Keep only the newest JAR when duplicates (same basename) exist."""
@@ -417,8 +578,50 @@ def _prepare_jpype():
     _jdbc_connect = _jdbc_connect_jpype
     global _handle_sql_exception
     _handle_sql_exception = _handle_sql_exception_jpype
-    from jaydebeapiarrow.lib import arrow_utils
-    arrow_utils._handle_sql_exception = _handle_sql_exception_jpype
+    if _arrow_utils_module is not None:
+        _arrow_utils_module._handle_sql_exception = _handle_sql_exception_jpype
+
+# Names re-exported from lib/arrow_utils.py, resolved by __getattr__.
+_ARROW_UTILS_EXPORTS = frozenset((
+    'convert_jdbc_rs_to_arrow_iterator',
+    'export_result_set_schema',
+    'read_column_metadata',
+    'read_rows_from_arrow_iterator',
+    'create_pyarrow_batches_from_list',
+    'add_pyarrow_batches_to_statement',
+    'create_java_driver_profile',
+    'create_java_conversion_options',
+    'fetch_next_batch',
+    '_import_batch_via_cdata',
+    'StringInternCache',
+    'DEFAULT_INTERN_CACHE_SIZE',
+))
+
+_arrow_utils_module = None
+
+def _arrow_utils():
+    """Return lib/arrow_utils.py, importing it (and pyarrow) on first use."""
+    global _arrow_utils_module
+    if _arrow_utils_module is None:
+        from jaydebeapiarrow.lib import arrow_utils
+        arrow_utils._handle_sql_exception = _handle_sql_exception
+        _arrow_utils_module = arrow_utils
+    return _arrow_utils_module
+
+def __getattr__(name):
+    """Compute the attributes that are costly to set up at import time on
+    first access (PEP 562).
+    """
+    if name in ('__version__', '__version_info__'):
+        import importlib.metadata
+        version = importlib.metadata.version("JayDeBeApiArrow")
+        ver_match = re.match(r"^(\d+)\.(\d+)\.(\d+)", version)
+        globals()['__version__'] = version
+        globals()['__version_info__'] = tuple(int(x) for x in ver_match.groups()) if ver_match else (0, 0, 0)
+        return globals()[name]
+    if name in _ARROW_UTILS_EXPORTS:
+        return getattr(_arrow_utils(), name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 _prepare_jpype()
 
@@ -430,6 +633,53 @@ def _get_arrow_jar_paths():
     return arrow_jars
 
 
+_CDS_DUMP_SCRIPT = """
+import json, sys
+import jaydebeapiarrow
+jaydebeapiarrow._dump_cds_archive(*json.loads(sys.argv[1]))
+"""
+
+def build_cds_archive(archive_path, jclassname=None, jars=None, libs=None, jvm_args=None):
+    """Create a Class Data Sharing (AppCDS) archive for faster JVM startup.
+
+    A child Python process starts the JVM the way connect() would, loads
+    the extension and Arrow classes (and 'jclassname', the JDBC driver
+    class, if given) and writes the archive to 'archive_path' on exit.
+    Pass the path as connect(..., jvm_cds=archive_path) afterwards.
+
+    The archive is only used by a JVM of the same build, started with the
+    same jars, libs and jvm_args; CLASSPATH must not change in between.
+    Otherwise the JVM ignores the archive and starts as usual. Requires
+    Java 13 or later. Returns 'archive_path'.
+    """
+    import subprocess
+    if isinstance(jars, str):
+        jars = [jars]
+    if isinstance(libs, str):
+        libs = [libs]
+    archive_path = os.path.abspath(archive_path)
+    if os.path.exists(archive_path):
+        os.remove(archive_path)
+    payload = json.dumps([archive_path, jclassname, list(jars or []), list(libs or []), list(jvm_args or [])])
+    result = subprocess.run([sys.executable, '-c', _CDS_DUMP_SCRIPT, payload],
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    if result.returncode != 0 or not os.path.exists(archive_path):
+        raise InterfaceError(
+            "Could not create CDS archive %s (Java 13 or later is required):\n%s"
+            % (archive_path, result.stdout.decode(errors='replace')))
+    return archive_path
+
+def _dump_cds_archive(archive_path, jclassname, jars, libs, jvm_args):
+    """Run in the child process of build_cds_archive(). The archive is
+    written when the JVM shuts down at interpreter exit.
+    """
+    import jpype
+    _start_jvm_jpype(jars, libs, jvm_args=list(jvm_args) + ['-XX:ArchiveClassesAtExit=%s' % archive_path])
+    names = [jclassname] if jclassname else []
+    jpype.JClass('org.jaydebeapiarrow.extension.CdsWarmup').main(jpype.JArray(jpype.JString)(names))
+    import pyarrow.jvm
+
+
 apilevel = '2.0'
 threadsafety = 1
 paramstyle = 'qmark'
@@ -462,6 +712,14 @@ class DBAPITypeObject(object):
     def __repr__(self):
         return 'DBAPITypeObject(%s)' % ", ".join([repr(i) for i in self.values])
     @classmethod
+    def _from_jdbc_type(cls, jdbc_type_const):
+        if jdbc_type_const == 0:
+            # PEP-0249: SQL NULL values are represented by the
+            # Python None singleton
+            return None
+        return cls._map_jdbc_type_to_dbapi(jdbc_type_const)
+
+    @classmethod
     def _map_jdbc_type_to_dbapi(cls, jdbc_type_const):
         global _jdbc_const_to_name
         if _jdbc_const_to_name is None:
@@ -575,7 +833,8 @@ def TimestampFromTicks(ticks):
     return Timestamp(*time.localtime(ticks)[:6])
 
 # DB-API 2.0 Module Interface connect constructor
-def connect(jclassname, url, driver_args=None, jars=None, libs=None, jvm_args=None, experimental=None):
+def connect(jclassname, url, driver_args=None, jars=None, libs=None, jvm_args=None, experimental=None,
+            decimal_mode='exact', jvm_cds=None, slow_query_ms=None, large_result_rows=None):
     """Open a connection to a database using a JDBC driver and return
     a Connection instance.
 
@@ -594,12 +853,33 @@ def connect(jclassname, url, driver_args=None, jars=None, libs=None, jvm_args=No
     jvm_args: Optional list of extra JVM arguments passed to startJVM().
           Only takes effect on the first connect() call (when the JVM
           is started). Ignored on subsequent calls.
+    jvm_cds: Optional path of a Class Data Sharing archive created with
+          build_cds_archive(). The JVM maps the archived classes instead
+          of loading them from the jars, which shortens startup. Like
+          jvm_args, only the call that starts the JVM uses it; a missing
+          archive is skipped with a warning.
+    decimal_mode: How DECIMAL/NUMERIC columns are read. 'exact' (default)
+          returns Decimal values (decimal128). 'int_when_scale0' reads
+          columns with scale 0 and precision <= 18 as int64.
+          'float64' reads every DECIMAL/NUMERIC column as float64.
+          Can be overridden per cursor.
+    slow_query_ms: Log queries whose phases (see Cursor.stats) add up to
+          at least this many milliseconds, once the result set is read to
+          the end or the query is closed.
+    large_result_rows: Log queries as soon as they have fetched at least
+          this many rows.
+          Both log through the 'jaydebeapiarrow.queries' logger at WARNING
+          level, with the SQL, the number and types of the parameters, the
+          result size and the phase timings.
     experimental: Optional dict of experimental feature flags.
           Supported keys:
             dynamic_classpath (bool): If True, allow loading JDBC drivers
               from JARs after the JVM has already been started, using a
               DriverShim proxy.  This also bypasses the fork-after-JVM-start
               guard, making it suitable for gunicorn --preload workers.
+            arrow_description (bool): If True, Cursor.description is built
+              from the Arrow schema of the result set, whose fields carry
+              the JDBC column metadata, instead of from ResultSetMetaData.
     """
     if not isinstance(url, str):
         raise ProgrammingError(
@@ -625,8 +905,43 @@ def connect(jclassname, url, driver_args=None, jars=None, libs=None, jvm_args=No
         libs = []
     if experimental is None:
         experimental = {}
-    jconn = _jdbc_connect(jclassname, url, driver_args, jars, libs, jvm_args=jvm_args, experimental=experimental)
-    return Connection(jconn, jclassname)
+    _check_decimal_mode(decimal_mode)
+    _check_threshold('slow_query_ms', slow_query_ms)
+    _check_threshold('large_result_rows', large_result_rows)
+    with _trace_span('Connection.connect', attributes={'db.jdbc.driver_classname': jclassname}):
+        jconn = _jdbc_connect(jclassname, url, driver_args, jars, libs, jvm_args=jvm_args,
+                              experimental=experimental, jvm_cds=jvm_cds)
+        return Connection(jconn, jclassname, experimental=experimental, decimal_mode=decimal_mode,
+                          slow_query_ms=slow_query_ms, large_result_rows=large_result_rows)
+
+_DECIMAL_MODES = ('exact', 'int_when_scale0', 'float64')
+
+def _check_decimal_mode(decimal_mode):
+    if decimal_mode not in _DECIMAL_MODES:
+        raise ProgrammingError(
+            "Unsupported decimal_mode %r. Supported modes: %s"
+            % (decimal_mode, ", ".join(_DECIMAL_MODES)))
+
+_LARGE_TYPES = ('none', 'lob', 'all')
+
+def _check_large_types(large_types):
+    if large_types not in _LARGE_TYPES:
+        raise ProgrammingError(
+            "Unsupported large_types %r. Supported values: %s"
+            % (large_types, ", ".join(_LARGE_TYPES)))
+
+_TIME_UNITS = ('ms', 'us')
+
+def _check_time_unit(time_unit):
+    if time_unit not in _TIME_UNITS:
+        raise ProgrammingError(
+            "Unsupported time_unit %r. Supported values: %s"
+            % (time_unit, ", ".join(_TIME_UNITS)))
+
+def _check_threshold(name, value):
+    if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0):
+        raise ProgrammingError(
+            "%s must be a non-negative number, got %r" % (name, value))
 
 # DB-API 2.0 Connection Object
 class Connection(object):
@@ -642,13 +957,41 @@ class Connection(object):
     DataError = DataError
     NotSupportedError = NotSupportedError
 
-    def __init__(self, jconn, jclassname=None):
+    def __init__(self, jconn, jclassname=None, experimental=None, decimal_mode='exact',
+                 slow_query_ms=None, large_result_rows=None):
         self.jconn = jconn
         self._jclassname = jclassname
         self._closed = False
-        self._stringify_dates = False
-        if self._jclassname and ("sqlite" in self._jclassname.lower()):
-             self._stringify_dates = True
+        experimental = experimental or {}
+        self._arrow_description = bool(experimental.get('arrow_description'))
+        self._decimal_mode = decimal_mode
+        self._slow_query_ms = slow_query_ms
+        self._large_result_rows = large_result_rows
+        self._profile = self._select_profile()
+        self._jprofile = None
+
+    def _select_profile(self):
+        profile = select_driver_profile(jclassname=self._jclassname,
+                                        product_name=self._database_product_name)
+        return profile or DEFAULT_PROFILE
+
+    def _database_product_name(self):
+        try:
+            return self.jconn.getMetaData().getDatabaseProductName()
+        except Exception:
+            return None
+
+    @property
+    def driver_profile(self):
+        """The DriverProfile selected for this connection."""
+        return self._profile
+
+    def _java_profile(self):
+        """Java counterpart of the driver profile, or None when the profile
+        has no type overrides and the default type mapping applies."""
+        if self._jprofile is None and self._profile.type_overrides:
+            self._jprofile = _arrow_utils().create_java_driver_profile(self._profile)
+        return self._jprofile
 
     def close(self):
         if self._closed:
@@ -672,8 +1015,57 @@ class Connection(object):
         except:
             _handle_sql_exception()
 
-    def cursor(self):
-        return Cursor(self)
+    def cursor(self, streaming=False, fetch_size=None, decimal_mode=None,
+               dictionary_encode_columns=None, intern_strings=False,
+               lob_max_length=None, lob_batch_size=None, large_types='none',
+               time_unit='ms'):
+        """Return a new Cursor for this connection.
+
+        streaming: If True, queries are executed on a forward-only,
+              read-only statement with a bounded fetch size so that
+              drivers which only stream under these conditions (e.g.
+              PostgreSQL, which also requires autocommit to be off)
+              do not buffer the whole result set in the JVM heap.
+              Autocommit is switched off for the duration of the query
+              and restored when the result set is closed.
+        fetch_size: Number of rows the driver should fetch per round
+              trip. Defaults to the Arrow batch size of the cursor.
+        decimal_mode: Overrides the decimal_mode of the connection for
+              queries run on this cursor.
+        dictionary_encode_columns: Labels of VARCHAR result columns
+              (case-insensitive) to dictionary-encode on the Java side.
+              Intended for low-cardinality columns such as status or
+              country codes: Arrow batches carry them as
+              dictionary<int32, string> and fetch_df() returns them as
+              pandas 'category' columns.
+        intern_strings: If True, or the maximum number of distinct values
+              to keep, string values returned by fetchone(), fetchmany()
+              and fetchall() go through a bounded LRU cache so that
+              repeated values share one Python object across rows.
+        lob_max_length: Read at most this many characters (CLOB,
+              NCLOB, LONGVARCHAR) or bytes (BLOB, LONGVARBINARY) of
+              each large-object value; the rest is not fetched.
+        lob_batch_size: Arrow batch size for result sets with
+              large-object columns, so that fewer LOBs are held in
+              memory at once. Other result sets keep the default.
+        large_types: 'lob' reads CLOB/NCLOB/LONGVARCHAR and
+              BLOB/LONGVARBINARY columns as large_string/large_binary
+              (64-bit offsets), so batches of wide values do not overflow
+              the 2 GB offset limit. 'all' does the same for every string
+              and binary column, including JSON/XML columns read as
+              strings. Defaults to 'none'.
+        time_unit: 'us' reads TIME columns as time64[us] instead of
+              time32[ms], keeping the microseconds of drivers that
+              return them. Defaults to 'ms'.
+        """
+        return Cursor(self, streaming=streaming, fetch_size=fetch_size,
+                      decimal_mode=decimal_mode,
+                      dictionary_encode_columns=dictionary_encode_columns,
+                      intern_strings=intern_strings,
+                      lob_max_length=lob_max_length,
+                      lob_batch_size=lob_batch_size,
+                      large_types=large_types,
+                      time_unit=time_unit)
 
     def __enter__(self):
         return self
@@ -681,18 +1073,72 @@ class Connection(object):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+def _description_from_arrow_schema(schema):
+    """Build a DB-API description from a pyarrow.Schema whose fields carry
+    the JDBC column metadata written by ExplicitTypeMapper."""
+    description = []
+    for field in schema:
+        meta = field.metadata or {}
+        size = int(meta.get(b'JDBC_DISPLAY_SIZE', 0))
+        col_desc = ( field.name,
+                     DBAPITypeObject._from_jdbc_type(int(meta.get(b'JDBC_TYPE', 0))),
+                     size,
+                     size,
+                     int(meta.get(b'JDBC_PRECISION', 0)),
+                     int(meta.get(b'JDBC_SCALE', 0)),
+                     int(meta.get(b'JDBC_NULLABLE', 2)),
+                     )
+        description.append(col_desc)
+    return description
+
 # DB-API 2.0 Cursor Object
 class Cursor(object):
 
     _rs = None
+    _meta = None
     _description = None
     _iter = None
     _buffer = None
-
-    def __init__(self, connection):
+    _stats = None
+    # [parameter summary, large result logged] of the current query while
+    # the connection has a query log threshold, else None.
+    _query_log = None
+
+    def __init__(self, connection, streaming=False, fetch_size=None, decimal_mode=None,
+                 dictionary_encode_columns=None, intern_strings=False,
+                 lob_max_length=None, lob_batch_size=None, large_types='none',
+                 time_unit='ms'):
+        if decimal_mode is not None:
+            _check_decimal_mode(decimal_mode)
+        _check_large_types(large_types)
+        _check_time_unit(time_unit)
+        if lob_max_length is not None and lob_max_length < 0:
+            raise ProgrammingError(
+                "lob_max_length must not be negative, got %r" % lob_max_length)
+        if lob_batch_size is not None and lob_batch_size <= 0:
+            raise ProgrammingError(
+                "lob_batch_size must be positive, got %r" % lob_batch_size)
+        if isinstance(dictionary_encode_columns, str):
+            dictionary_encode_columns = [dictionary_encode_columns]
         self._connection = connection
         self._buffer = []
         self._prep = None
+        self._streaming = streaming
+        self._fetch_size = fetch_size
+        self._decimal_mode = decimal_mode
+        self._dictionary_encode_columns = tuple(dictionary_encode_columns or ())
+        self._lob_max_length = lob_max_length
+        self._lob_batch_size = lob_batch_size
+        self._large_types = large_types
+        self._time_unit = time_unit
+        if intern_strings is True:
+            self._intern_cache = _arrow_utils().StringInternCache(_arrow_utils().DEFAULT_INTERN_CACHE_SIZE)
+        elif intern_strings:
+            self._intern_cache = _arrow_utils().StringInternCache(intern_strings)
+        else:
+            self._intern_cache = None
+        self._joptions = None
+        self._restore_autocommit = False
         self.rowcount = -1
         self.lastrowid = None
 
@@ -700,30 +1146,79 @@ class Cursor(object):
     def connection(self):
         return self._connection
 
+    @property
+    def stats(self):
+        """QueryStats of the last execute()/executemany(), updated by the
+        fetches that follow; None before the first query."""
+        return self._stats
+
+    def _begin_query(self, operation, parameters, is_batch):
+        self._stats = QueryStats(operation)
+        connection = self._connection
+        if connection._slow_query_ms is not None or connection._large_result_rows is not None:
+            self._query_log = [_summarize_parameters(parameters, is_batch), False]
+        return self._stats
+
+    def _check_query_log(self, finished):
+        """Log the query once it has fetched large_result_rows rows, and
+        when it is 'finished' and took slow_query_ms or longer."""
+        if self._query_log is None:
+            return
+        stats = self._stats
+        connection = self._connection
+        parameters, large_logged = self._query_log
+        limit = connection._large_result_rows
+        if not large_logged and limit is not None and stats.rows >= limit:
+            self._query_log[1] = True
+            _log_query('Large result (%d rows)' % stats.rows, stats, parameters)
+        if finished:
+            self._query_log = None
+            elapsed_ms = stats.total * 1000
+            if connection._slow_query_ms is not None and elapsed_ms >= connection._slow_query_ms:
+                _log_query('Slow query (%.1f ms)' % elapsed_ms, stats, parameters)
+
+    def _end_fetch(self, event):
+        self._stats.sync()
+        # The fetch methods drop the iterator once the result set is read.
+        exhausted = self._iter is None
+        if exhausted:
+            self._end_streaming()
+        self._check_query_log(finished=exhausted)
+        _emit_trace(event, self._stats)
+
     @property
     def description(self):
         if self._description:
             return self._description
+        if self._rs and self._connection._arrow_description:
+            # Keep the snapshot: the iterator created by the first fetch reuses it.
+            if self._meta is None:
+                self._meta = _arrow_utils().read_column_metadata(self._rs)
+            schema = _arrow_utils().export_result_set_schema(
+                self._rs, metadata=self._meta, profile=self._connection._java_profile(),
+                options=self._conversion_options())
+            self._description = _description_from_arrow_schema(schema)
+            return self._description
         m = self._meta
         if m:
-            count = m.getColumnCount()
+            # The metadata snapshot is read in one Java call per result set;
+            # fetch each column array once rather than calling the JDBC
+            # getters per column.
+            labels = list(m.labels)
+            sizes = list(m.displaySizes)
+            precisions = list(m.precisions)
+            scales = list(m.scales)
+            nullables = list(m.nullables)
             self._description = []
-            for col in range(1, count + 1):
-                size = m.getColumnDisplaySize(col)
-                jdbc_type = m.getColumnType(col)
-                if jdbc_type == 0:
-                    # PEP-0249: SQL NULL values are represented by the
-                    # Python None singleton
-                    dbapi_type = None
-                else:
-                    dbapi_type = DBAPITypeObject._map_jdbc_type_to_dbapi(jdbc_type)
-                col_desc = ( m.getColumnLabel(col),
+            for col, jdbc_type in enumerate(m.types):
+                dbapi_type = DBAPITypeObject._from_jdbc_type(int(jdbc_type))
+                col_desc = ( labels[col],
                              dbapi_type,
-                             size,
-                             size,
-                             m.getPrecision(col),
-                             m.getScale(col),
-                             m.isNullable(col),
+                             sizes[col],
+                             sizes[col],
+                             precisions[col],
+                             scales[col],
+                             nullables[col],
                              )
                 self._description.append(col_desc)
             return self._description
@@ -737,6 +1232,7 @@ class Cursor(object):
     def _close_last(self):
         """Close the resultset and reset collected meta data.
         """
+        self._check_query_log(finished=True)
         if self._iter:
             try:
                 self._iter.close()
@@ -752,6 +1248,72 @@ class Cursor(object):
         self._prep = None
         self._meta = None
         self._description = None
+        self._end_streaming()
+
+    def _begin_streaming(self):
+        """Switch autocommit off so the driver may use a server-side cursor,
+        remembering whether it has to be switched back on afterwards."""
+        jconn = self._connection.jconn
+        if jconn.getAutoCommit():
+            jconn.setAutoCommit(False)
+            self._restore_autocommit = True
+
+    def _end_streaming(self):
+        """Restore the autocommit state changed by _begin_streaming(), once
+        the result set is read to the end or closed."""
+        if not self._restore_autocommit:
+            return
+        self._restore_autocommit = False
+        if self._connection is None or self._connection._closed:
+            return
+        try:
+            self._connection.jconn.setAutoCommit(True)
+        except:
+            _handle_sql_exception()
+
+    def _batch_size(self):
+        # Use a reasonable batch size.
+        # For small reads (fetchone), this might be overhead, but it's safe.
+        # For large reads (fetchall), this is efficient.
+        # Using arraysize or a default.
+        if self._lob_batch_size and self._rs:
+            if self._meta is None:
+                self._meta = _arrow_utils().read_column_metadata(self._rs)
+            if self._meta.hasLargeObjectColumns():
+                return self._lob_batch_size
+        return max(self.arraysize, 1024)
+
+    def _conversion_options(self):
+        """Java ConversionOptions for this cursor, or None when every option
+        has its default value."""
+        decimal_mode = self._decimal_mode or self._connection._decimal_mode
+        column_metadata = self._connection._arrow_description
+        if decimal_mode == 'exact' and not self._dictionary_encode_columns \
+                and self._lob_max_length is None and self._large_types == 'none' \
+                and self._time_unit == 'ms' and not column_metadata:
+            return None
+        if self._joptions is None:
+            self._joptions = _arrow_utils().create_java_conversion_options(
+                decimal_mode=decimal_mode,
+                dictionary_encode_columns=self._dictionary_encode_columns,
+                lob_max_length=self._lob_max_length,
+                large_types=self._large_types,
+                column_metadata=column_metadata,
+                time_unit=self._time_unit)
+        return self._joptions
+
+    def _prepare_streaming(self, operation):
+        import jpype
+        ResultSet = jpype.java.sql.ResultSet
+        try:
+            self._begin_streaming()
+            prep = self._connection.jconn.prepareStatement(
+                operation, ResultSet.TYPE_FORWARD_ONLY, ResultSet.CONCUR_READ_ONLY)
+            prep.setFetchSize(self._fetch_size or self._batch_size())
+        except:
+            self._end_streaming()
+            _handle_sql_exception()
+        return prep
 
     # def _set_stmt_parms(self, prep_stmt, parameters):
     #     for i in range(len(parameters)):
@@ -775,13 +1337,18 @@ class Cursor(object):
             return [_to_str(p) for p in params]
 
     def _set_stmt_parms(self, statement, parameters, is_batch=False):
-        if self._connection._stringify_dates:
+        if self._connection._profile.stringify_dates:
              parameters = self._stringify_params(parameters, is_batch)
         try:
-            batches = create_pyarrow_batches_from_list(parameters)
-            add_pyarrow_batches_to_statement(batches, statement, is_batch=is_batch)
+            batches = _arrow_utils().create_pyarrow_batches_from_list(parameters)
+            _arrow_utils().add_pyarrow_batches_to_statement(batches, statement, is_batch=is_batch)
+            bind_path = 'arrow'
         except Exception:
+            _metrics.BIND_FALLBACKS.inc()
             self._set_stmt_parms_fallback(statement, parameters, is_batch)
+            bind_path = 'fallback'
+        if parameters and self._stats is not None:
+            self._stats.bind_path = bind_path
 
     def _set_stmt_parms_fallback(self, statement, parameters, is_batch=False):
         """Fallback using standard JDBC setObject() for drivers that don't
@@ -804,8 +1371,13 @@ class Cursor(object):
             if isinstance(p, datetime.date):
                 return jpype.JClass("java.sql.Date").valueOf(p.isoformat())
             if isinstance(p, datetime.time):
-                return jpype.JClass("java.sql.Time").valueOf(
+                # Time.valueOf() only parses whole seconds; java.sql.Time
+                # carries milliseconds, so add them back.
+                t = jpype.JClass("java.sql.Time").valueOf(
                     p.strftime("%H:%M:%S"))
+                if p.microsecond:
+                    t.setTime(t.getTime() + p.microsecond // 1000)
+                return t
             if isinstance(p, Decimal):
                 return jpype.JClass("java.math.BigDecimal")(str(p))
             if isinstance(p, list):
@@ -886,6 +1458,7 @@ class Cursor(object):
                 else:
                     statement.setObject(i + 1, _to_java(p))
 
+    @_traced('execute')
     def execute(self, operation, parameters=None):
         if self._connection._closed:
             raise Error()
@@ -893,23 +1466,39 @@ class Cursor(object):
             parameters = ()
         self._close_last()
         self.lastrowid = None
-        try:
-            self._prep = self._connection.jconn.prepareStatement(operation, 1)
-        except Exception:
+        stats = self._begin_query(operation, parameters, is_batch=False)
+        start = time.perf_counter()
+        if self._streaming:
+            self._prep = self._prepare_streaming(operation)
+        else:
             try:
-                self._prep = self._connection.jconn.prepareStatement(operation)
-            except:
-                _handle_sql_exception()
+                self._prep = self._connection.jconn.prepareStatement(operation, 1)
+            except Exception:
+                try:
+                    self._prep = self._connection.jconn.prepareStatement(operation)
+                except:
+                    _handle_sql_exception()
+        prepared = time.perf_counter()
+        stats.add('prepare', prepared - start)
         self._set_stmt_parms(self._prep, parameters, is_batch=False)
+        bound = time.perf_counter()
+        stats.add('bind', bound - prepared)
         try:
             is_rs = self._prep.execute()
         except:
+            self._end_streaming()
             _handle_sql_exception()
+        executed = time.perf_counter()
+        stats.add('execute', executed - bound)
+        _metrics.QUERIES.inc()
+        _metrics.EXECUTE_SECONDS.observe(executed - start)
         if is_rs:
             self._rs = self._prep.getResultSet()
-            self._meta = self._rs.getMetaData()
+            if not self._connection._arrow_description:
+                self._meta = _arrow_utils().read_column_metadata(self._rs)
             self.rowcount = -1
         else:
+            self._end_streaming()
             self.rowcount = self._prep.getUpdateCount()
             try:
                 gk_rs = self._prep.getGeneratedKeys()
@@ -919,11 +1508,16 @@ class Cursor(object):
                         self.lastrowid = None
             except Exception:
                 pass
+            self._check_query_log(finished=True)
         # self._prep.getWarnings() ???
+        _emit_trace('execute', stats)
 
+    @_traced('executemany')
     def executemany(self, operation, seq_of_parameters):
         self._close_last()
         self.lastrowid = None
+        stats = self._begin_query(operation, seq_of_parameters, is_batch=True)
+        start = time.perf_counter()
         try:
             self._prep = self._connection.jconn.prepareStatement(operation, 1)
         except Exception:
@@ -931,45 +1525,57 @@ class Cursor(object):
                 self._prep = self._connection.jconn.prepareStatement(operation)
             except:
                 _handle_sql_exception()
+        prepared = time.perf_counter()
+        stats.add('prepare', prepared - start)
         self._set_stmt_parms(self._prep, seq_of_parameters, is_batch=True)
+        bound = time.perf_counter()
+        stats.add('bind', bound - prepared)
         try:
             update_counts = self._prep.executeBatch()
         except:
             _handle_sql_exception()
+        executed = time.perf_counter()
+        stats.add('execute', executed - bound)
+        _metrics.QUERIES.inc()
+        _metrics.EXECUTE_SECONDS.observe(executed - start)
         # self._prep.getWarnings() ???
         self.rowcount = sum(update_counts)
         self._close_last()
+        _emit_trace('executemany', stats)
 
     def _get_iter(self):
         if self._iter:
             return self._iter
         if not self._rs:
             raise Error()
-        # Use a reasonable batch size.
-        # For small reads (fetchone), this might be overhead, but it's safe.
-        # For large reads (fetchall), this is efficient.
-        # Using arraysize or a default.
-        batch_size = max(self.arraysize, 1024)
-        self._iter = convert_jdbc_rs_to_arrow_iterator(self._rs, batch_size=batch_size)
+        self._iter = _arrow_utils().convert_jdbc_rs_to_arrow_iterator(
+            self._rs, batch_size=self._batch_size(), metadata=self._meta,
+            profile=self._connection._java_profile(),
+            options=self._conversion_options())
         return self._iter
 
+    @_traced('fetchone')
     def fetchone(self):
         if not self._rs:
             return None
 
         if self._buffer:
-            return self._buffer.pop(0)
-
-        it = self._get_iter()
-        rows = fetch_next_batch(it)
-        if rows:
-            self._buffer.extend(rows)
-            return self._buffer.pop(0)
-
-        # Iterator exhausted and closed by fetch_next_batch
-        self._iter = None
-        return None
+            row = self._buffer.pop(0)
+        else:
+            it = self._get_iter()
+            rows = _arrow_utils().fetch_next_batch(it, self._conversion_options(), self._intern_cache,
+                                                   self._stats)
+            if rows:
+                self._buffer.extend(rows)
+                row = self._buffer.pop(0)
+            else:
+                # Iterator exhausted and closed by fetch_next_batch
+                self._iter = None
+                row = None
+        self._end_fetch('fetchone')
+        return row
 
+    @_traced('fetchmany')
     def fetchmany(self, size=None):
         if not self._rs:
             return []
@@ -988,15 +1594,18 @@ class Cursor(object):
                 result.extend(take)
             else:
                 it = self._get_iter()
-                rows = fetch_next_batch(it)
+                rows = _arrow_utils().fetch_next_batch(it, self._conversion_options(), self._intern_cache,
+                                                       self._stats)
                 if not rows:
                     # Iterator exhausted and closed by fetch_next_batch
                     self._iter = None
                     break
                 self._buffer.extend(rows)
 
+        self._end_fetch('fetchmany')
         return result
 
+    @_traced('fetchall')
     def fetchall(self):
         if not self._rs:
             return []
@@ -1011,13 +1620,15 @@ class Cursor(object):
         # We can implement a more efficient fetchall if we want to avoid python loops for buffering,
         # but reusing fetch_next_batch is simpler.
         while True:
-            rows = fetch_next_batch(it)
+            rows = _arrow_utils().fetch_next_batch(it, self._conversion_options(), self._intern_cache,
+                                                   self._stats)
             if not rows:
                 break
             result.extend(rows)
 
         # Iterator exhausted and closed by fetch_next_batch
         self._iter = None
+        self._end_fetch('fetchall')
         return result
 
     # optional nextset() unsupported
@@ -1030,6 +1641,7 @@ class Cursor(object):
     def setoutputsize(self, size, column=None):
         pass
 
+    @_traced_generator('fetch_arrow_batches')
     def fetch_arrow_batches(self):
         """
         Fetch results as Arrow RecordBatches (zero-copy, native Arrow format).
@@ -1055,12 +1667,24 @@ class Cursor(object):
 
         import pyarrow as pa
         it = self._get_iter()
+        options = self._conversion_options()
+        stats = self._stats
+        arrow_utils = _arrow_utils()
 
         try:
             while it.hasNext():
-                root = it.next()
+                root = arrow_utils.next_batch_root(it, stats)
                 try:
-                    yield pa.jvm.record_batch(root)
+                    if options is not None:
+                        # pyarrow.jvm reads neither dictionary-encoded nor
+                        # large (64-bit offset) vectors.
+                        yield arrow_utils._import_batch_via_cdata(root, options, stats)
+                    else:
+                        start = time.perf_counter()
+                        batch = pa.jvm.record_batch(root)
+                        stats.add('import', time.perf_counter() - start)
+                        stats.record_batch(batch)
+                        yield batch
                 finally:
                     root.clear()
         finally:
@@ -1070,7 +1694,13 @@ class Cursor(object):
                 it.close()
             except Exception:
                 pass
+            stats.sync()
+            if stats is self._stats:
+                self._end_streaming()
+                self._check_query_log(finished=True)
+            _emit_trace('fetch_arrow_batches', stats)
 
+    @_traced('fetch_arrow_table')
     def fetch_arrow_table(self):
         """
         Fetch all results as a single pyarrow.Table.
@@ -1091,6 +1721,7 @@ class Cursor(object):
             return pa.Table.from_arrays([])
         return pa.Table.from_batches(batches)
 
+    @_traced('fetch_df')
     def fetch_df(self):
         """
         Fetch all results as a pandas DataFrame (optimized Arrow path).
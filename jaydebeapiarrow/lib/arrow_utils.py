@@ -1,8 +1,11 @@
 import sys, traceback
 import tempfile
+import time
+from collections import OrderedDict
 from itertools import islice
 
 import pyarrow as pa
+import pyarrow.compute as pc
 from pyarrow.cffi import ffi as arrow_c
 
 # Set by __init__.py after JPype initialization.
@@ -10,26 +13,175 @@ from pyarrow.cffi import ffi as arrow_c
 _handle_sql_exception = None
 
 
-def _import_batch_via_cdata(root):
-    """Import a Java VectorSchemaRoot as a PyArrow RecordBatch via C Data Interface."""
+def _import_batch_via_cdata(root, options=None, stats=None):
+    """Import a Java VectorSchemaRoot as a PyArrow RecordBatch via C Data Interface.
+
+    Columns selected for dictionary encoding in the Java ConversionOptions
+    'options' arrive as dictionary arrays. The export and import times and
+    the batch size are added to 'stats' (a QueryStats) if given.
+    """
     import jpype.imports
     from org.jaydebeapiarrow.extension import JDBCUtils
 
-    addresses = JDBCUtils.exportNextBatch(root)
+    start = time.perf_counter()
+    if options is None:
+        addresses = JDBCUtils.exportNextBatch(root)
+    else:
+        addresses = JDBCUtils.exportNextBatch(root, options)
     array_ptr = int(addresses[0])
     schema_ptr = int(addresses[1])
+    exported = time.perf_counter()
+
+    batch = pa.RecordBatch._import_from_c(array_ptr, schema_ptr)
+    if stats is not None:
+        stats.add('export', exported - start)
+        stats.add('import', time.perf_counter() - exported)
+        stats.record_batch(batch)
+    return batch
+
+
+def next_batch_root(it, stats=None):
+    """Return the next VectorSchemaRoot of the ArrowVectorIterator 'it',
+    timed in Java into 'stats' (a QueryStats) if given.
+    """
+    if stats is None:
+        return it.next()
+    import jpype.imports
+    from org.jaydebeapiarrow.extension import JDBCUtils
+    return JDBCUtils.nextBatch(it, stats.java_stats())
+
+
+DEFAULT_INTERN_CACHE_SIZE = 4096
+
+
+class StringInternCache(object):
+    """Bounded LRU cache handing out one shared str per distinct value.
+
+    Used by row fetches so that values repeated across rows and batches
+    (labels, status codes) are a single Python object instead of one
+    object per cell. The least recently used value is evicted once
+    'maxsize' distinct values are cached.
+    """
+
+    def __init__(self, maxsize=DEFAULT_INTERN_CACHE_SIZE):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive, got %r" % maxsize)
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+
+    def intern(self, value):
+        cached = self._cache.get(value)
+        if cached is not None:
+            self._cache.move_to_end(value)
+            return cached
+        self._cache[value] = value
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+
+def _interned_column(column, intern_cache):
+    """Python values of a string column, with each distinct value created
+    once per batch and shared through 'intern_cache'."""
+    if not pa.types.is_dictionary(column.type):
+        column = pc.dictionary_encode(column)
+    values = [None if v is None else intern_cache.intern(v)
+              for v in column.dictionary.to_pylist()]
+    return [None if i is None else values[i] for i in column.indices.to_pylist()]
+
 
-    return pa.RecordBatch._import_from_c(array_ptr, schema_ptr)
+def _is_string_column(column):
+    value_type = column.type
+    if pa.types.is_dictionary(value_type):
+        value_type = value_type.value_type
+    return pa.types.is_string(value_type) or pa.types.is_large_string(value_type)
 
 
-def convert_jdbc_rs_to_arrow_iterator(rs, batch_size=1024):
+def _rows_from_batch(batch, intern_cache=None):
+    """Convert a RecordBatch to a list of row tuples."""
+    if intern_cache is None:
+        return [tuple(r.values()) for r in batch.to_pylist()]
+    columns = [_interned_column(column, intern_cache) if _is_string_column(column)
+               else column.to_pylist()
+               for column in batch.columns]
+    return list(zip(*columns))
+
+
+def read_column_metadata(rs):
+    """Snapshot the ResultSetMetaData of 'rs' in a single Java call."""
+    import jpype.imports
+    from org.jaydebeapiarrow.extension import JDBCUtils
+
+    return JDBCUtils.readColumnMetaData(rs)
+
+
+def create_java_driver_profile(profile):
+    """Create the Java DriverProfile carrying the type overrides of 'profile'."""
+    import jpype
+    import jpype.imports
+    from org.jaydebeapiarrow.extension import DriverProfile
+    from jaydebeapiarrow.lib.driver_profiles import TYPE_OVERRIDE_TARGETS
+
+    jprofile = DriverProfile(profile.name)
+    for type_spec, target in profile.type_overrides.items():
+        jdbc_type = getattr(jpype.java.sql.Types, TYPE_OVERRIDE_TARGETS[target])
+        jprofile.addTypeOverride(type_spec, jdbc_type)
+    return jprofile
+
+
+def create_java_conversion_options(decimal_mode='exact', dictionary_encode_columns=(),
+                                   lob_max_length=None, large_types='none', column_metadata=False,
+                                   time_unit='ms'):
+    """Create the Java ConversionOptions for a query. 'column_metadata' adds
+    the JDBC_* field metadata to the fetched batches as well."""
+    import jpype.imports
+    from org.jaydebeapiarrow.extension import ConversionOptions
+
+    options = ConversionOptions().setDecimalMode(decimal_mode).setLargeTypes(large_types) \
+        .setColumnMetadata(column_metadata).setTimePrecision(time_unit)
+    if lob_max_length is not None:
+        options.setLobMaxLength(lob_max_length)
+    for column in dictionary_encode_columns:
+        options.addDictionaryEncodeColumn(column)
+    return options
+
+
+def export_result_set_schema(rs, metadata=None, profile=None, options=None):
+    """Return the pyarrow.Schema 'rs' converts to, without reading any rows."""
     import jpype.imports
     from org.jaydebeapiarrow.extension import JDBCUtils
 
-    return JDBCUtils.convertResultSetToIterator(rs, batch_size)
+    if profile is not None or options is not None:
+        if metadata is None:
+            metadata = JDBCUtils.readColumnMetaData(rs)
+        schema_ptr = JDBCUtils.exportSchema(rs, metadata, profile, options)
+    elif metadata is None:
+        schema_ptr = JDBCUtils.exportSchema(rs)
+    else:
+        schema_ptr = JDBCUtils.exportSchema(rs, metadata)
+    return pa.Schema._import_from_c(int(schema_ptr))
 
 
-def fetch_next_batch(it):
+def convert_jdbc_rs_to_arrow_iterator(rs, batch_size=1024, metadata=None, profile=None, options=None):
+    import jpype.imports
+    from org.jaydebeapiarrow.extension import JDBCUtils
+
+    if profile is not None or options is not None:
+        if metadata is None:
+            metadata = JDBCUtils.readColumnMetaData(rs)
+        return JDBCUtils.convertResultSetToIterator(rs, batch_size, metadata, profile, options)
+    if metadata is None:
+        return JDBCUtils.convertResultSetToIterator(rs, batch_size)
+    return JDBCUtils.convertResultSetToIterator(rs, batch_size, metadata)
+
+
+def fetch_next_batch(it, options=None, intern_cache=None, stats=None):
     """
     Fetches the next batch from the ArrowVectorIterator 'it'.
     Returns a list of rows (tuples).
@@ -37,10 +189,14 @@ def fetch_next_batch(it):
 
     When the iterator is exhausted, it is automatically closed to release
     the Arrow allocator and JDBC resources.
+
+    If 'intern_cache' (a StringInternCache) is given, repeated string
+    values share one Python object across rows. If 'stats' (a QueryStats)
+    is given, the phase timings and size of the batch are added to it.
     """
     if it.hasNext():
         try:
-            root = it.next()
+            root = next_batch_root(it, stats)
         except Exception as e:
             decimal_message = _find_decimal_conversion_message(e)
             if decimal_message:
@@ -49,8 +205,12 @@ def fetch_next_batch(it):
                 _handle_sql_exception()
             raise
         try:
-            batch = _import_batch_via_cdata(root).to_pylist()
-            rows = [tuple(r.values()) for r in batch]
+            batch = _import_batch_via_cdata(root, options, stats)
+            if stats is None:
+                return _rows_from_batch(batch, intern_cache)
+            start = time.perf_counter()
+            rows = _rows_from_batch(batch, intern_cache)
+            stats.add('rows', time.perf_counter() - start)
             return rows
         finally:
             root.clear()
@@ -77,7 +237,7 @@ def _find_decimal_conversion_message(exc):
     return None
 
 
-def read_rows_from_arrow_iterator(it, nrows=-1):
+def read_rows_from_arrow_iterator(it, nrows=-1, options=None, intern_cache=None):
     rows = []
 
     nrows_remaining = nrows
@@ -87,8 +247,7 @@ def read_rows_from_arrow_iterator(it, nrows=-1):
             if root is None:
                 break
             try:
-                batch = _import_batch_via_cdata(root).to_pylist()
-                _rows = [tuple(r.values()) for r in batch]
+                _rows = _rows_from_batch(_import_batch_via_cdata(root, options), intern_cache)
                 if nrows_remaining > 0:
                     _rows = _rows[:min(len(_rows), nrows_remaining)]
                     nrows_remaining -= len(_rows)
@@ -0,0 +1,211 @@
+"""Persistent cache of the expanded CLASSPATH.
+
+Wildcard CLASSPATH entries (``/opt/jdbc/*``) are expanded by walking their
+directory recursively, and the resulting jars are deduplicated by basename,
+keeping the newest. On network file systems with many jars this takes
+seconds per process. The expanded list is stored in the user cache
+directory, keyed by the CLASSPATH value and the working directory, together
+with the mtime of every directory the expansion depended on, collected in
+the same walk. A later process reuses it as long as none of them changed,
+which costs one stat per directory instead of listing every directory.
+
+Adding, removing or renaming a jar changes the mtime of its directory and
+invalidates the entry. Overwriting a jar in place does not, and leaves its
+path unchanged, except where two jars share a basename: the newer one is
+kept, so the mtimes of those jars are recorded and checked too.
+
+JAYDEBEAPIARROW_CACHE_DIR moves the cache directory and
+JAYDEBEAPIARROW_CLASSPATH_CACHE=0 disables the cache.
+"""
+
+import collections
+import json
+import logging
+import os
+import sys
+import tempfile
+
+CACHE_FILE_NAME = 'classpath.json'
+
+# Entries kept in the cache file; the least recently stored are dropped.
+MAX_ENTRIES = 32
+
+_logger = logging.getLogger(__name__)
+
+
+def cache_dir():
+    """Return the directory holding the classpath cache."""
+    override = os.environ.get('JAYDEBEAPIARROW_CACHE_DIR')
+    if override:
+        return override
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'jaydebeapiarrow')
+
+
+def cache_path():
+    return os.path.join(cache_dir(), CACHE_FILE_NAME)
+
+
+def is_enabled():
+    value = os.environ.get('JAYDEBEAPIARROW_CLASSPATH_CACHE', '1')
+    return value.strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _is_jar(name, prefix=''):
+    # Like glob's '<prefix>*.[jJ][aA][rR]', which skips hidden names.
+    return (not name.startswith('.') and name.startswith(prefix)
+            and len(name) >= len(prefix) + 4 and name[-4:].lower() == '.jar')
+
+
+def _list_jars(directory, prefix, jars, mtimes):
+    """Add the jars in 'directory' whose names start with 'prefix' to 'jars',
+    and the mtime of 'directory' to 'mtimes'. Returns the subdirectories,
+    following symlinks. The mtime is read before listing, so a change made
+    meanwhile invalidates the entry.
+    """
+    mtimes[directory or os.curdir] = _mtime(directory or os.curdir)
+    subdirs = []
+    try:
+        with os.scandir(directory or os.curdir) as entries:
+            for entry in entries:
+                path = os.path.join(directory, entry.name)
+                if _is_jar(entry.name, prefix):
+                    jars.append(path)
+                elif not entry.name.startswith('.') and entry.is_dir():
+                    subdirs.append(path)
+    except OSError:
+        pass
+    return subdirs
+
+
+def _walk_jars(root, jars, mtimes):
+    """Add the jars in 'root' and below it, like glob's 'root/*.jar' and
+    'root/**/*.jar' together: symlinked directories are followed as glob
+    does, each real directory once, and hidden directories are skipped.
+    """
+    seen = set()
+    pending = [root]
+    while pending:
+        directory = pending.pop(0)
+        real = os.path.realpath(directory or os.curdir)
+        if real in seen:
+            continue
+        seen.add(real)
+        pending[:0] = _list_jars(directory, '', jars, mtimes)
+
+
+def expand(classpath):
+    """Expand the wildcard entries of 'classpath' in one walk each.
+
+    Returns (entries, mtimes): the classpath entries with each wildcard
+    entry replaced by the jars it matches, in its directory and below, and
+    the mtimes of the directories the expansion depended on and of the jars
+    sharing a basename with another one. A directory that does not exist
+    yet is included, so creating it later invalidates the entry.
+    """
+    entries = []
+    mtimes = {}
+    for item in classpath.split(os.path.pathsep):
+        if not item.endswith('*'):
+            entries.append(item)
+            continue
+        base = item.rstrip('*')
+        directory, prefix = os.path.split(base)
+        if not prefix:
+            _walk_jars(directory, entries, mtimes)
+            continue
+        _list_jars(directory, prefix, entries, mtimes)
+        if os.path.isdir(base):
+            # 'dir/name*' also matches the jars in and below 'dir/name', as with glob.
+            _walk_jars(base, entries, mtimes)
+    names = collections.Counter(os.path.basename(entry) for entry in entries)
+    for entry in entries:
+        if names[os.path.basename(entry)] > 1:
+            mtimes[entry] = _mtime(entry)
+    return entries, mtimes
+
+
+def _read():
+    try:
+        with open(cache_path(), encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write(data):
+    directory = cache_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.classpath-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path())
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        _logger.debug("Could not write classpath cache %s: %s", cache_path(), e)
+
+
+def _key(classpath):
+    return json.dumps([os.getcwd(), classpath])
+
+
+def lookup(classpath):
+    """Return the cached expansion of 'classpath', or None if there is no
+    entry or a directory (or duplicated jar) it depended on has changed.
+    """
+    entry = _read().get(_key(classpath))
+    if not isinstance(entry, dict) or not isinstance(entry.get('mtimes'), dict):
+        return None
+    for path, mtime in entry['mtimes'].items():
+        if _mtime(path) != mtime:
+            return None
+    return list(entry.get('jars', []))
+
+
+def resolve(classpath, deduplicate):
+    """Return deduplicate() of the expanded 'classpath', reusing a cached
+    result when possible. Classpaths without wildcard entries are not
+    cached, as there is nothing to save.
+    """
+    cached = is_enabled() and any(item.endswith('*') for item in classpath.split(os.path.pathsep))
+    if cached:
+        jars = lookup(classpath)
+        if jars is not None:
+            return jars
+    entries, mtimes = expand(classpath)
+    jars = deduplicate(entries)
+    if not cached:
+        return jars
+    data = _read()
+    key = _key(classpath)
+    data.pop(key, None)
+    data[key] = {'mtimes': mtimes, 'jars': jars}
+    while len(data) > MAX_ENTRIES:
+        data.pop(next(iter(data)))
+    _write(data)
+    return jars
+
+
+def clear():
+    """Remove the cache file."""
+    try:
+        os.remove(cache_path())
+    except FileNotFoundError:
+        pass
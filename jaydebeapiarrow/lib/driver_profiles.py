@@ -0,0 +1,178 @@
+"""Per-driver profiles.
+
+A DriverProfile bundles the driver-specific choices made for a connection:
+how parameters are bound and which result columns are read with a
+different Arrow type than the default mapping. Profiles are selected from
+the JDBC driver class name, falling back to the database product name
+reported by DatabaseMetaData. The built-in profiles match on the driver
+class name only, so the product name is only asked for when an
+application registers a profile with product_names.
+
+The type-name based detection in ExplicitTypeMapper (Oracle BINARY_DOUBLE,
+PostgreSQL timestamptz, SQLite TIME, JSON/UUID reported as OTHER) keeps
+applying to every driver; type overrides in a profile take precedence
+over it.
+"""
+
+import re
+import threading
+
+# Target types accepted in type overrides, and the java.sql.Types
+# constant the column is read as.
+TYPE_OVERRIDE_TARGETS = {
+    'bool': 'BOOLEAN',
+    'int8': 'TINYINT',
+    'int16': 'SMALLINT',
+    'int32': 'INTEGER',
+    'int64': 'BIGINT',
+    'float32': 'REAL',
+    'float64': 'DOUBLE',
+    'decimal': 'DECIMAL',
+    'string': 'VARCHAR',
+    'binary': 'VARBINARY',
+    'date': 'DATE',
+    'time': 'TIME',
+    'timestamp': 'TIMESTAMP',
+    'timestamp_tz': 'TIMESTAMP_WITH_TIMEZONE',
+}
+
+_TYPE_SPEC_RE = re.compile(
+    r'^\s*([^()]*?)\s*(?:\(\s*(\d+)\s*(?:,\s*(-?\d+)\s*)?\))?\s*$')
+
+
+def normalize_type_spec(type_spec):
+    """Normalize a type override key such as 'number(19, 0)'.
+
+    The type name is upper-cased and a precision without a scale gets
+    scale 0, so 'NUMBER(19)' and 'number(19,0)' are the same key.
+    """
+    match = _TYPE_SPEC_RE.match(type_spec)
+    if not match or not match.group(1):
+        raise ValueError("Invalid type specification '%s'" % type_spec)
+    name, precision, scale = match.groups()
+    name = name.upper()
+    if precision is None:
+        return name
+    return '%s(%d,%d)' % (name, int(precision), int(scale or 0))
+
+
+class DriverProfile(object):
+    """Driver-specific behaviour of a connection.
+
+    name: Unique name of the profile. Registering a profile replaces
+          the registered profile with the same name.
+    jclassnames: Case-insensitive substrings matched against the JDBC
+          driver class name passed to connect().
+    product_names: Case-insensitive substrings matched against
+          DatabaseMetaData.getDatabaseProductName() when no profile
+          matches the driver class name.
+    stringify_dates: If True, date/time parameters are bound as ISO
+          strings (for drivers that store temporal values as text).
+    type_overrides: Dict mapping a column type name, optionally with
+          precision and scale (e.g. 'NUMBER(19,0)'), to one of the
+          names in TYPE_OVERRIDE_TARGETS. A key with precision and
+          scale takes precedence over the bare type name.
+    """
+
+    def __init__(self, name, jclassnames=(), product_names=(),
+                 stringify_dates=False, type_overrides=None):
+        self.name = name
+        self.jclassnames = tuple(p.lower() for p in jclassnames)
+        self.product_names = tuple(p.lower() for p in product_names)
+        self.stringify_dates = stringify_dates
+        self.type_overrides = {}
+        for type_spec, target in (type_overrides or {}).items():
+            if target not in TYPE_OVERRIDE_TARGETS:
+                raise ValueError(
+                    "Unsupported type override target '%s' for '%s'. "
+                    "Supported targets: %s"
+                    % (target, type_spec, ", ".join(sorted(TYPE_OVERRIDE_TARGETS))))
+            self.type_overrides[normalize_type_spec(type_spec)] = target
+
+    def with_type_overrides(self, type_overrides):
+        """Return a copy of this profile with additional type overrides."""
+        merged = dict(self.type_overrides)
+        merged.update(type_overrides)
+        return DriverProfile(self.name, self.jclassnames, self.product_names,
+                             self.stringify_dates, merged)
+
+    def matches_jclassname(self, jclassname):
+        jclassname = jclassname.lower()
+        return any(p in jclassname for p in self.jclassnames)
+
+    def matches_product_name(self, product_name):
+        product_name = product_name.lower()
+        return any(p in product_name for p in self.product_names)
+
+    def __repr__(self):
+        return 'DriverProfile(%r)' % self.name
+
+
+DEFAULT_PROFILE = DriverProfile('default')
+
+# Most recently registered first, so user profiles win over built-ins.
+# Replaced as a whole under _profiles_lock, so readers can iterate the
+# list they got without holding the lock.
+_profiles = (
+    DriverProfile('sqlite', jclassnames=['sqlite'], stringify_dates=True),
+    DriverProfile('postgresql', jclassnames=['postgresql']),
+    DriverProfile('oracle', jclassnames=['oracle']),
+    DriverProfile('mysql', jclassnames=['mysql', 'mariadb']),
+    DriverProfile('mssql', jclassnames=['sqlserver', 'jtds']),
+    DriverProfile('db2', jclassnames=['db2']),
+    DriverProfile('hsqldb', jclassnames=['hsqldb']),
+    DriverProfile('trino', jclassnames=['trino']),
+    DriverProfile('drill', jclassnames=['drill']),
+)
+_profiles_lock = threading.Lock()
+
+
+def register_driver_profile(profile):
+    """Register 'profile', replacing a registered profile of the same name."""
+    global _profiles
+    with _profiles_lock:
+        _profiles = (profile,) + tuple(p for p in _profiles if p.name != profile.name)
+
+
+def unregister_driver_profile(name):
+    """Remove the registered profile called 'name'."""
+    global _profiles
+    with _profiles_lock:
+        _profiles = tuple(p for p in _profiles if p.name != name)
+
+
+def get_driver_profile(name):
+    """Return the registered profile called 'name'."""
+    with _profiles_lock:
+        profiles = _profiles
+    for profile in profiles:
+        if profile.name == name:
+            return profile
+    raise KeyError(name)
+
+
+def select_driver_profile(jclassname=None, product_name=None):
+    """Return the profile matching the driver class name or, failing that,
+    the database product name. Returns None if no profile matches.
+
+    'product_name' may be a callable returning the name. It is only called
+    when no profile matches the driver class name and a registered profile
+    has product_names, which spares a DatabaseMetaData round trip.
+    """
+    with _profiles_lock:
+        profiles = _profiles
+    if jclassname:
+        for profile in profiles:
+            if profile.matches_jclassname(jclassname):
+                return profile
+    candidates = [p for p in profiles if p.product_names]
+    if not candidates:
+        return None
+    if callable(product_name):
+        product_name = product_name()
+    if product_name:
+        for profile in candidates:
+            if profile.matches_product_name(product_name):
+                return profile
+    return None
+
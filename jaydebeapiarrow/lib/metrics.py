@@ -0,0 +1,275 @@
+"""Process-wide metrics: counters, histograms and gauges.
+
+REGISTRY (jaydebeapiarrow.METRICS) adds up what all cursors of the process
+did, unlike Cursor.stats, which covers one query. It is exported as a dict
+with as_dict() or in the Prometheus text format with to_prometheus(), e.g.
+to serve from an application's /metrics endpoint. Throughput follows from
+the counters: rows per second of fetching is
+jaydebeapiarrow_rows_fetched_total / jaydebeapiarrow_fetch_seconds_total,
+or the rate() of the row counter in Prometheus.
+
+Values kept in Java (legacy temporal fallbacks and allocator usage) are
+read when the registry is exported, and only once the JVM is running.
+
+This module is imported with the package and must stay free of pyarrow
+and jpype imports.
+"""
+
+import bisect
+import math
+import sys
+import threading
+
+# Upper bounds of the histogram buckets.
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+ROW_BUCKETS = (1, 10, 100, 1000, 10000, 100000, 1000000)
+BYTE_BUCKETS = (1 << 10, 1 << 14, 1 << 17, 1 << 20, 1 << 23, 1 << 26, 1 << 30)
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        return repr(value)
+    return str(value)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{%s}' % ','.join('%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                             for name, value in labels)
+
+
+class Counter(object):
+    """Monotonically increasing count."""
+
+    type = 'counter'
+
+    def __init__(self, name, documentation):
+        self.name = name
+        self.documentation = documentation
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self):
+        return self._value
+
+    def reset(self):
+        with self._lock:
+            self._value = 0
+
+    def samples(self):
+        return [(self.name, (), self._value)]
+
+    def as_dict(self):
+        return self._value
+
+
+class Histogram(object):
+    """Distribution of observed values over fixed buckets."""
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def reset(self):
+        with self._lock:
+            # One count per bucket plus one for values above the last bound.
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0
+            self._count = 0
+
+    def _cumulative(self):
+        with self._lock:
+            counts, total, count = list(self._counts), self._sum, self._count
+        cumulative = []
+        running = 0
+        for bound, n in zip(self.buckets + (float('inf'),), counts):
+            running += n
+            cumulative.append((bound, running))
+        return cumulative, total, count
+
+    def samples(self):
+        cumulative, total, count = self._cumulative()
+        samples = [(self.name + '_bucket', (('le', _format_value(float(bound))),), n)
+                   for bound, n in cumulative]
+        samples.append((self.name + '_sum', (), total))
+        samples.append((self.name + '_count', (), count))
+        return samples
+
+    def as_dict(self):
+        cumulative, total, count = self._cumulative()
+        return {'buckets': {_format_value(float(bound)): n for bound, n in cumulative},
+                'sum': total, 'count': count}
+
+
+class CallbackMetric(object):
+    """Counter or gauge whose value is read from 'fn' on export.
+
+    fn() returns a number, a list of (labels, value) pairs where labels is
+    a tuple of (name, value) pairs, or None when there is no value yet.
+    """
+
+    def __init__(self, name, documentation, type, fn):
+        self.name = name
+        self.documentation = documentation
+        self.type = type
+        self._fn = fn
+
+    def reset(self):
+        pass
+
+    def _read(self):
+        value = self._fn()
+        if value is None:
+            return []
+        if isinstance(value, list):
+            return value
+        return [((), value)]
+
+    def samples(self):
+        return [(self.name, labels, value) for labels, value in self._read()]
+
+    def as_dict(self):
+        values = self._read()
+        if len(values) == 1 and not values[0][0]:
+            return values[0][1]
+        if not values:
+            return None
+        return {','.join(str(v) for _, v in labels): value for labels, value in values}
+
+
+class MetricsRegistry(object):
+    """Named collection of metrics, exported together."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError("Metric %r is already registered" % metric.name)
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation):
+        return self._register(Counter(name, documentation))
+
+    def histogram(self, name, documentation, buckets=DURATION_BUCKETS):
+        return self._register(Histogram(name, documentation, buckets))
+
+    def callback(self, name, documentation, type, fn):
+        return self._register(CallbackMetric(name, documentation, type, fn))
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def _snapshot(self):
+        with self._lock:
+            return list(self._metrics.values())
+
+    def reset(self):
+        """Set all counters and histograms back to zero. Values read from
+        Java are not affected."""
+        for metric in self._snapshot():
+            metric.reset()
+
+    def as_dict(self):
+        """Return {name: value}. Histograms are exported as
+        {'buckets': {upper bound: cumulative count}, 'sum': ..., 'count': ...}
+        and labelled values as {label value: value}."""
+        return {metric.name: metric.as_dict() for metric in self._snapshot()}
+
+    def to_prometheus(self):
+        """Return the metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._snapshot():
+            lines.append('# HELP %s %s' % (metric.name, metric.documentation))
+            lines.append('# TYPE %s %s' % (metric.name, metric.type))
+            for name, labels, value in metric.samples():
+                lines.append('%s%s %s' % (name, _format_labels(labels), _format_value(value)))
+        return '\n'.join(lines) + '\n'
+
+
+def _java_class(name):
+    """Return the Java class 'name' if the JVM is running, else None."""
+    jpype = sys.modules.get('jpype')
+    if jpype is None or not jpype.isJVMStarted():
+        return None
+    try:
+        return jpype.JClass(name)
+    except Exception:
+        return None
+
+
+def _legacy_temporal_fallbacks():
+    time_utils = _java_class('org.jaydebeapiarrow.extension.TimeUtils')
+    if time_utils is None:
+        return None
+    counts = time_utils.getLegacyFallbackCounts()
+    return [((('kind', kind),), int(count)) for kind, count in zip(('date', 'time', 'timestamp'), counts)]
+
+
+def _allocator_value(getter):
+    def read():
+        allocator = _java_class('org.jaydebeapiarrow.extension.AllocatorSingleton')
+        if allocator is None:
+            return None
+        return int(getattr(allocator, getter)())
+    return read
+
+
+REGISTRY = MetricsRegistry()
+
+QUERIES = REGISTRY.counter(
+    'jaydebeapiarrow_queries_total', 'Statements run by execute() and executemany().')
+EXECUTE_SECONDS = REGISTRY.histogram(
+    'jaydebeapiarrow_execute_seconds', 'Time to prepare, bind and execute a statement.')
+ROWS_FETCHED = REGISTRY.counter(
+    'jaydebeapiarrow_rows_fetched_total', 'Rows read from result sets.')
+BYTES_IMPORTED = REGISTRY.counter(
+    'jaydebeapiarrow_arrow_bytes_imported_total', 'Buffer size of the Arrow batches imported into pyarrow.')
+BATCHES_FETCHED = REGISTRY.counter(
+    'jaydebeapiarrow_batches_fetched_total', 'Arrow batches read from result sets.')
+FETCH_SECONDS = REGISTRY.counter(
+    'jaydebeapiarrow_fetch_seconds_total', 'Time spent reading JDBC rows into Arrow vectors.')
+BATCH_ROWS = REGISTRY.histogram(
+    'jaydebeapiarrow_batch_rows', 'Rows per Arrow batch.', ROW_BUCKETS)
+BATCH_BYTES = REGISTRY.histogram(
+    'jaydebeapiarrow_batch_bytes', 'Buffer size per Arrow batch.', BYTE_BUCKETS)
+BIND_FALLBACKS = REGISTRY.counter(
+    'jaydebeapiarrow_bind_fallbacks_total',
+    'Statements whose parameters were bound with setObject() instead of an Arrow stream.')
+DRIVER_CACHE_HITS = REGISTRY.counter(
+    'jaydebeapiarrow_driver_cache_hits_total', 'connect() calls that reused a loaded JDBC driver.')
+DRIVER_CACHE_MISSES = REGISTRY.counter(
+    'jaydebeapiarrow_driver_cache_misses_total', 'connect() calls that loaded a JDBC driver.')
+REGISTRY.callback(
+    'jaydebeapiarrow_legacy_temporal_fallbacks_total',
+    'Drivers that fell back from getObject() to the legacy temporal getters, per column kind.',
+    'counter', _legacy_temporal_fallbacks)
+REGISTRY.callback(
+    'jaydebeapiarrow_allocator_allocated_bytes', 'Bytes currently allocated by the Arrow allocator in the JVM.',
+    'gauge', _allocator_value('getAllocatedMemory'))
+REGISTRY.callback(
+    'jaydebeapiarrow_allocator_peak_bytes', 'Peak allocation of the Arrow allocator in the JVM.',
+    'gauge', _allocator_value('getPeakMemoryAllocation'))
@@ -0,0 +1,172 @@
+"""Per-query phase timings and trace hooks.
+
+Every cursor records a QueryStats for the query it runs, available as
+Cursor.stats. Functions registered with add_trace_hook() are called with
+the event name and that QueryStats after each execute, executemany and
+fetch call, so applications can export timings without wrapping cursors.
+
+Connections opened with slow_query_ms or large_result_rows log the queries
+crossing these thresholds through the 'jaydebeapiarrow.queries' logger, see
+log_query().
+
+This module is imported with the package and must stay free of pyarrow
+and jpype imports.
+"""
+
+import threading
+
+from jaydebeapiarrow.lib import metrics
+
+# Phases of a query, in the order they happen.
+#   prepare  Connection.prepareStatement()
+#   bind     binding the parameters (see QueryStats.bind_path)
+#   execute  PreparedStatement.execute() / executeBatch()
+#   fetch    ArrowVectorIterator.next() in Java: reading JDBC rows and
+#            filling the Arrow vectors, timed with System.nanoTime()
+#   export   exporting batches through the C Data Interface in Java
+#   import   importing batches into pyarrow
+#   rows     building Python row tuples (row fetches only)
+PHASES = ('prepare', 'bind', 'execute', 'fetch', 'export', 'import', 'rows')
+
+_trace_hooks = []
+_trace_hooks_lock = threading.Lock()
+
+QUERY_LOGGER = 'jaydebeapiarrow.queries'
+
+# Longest SQL text written to the query log; longer statements are cut.
+MAX_LOGGED_SQL = 2000
+
+
+class QueryStats(object):
+    """Phase durations and result size of one query of a cursor.
+
+    Durations are in seconds and add up over all fetch calls of the query.
+    'rows', 'batches' and 'bytes' count the Arrow batches read so far;
+    'bytes' is the size of their buffers. 'bind_path' is 'arrow' when the
+    parameters were bound from an Arrow stream, 'fallback' when they went
+    through setObject(), and None without parameters.
+    """
+
+    def __init__(self, operation=None):
+        self.operation = operation
+        self.durations = dict.fromkeys(PHASES, 0.0)
+        self.rows = 0
+        self.batches = 0
+        self.bytes = 0
+        self.bind_path = None
+        self._java = None
+        self._java_pending = False
+
+    def add(self, phase, seconds):
+        self.durations[phase] += seconds
+
+    def record_batch(self, batch):
+        rows = batch.num_rows
+        nbytes = batch.nbytes
+        self.rows += rows
+        self.batches += 1
+        self.bytes += nbytes
+        metrics.ROWS_FETCHED.inc(rows)
+        metrics.BATCHES_FETCHED.inc()
+        metrics.BYTES_IMPORTED.inc(nbytes)
+        metrics.BATCH_ROWS.observe(rows)
+        metrics.BATCH_BYTES.observe(nbytes)
+
+    def java_stats(self):
+        """Return the Java FetchStats the fetch time is recorded in."""
+        if self._java is None:
+            import jpype
+            self._java = jpype.JClass('org.jaydebeapiarrow.extension.FetchStats')()
+        self._java_pending = True
+        return self._java
+
+    def sync(self):
+        """Copy the fetch time recorded in Java since the last sync."""
+        if self._java_pending:
+            self._java_pending = False
+            fetch = self._java.getFetchNanos() / 1e9
+            metrics.FETCH_SECONDS.inc(fetch - self.durations['fetch'])
+            self.durations['fetch'] = fetch
+
+    @property
+    def total(self):
+        return sum(self.durations.values())
+
+    def as_dict(self):
+        return {
+            'operation': self.operation,
+            'durations': dict(self.durations),
+            'total': self.total,
+            'rows': self.rows,
+            'batches': self.batches,
+            'bytes': self.bytes,
+            'bind_path': self.bind_path,
+        }
+
+    def __repr__(self):
+        phases = ', '.join('%s=%.6f' % (phase, self.durations[phase])
+                           for phase in PHASES if self.durations[phase])
+        return 'QueryStats(rows=%d, batches=%d, bytes=%d, %s)' % (
+            self.rows, self.batches, self.bytes, phases or 'no timings')
+
+
+def add_trace_hook(fn):
+    """Call fn(event, stats) after every execute, executemany and fetch.
+
+    'event' is the name of the cursor method ('execute', 'executemany',
+    'fetchone', 'fetchmany', 'fetchall' or 'fetch_arrow_batches') and
+    'stats' the QueryStats of the cursor's query, which later calls keep
+    updating. Exceptions raised by a hook are logged and otherwise ignored.
+    """
+    with _trace_hooks_lock:
+        _trace_hooks.append(fn)
+
+
+def remove_trace_hook(fn):
+    with _trace_hooks_lock:
+        try:
+            _trace_hooks.remove(fn)
+        except ValueError:
+            pass
+
+
+def summarize_parameters(parameters, is_batch=False):
+    """Describe 'parameters' by their number and types, never their values,
+    which may be sensitive."""
+    if not parameters:
+        return 'none'
+    if is_batch:
+        if not isinstance(parameters, (list, tuple)):
+            return 'batch of unknown size'
+        return '%d rows of %s' % (len(parameters), summarize_parameters(parameters[0]))
+    names = [type(p).__name__ for p in parameters[:10]]
+    if len(parameters) > 10:
+        names.append('...')
+    return '%d (%s)' % (len(parameters), ', '.join(names))
+
+
+def log_query(reason, stats, parameters):
+    """Log a query that crossed a threshold of its connection at WARNING
+    level: 'reason', the SQL, the parameter summary, the result size and the
+    phase timings. The QueryStats are attached to the record as a dict in
+    the 'query_stats' attribute for structured handlers."""
+    import logging
+    logger = logging.getLogger(QUERY_LOGGER)
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+    sql = stats.operation or ''
+    if len(sql) > MAX_LOGGED_SQL:
+        sql = sql[:MAX_LOGGED_SQL] + '...'
+    logger.warning("%s: %s; parameters: %s; %r", reason, sql, parameters, stats,
+                   extra={'query_stats': stats.as_dict()})
+
+
+def emit(event, stats):
+    if not _trace_hooks:
+        return
+    for fn in list(_trace_hooks):
+        try:
+            fn(event, stats)
+        except Exception:
+            import logging
+            logging.getLogger(__name__).warning("Trace hook %r failed", fn, exc_info=True)
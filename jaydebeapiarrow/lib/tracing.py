@@ -0,0 +1,153 @@
+"""Optional OpenTelemetry spans for connect, execute and fetch calls.
+
+Tracing is off until enable_tracing() is called. It needs the
+opentelemetry-api package (pip install jaydebeapiarrow[opentelemetry]),
+which is imported only then; while tracing is off a traced method costs
+one extra function call.
+
+Spans are children of the span current in the caller. The spans of
+connect(), execute() and the fetch methods that return are made current
+while the call runs, so fetch_arrow_batches() called from
+fetch_arrow_table() is nested under it. The span of fetch_arrow_batches()
+itself is not made current: it stays open across the yields, while the
+consumer's code runs, and ends when the generator is exhausted or closed.
+"""
+
+import contextlib
+import functools
+import re
+
+_tracer = None
+_trace = None
+_context = None
+
+_NO_SPAN = contextlib.nullcontext()
+
+# Comments, string literals and numeric literals, in one pattern so that
+# e.g. '--' inside a string is not taken for a comment.
+_FINGERPRINT_RE = re.compile(
+    r"(?P<comment>--[^\n]*|/\*.*?\*/)"
+    r"|'(?:[^']|'')*'"
+    r"|\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b",
+    re.S)
+_SPACE_RE = re.compile(r"\s+")
+
+
+def enable_tracing(tracer_provider=None):
+    """Record connect, execute, executemany and fetch calls as spans.
+
+    tracer_provider: TracerProvider to create the tracer from; defaults to
+          the globally configured one.
+    """
+    global _tracer, _trace, _context
+    try:
+        from opentelemetry import context, trace
+    except ImportError:
+        raise ImportError(
+            "Tracing requires opentelemetry-api. "
+            "Install it with: pip install jaydebeapiarrow[opentelemetry]"
+        )
+    _trace = trace
+    _context = context
+    _tracer = trace.get_tracer('jaydebeapiarrow', tracer_provider=tracer_provider)
+
+
+def disable_tracing():
+    """Stop recording spans. Spans already started still end normally."""
+    global _tracer
+    _tracer = None
+
+
+@functools.lru_cache(maxsize=256)
+def sql_fingerprint(operation):
+    """Return 'operation' with comments removed, string and numeric
+    literals replaced by '?' and whitespace collapsed, so that statements
+    differing only in their literals share a fingerprint and no literal
+    values end up in traces.
+    """
+    def replace(match):
+        return ' ' if match.group('comment') else '?'
+    return _SPACE_RE.sub(' ', _FINGERPRINT_RE.sub(replace, operation)).strip()
+
+
+def _query_attributes(cursor):
+    attributes = {}
+    stats = cursor._stats
+    if stats is not None:
+        if stats.operation:
+            attributes['db.query.text'] = sql_fingerprint(stats.operation)
+        attributes['db.response.returned_rows'] = stats.rows
+        attributes['jaydebeapiarrow.batches'] = stats.batches
+        attributes['jaydebeapiarrow.bytes'] = stats.bytes
+        if stats.bind_path is not None:
+            attributes['jaydebeapiarrow.bind_path'] = stats.bind_path
+    if cursor.rowcount != -1:
+        attributes['jaydebeapiarrow.rowcount'] = cursor.rowcount
+    return attributes
+
+
+class _Span(object):
+
+    def __init__(self, name, cursor=None, attributes=None, activate=True):
+        self._span = _tracer.start_span(name, kind=_trace.SpanKind.CLIENT, attributes=attributes)
+        self._cursor = cursor
+        self._token = None
+        if activate:
+            self._token = _context.attach(_trace.set_span_in_context(self._span))
+
+    def __enter__(self):
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self._cursor is not None:
+                self._span.set_attributes(_query_attributes(self._cursor))
+            # GeneratorExit only means the consumer stopped iterating early.
+            if exc is not None and not isinstance(exc, GeneratorExit):
+                self._span.record_exception(exc)
+                self._span.set_status(_trace.Status(_trace.StatusCode.ERROR, str(exc)))
+        finally:
+            if self._token is not None:
+                _context.detach(self._token)
+            self._span.end()
+        return False
+
+
+def span(name, cursor=None, attributes=None, activate=True):
+    """Return a context manager recording the enclosed block as span 'name',
+    or a no-op one while tracing is off. With a 'cursor', the span gets the
+    fingerprint and result size of its query when the block ends.
+    """
+    if _tracer is None:
+        return _NO_SPAN
+    return _Span(name, cursor, attributes, activate)
+
+
+def traced(name):
+    """Decorate the Cursor method 'name' to run in a span."""
+    span_name = 'Cursor.' + name
+
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(cursor, *args, **kwargs):
+            if _tracer is None:
+                return method(cursor, *args, **kwargs)
+            with _Span(span_name, cursor):
+                return method(cursor, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def traced_generator(name):
+    """Like traced(), for a Cursor method returning a generator; the span
+    covers the iteration, from the first batch until the generator ends.
+    """
+    span_name = 'Cursor.' + name
+
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(cursor, *args, **kwargs):
+            with span(span_name, cursor, activate=False):
+                return (yield from method(cursor, *args, **kwargs))
+        return wrapper
+    return decorate
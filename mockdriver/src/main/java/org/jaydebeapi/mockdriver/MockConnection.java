@@ -12,6 +12,7 @@ import org.mockito.Mockito;
 public abstract class MockConnection implements Connection {
 
   ResultSet mockResultSet;
+  PreparedStatement mockPreparedStatement;
 
   private static Throwable createException(String className, String exceptionMessage) {
     try {
@@ -114,6 +115,40 @@ public abstract class MockConnection implements Connection {
     stubPrepareStatement(mockPreparedStatement);
   }
 
+  /** CLOB result whose value is read through getString() or getCharacterStream(). */
+  public final void mockClobResult(String value) throws SQLException {
+    PreparedStatement mockPreparedStatement = Mockito.mock(PreparedStatement.class);
+    Mockito.when(mockPreparedStatement.execute()).thenReturn(true);
+    mockResultSet = Mockito.mock(ResultSet.class, "ResultSet(for clob)");
+    Mockito.when(mockPreparedStatement.getResultSet()).thenReturn(mockResultSet);
+    Mockito.when(mockResultSet.next()).thenReturn(true);
+    ResultSetMetaData mockMetaData = Mockito.mock(ResultSetMetaData.class);
+    mockGeneralResultSetMetaData(mockMetaData, Types.CLOB);
+    Mockito.when(mockResultSet.getString(1)).thenReturn(value);
+    Mockito.when(mockResultSet.getCharacterStream(1))
+        .thenAnswer(invocation -> new java.io.StringReader(value));
+    Mockito.when(mockResultSet.wasNull()).thenReturn(false);
+    Mockito.when(mockResultSet.getMetaData()).thenReturn(mockMetaData);
+    stubPrepareStatement(mockPreparedStatement);
+  }
+
+  /** BLOB result whose value is read through getBinaryStream(). */
+  public final void mockBlobResult(byte[] value) throws SQLException {
+    PreparedStatement mockPreparedStatement = Mockito.mock(PreparedStatement.class);
+    Mockito.when(mockPreparedStatement.execute()).thenReturn(true);
+    mockResultSet = Mockito.mock(ResultSet.class, "ResultSet(for blob)");
+    Mockito.when(mockPreparedStatement.getResultSet()).thenReturn(mockResultSet);
+    Mockito.when(mockResultSet.next()).thenReturn(true);
+    ResultSetMetaData mockMetaData = Mockito.mock(ResultSetMetaData.class);
+    mockGeneralResultSetMetaData(mockMetaData, Types.BLOB);
+    Mockito.when(mockResultSet.getBytes(1)).thenReturn(value);
+    Mockito.when(mockResultSet.getBinaryStream(1))
+        .thenAnswer(invocation -> new java.io.ByteArrayInputStream(value));
+    Mockito.when(mockResultSet.wasNull()).thenReturn(false);
+    Mockito.when(mockResultSet.getMetaData()).thenReturn(mockMetaData);
+    stubPrepareStatement(mockPreparedStatement);
+  }
+
   public final void mockExceptionOnExecuteWithCause(String className, String message,
       String causeClassName, String causeMessage) throws SQLException {
     PreparedStatement mockPreparedStatement = Mockito.mock(PreparedStatement.class);
@@ -199,6 +234,7 @@ public abstract class MockConnection implements Connection {
     // causing precision overflow when setScale pads trailing zeros.
     BigDecimal bdValue = BigDecimal.valueOf(value);
     Mockito.when(mockResultSet.getObject(1)).thenReturn(bdValue);
+    Mockito.when(mockResultSet.getLong(1)).thenReturn(value);
     Mockito.when(mockResultSet.wasNull()).thenReturn(false);
     stubPrepareStatement(mockPreparedStatement);
   }
@@ -233,6 +269,7 @@ public abstract class MockConnection implements Connection {
     Mockito.when(mockResultSet.getMetaData()).thenReturn(mockMetaData);
 
     Mockito.when(mockResultSet.getObject(1)).thenReturn(value);
+    Mockito.when(mockResultSet.getDouble(1)).thenReturn(value.doubleValue());
     Mockito.when(mockResultSet.wasNull()).thenReturn(false);
     stubPrepareStatement(mockPreparedStatement);
   }
@@ -306,6 +343,24 @@ public abstract class MockConnection implements Connection {
     stubPrepareStatement(mockPreparedStatement);
   }
 
+  /** DATE column of NULLs whose getObject(1, LocalDate.class) throws NullPointerException, like DB2.
+   *  The extra interface gives the mock its own class, and so its own TemporalSupport. */
+  public final void mockNullPointerOnNullDateResult() throws SQLException {
+    PreparedStatement mockPreparedStatement = Mockito.mock(PreparedStatement.class);
+    Mockito.when(mockPreparedStatement.execute()).thenReturn(true);
+    mockResultSet = Mockito.mock(ResultSet.class, Mockito.withSettings()
+        .name("ResultSet(for NULL date throwing NPE)").extraInterfaces(Cloneable.class));
+    Mockito.when(mockPreparedStatement.getResultSet()).thenReturn(mockResultSet);
+    Mockito.when(mockResultSet.next()).thenReturn(true);
+    ResultSetMetaData mockMetaData = Mockito.mock(ResultSetMetaData.class);
+    mockGeneralResultSetMetaData(mockMetaData, Types.DATE);
+    Mockito.when(mockResultSet.getMetaData()).thenReturn(mockMetaData);
+    Mockito.when(mockResultSet.getObject(1, LocalDate.class)).thenThrow(new NullPointerException());
+    Mockito.when(mockResultSet.getDate(Mockito.eq(1), Mockito.any(Calendar.class))).thenReturn(null);
+    Mockito.when(mockResultSet.wasNull()).thenReturn(true);
+    stubPrepareStatement(mockPreparedStatement);
+  }
+
   public final void mockType(String sqlTypesName) throws SQLException {
     PreparedStatement mockPreparedStatement = Mockito.mock(PreparedStatement.class);
     Mockito.when(mockPreparedStatement.execute()).thenReturn(true);
@@ -463,6 +518,31 @@ public abstract class MockConnection implements Connection {
     stubPrepareStatement(mockPreparedStatement);
   }
 
+  /** TIMESTAMP WITH TIME ZONE result read through the legacy getTimestamp(int, Calendar)
+   *  path. Like real drivers, the answer writes the value into the caller's Calendar,
+   *  so a Calendar shared between concurrently read result sets corrupts values. */
+  public final void mockCalendarTimestampTZResult(LocalDateTime utcDateTime) throws SQLException {
+    PreparedStatement mockPreparedStatement = Mockito.mock(PreparedStatement.class);
+    Mockito.when(mockPreparedStatement.execute()).thenReturn(true);
+    mockResultSet = Mockito.mock(ResultSet.class, "ResultSet(for calendar timestamp)");
+    Mockito.when(mockPreparedStatement.getResultSet()).thenReturn(mockResultSet);
+    Mockito.when(mockResultSet.next()).thenReturn(true);
+    ResultSetMetaData mockMetaData = Mockito.mock(ResultSetMetaData.class);
+    mockGeneralResultSetMetaData(mockMetaData, Types.TIMESTAMP_WITH_TIMEZONE);
+    Mockito.when(mockResultSet.getMetaData()).thenReturn(mockMetaData);
+    Mockito.when(mockResultSet.getObject(1, LocalDateTime.class))
+        .thenThrow(new SQLFeatureNotSupportedException("getObject(LocalDateTime) not supported"));
+    Mockito.when(mockResultSet.getTimestamp(Mockito.eq(1), Mockito.any(Calendar.class))).thenAnswer(invocation -> {
+      Calendar calendar = invocation.getArgument(1);
+      calendar.clear();
+      calendar.set(utcDateTime.getYear(), utcDateTime.getMonthValue() - 1, utcDateTime.getDayOfMonth(),
+          utcDateTime.getHour(), utcDateTime.getMinute(), utcDateTime.getSecond());
+      Thread.yield();
+      return new Timestamp(calendar.getTimeInMillis());
+    });
+    stubPrepareStatement(mockPreparedStatement);
+  }
+
   public final void mockExceptionOnFetch(String className, String exceptionMessage) throws SQLException {
     PreparedStatement mockPreparedStatement = Mockito.mock(PreparedStatement.class);
     Mockito.when(mockPreparedStatement.execute()).thenReturn(true);
@@ -483,10 +563,21 @@ public abstract class MockConnection implements Connection {
     return Mockito.verify(mockResultSet);
   }
 
-  /** Stub both prepareStatement overloads (single-arg and two-arg with autoGeneratedKeys). */
+  public final PreparedStatement verifyPreparedStatement() {
+    return Mockito.verify(mockPreparedStatement);
+  }
+
+  public final Connection verifyConnection() {
+    return Mockito.verify(this);
+  }
+
+  /** Stub the prepareStatement overloads (single-arg, two-arg with autoGeneratedKeys
+   *  and three-arg with result set type and concurrency). */
   private void stubPrepareStatement(PreparedStatement ps) throws SQLException {
+    mockPreparedStatement = ps;
     Mockito.when(this.prepareStatement(Mockito.any())).thenReturn(ps);
     Mockito.when(this.prepareStatement(Mockito.any(), Mockito.anyInt())).thenReturn(ps);
+    Mockito.when(this.prepareStatement(Mockito.any(), Mockito.anyInt(), Mockito.anyInt())).thenReturn(ps);
   }
 
   /** Set up a multi-column mock result for testing mixed-type queries.
@@ -120,6 +120,52 @@ class HsqldbArrayTypeTest(unittest.TestCase):
         self.assertIsInstance(result[0], list)
         self.assertEqual(result[0], [1.5, 2.5, 3.5])
 
+    def test_lob_max_length_does_not_truncate_array_elements(self):
+        # The CLOB is column 2, the column index ARRAY elements are read
+        # from; only the CLOB itself is truncated.
+        with self.conn.cursor(lob_max_length=2) as cursor:
+            cursor.execute(
+                "SELECT str_vals, CAST('abcdef' AS CLOB) FROM test_arrays WHERE id = 1")
+            result = cursor.fetchone()
+        self.assertEqual(result, (["foo", "bar", "baz"], "ab"))
+
+    def test_read_array_element_type_from_base_type(self):
+        # "SMALLINT ARRAY" is not among the known type names; the element
+        # type comes from Array.getBaseType() on the first row.
+        with self.conn.cursor() as cursor:
+            cursor.execute("CREATE TABLE test_small_arrays (id INT, vals SMALLINT ARRAY)")
+            cursor.execute("INSERT INTO test_small_arrays VALUES (1, ARRAY[1, 2, 3])")
+            cursor.execute("INSERT INTO test_small_arrays VALUES (2, ARRAY[4])")
+            try:
+                cursor.execute("SELECT vals FROM test_small_arrays ORDER BY id")
+                result = cursor.fetchall()
+            finally:
+                cursor.execute("DROP TABLE test_small_arrays IF EXISTS")
+        self.assertEqual(result, [([1, 2, 3],), ([4],)])
+
+    def test_fetch_after_end_with_peeked_array_row(self):
+        # The peeked first row is replayed once; fetching again after the
+        # end must not replay it on the exhausted result set.
+        with self.conn.cursor() as cursor:
+            cursor.execute("CREATE TABLE test_small_arrays (id INT, vals SMALLINT ARRAY)")
+            cursor.execute("INSERT INTO test_small_arrays VALUES (1, ARRAY[1, 2, 3])")
+            try:
+                cursor.execute("SELECT vals FROM test_small_arrays")
+                results = [cursor.fetchone(), cursor.fetchone(), cursor.fetchone(), cursor.fetchall()]
+            finally:
+                cursor.execute("DROP TABLE test_small_arrays IF EXISTS")
+        self.assertEqual(results, [([1, 2, 3],), None, None, []])
+
+    def test_read_array_without_rows_to_peek(self):
+        with self.conn.cursor() as cursor:
+            cursor.execute("CREATE TABLE test_small_arrays (id INT, vals SMALLINT ARRAY)")
+            try:
+                cursor.execute("SELECT vals FROM test_small_arrays")
+                result = cursor.fetchall()
+            finally:
+                cursor.execute("DROP TABLE test_small_arrays IF EXISTS")
+        self.assertEqual(result, [])
+
     def test_bind_string_list(self):
         with self.conn.cursor() as cursor:
             cursor.execute(
@@ -232,6 +232,72 @@ print('OK')
         stdout, stderr = self._run_in_subprocess(code)
         self.assertEqual(stdout, 'OK', f'Dynamic load failed: {stderr}')
 
+    def test_repeated_dynamic_connects_reuse_class_loader(self):
+        """Connecting again with the same driver JAR reuses the loaded driver
+        instead of creating another URLClassLoader."""
+        jar = self._find_primary_jar()
+        driver = self._primary_driver_class()
+        url = self._primary_jdbc_url()
+        args = self._primary_driver_args()
+        code = f'''
+import jaydebeapiarrow
+
+conn1 = jaydebeapiarrow.connect(
+    {repr(driver)},
+    {repr(url)},
+    driver_args={repr(args)}
+)
+conn1.close()
+
+for _ in range(3):
+    conn = jaydebeapiarrow.connect(
+        {repr(driver)},
+        {repr(url)},
+        driver_args={repr(args)},
+        jars={repr(jar)},
+        experimental={{'dynamic_classpath': True}}
+    )
+    conn.close()
+print(len([key for key in jaydebeapiarrow._driver_cache if key[1] is not None]))
+'''
+        stdout, stderr = self._run_in_subprocess(code)
+        self.assertEqual(stdout, '1', f'Expected one dynamically loaded driver: {stderr}')
+
+    def test_dynamic_driver_registered_through_java_shim(self):
+        """The dynamically loaded driver is registered with DriverManager
+        through the Java DriverShim from the extension jar."""
+        jar = self._find_primary_jar()
+        driver = self._primary_driver_class()
+        url = self._primary_jdbc_url()
+        args = self._primary_driver_args()
+        code = f'''
+import jaydebeapiarrow
+import jpype
+
+conn1 = jaydebeapiarrow.connect(
+    {repr(driver)},
+    {repr(url)},
+    driver_args={repr(args)}
+)
+conn1.close()
+
+conn2 = jaydebeapiarrow.connect(
+    {repr(driver)},
+    {repr(url)},
+    driver_args={repr(args)},
+    jars={repr(jar)},
+    experimental={{'dynamic_classpath': True}}
+)
+conn2.close()
+drivers = jpype.java.sql.DriverManager.getDrivers()
+names = []
+while drivers.hasMoreElements():
+    names.append(str(drivers.nextElement().getClass().getName()))
+print('org.jaydebeapiarrow.extension.DriverShim' in names)
+'''
+        stdout, stderr = self._run_in_subprocess(code)
+        self.assertEqual(stdout, 'True', f'DriverShim not registered: {stderr}')
+
     def test_dynamic_load_without_flag_raises_error(self):
         """Without dynamic_classpath flag, connecting with new JARs after JVM
         start should raise InterfaceError (fork guard)."""
@@ -616,3 +682,53 @@ class PropertiesDriverArgsPassingTest(unittest.TestCase):
                                      {'user': 'SA', 'password': '' } )
         c = _connect(driver, url, driver_args)
         c.close()
+
+
+# ---------------------------------------------------------------------------
+# Import time
+# ---------------------------------------------------------------------------
+
+class ImportTimeTest(unittest.TestCase):
+    """`import jaydebeapiarrow` must not load pyarrow, cffi or jpype; they are
+    imported on the first connect() or fetch. Measured with -X importtime.
+    """
+
+    HEAVY_MODULES = ('pyarrow', 'cffi', '_cffi_backend', 'jpype', '_jpype', 'importlib.metadata',
+                     'opentelemetry')
+
+    # Generous bound on the cumulative import time of the package itself;
+    # with the heavy modules deferred it is a few milliseconds.
+    MAX_IMPORT_US = 200_000
+
+    def _import_times(self, code):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            capture_output=True, text=True, timeout=60,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            times[name.strip()] = int(cumulative)
+        return times
+
+    def test_import_does_not_load_heavy_modules(self):
+        baseline = self._import_times('pass')
+        times = self._import_times('import jaydebeapiarrow')
+        loaded = [name for name in times
+                  if name not in baseline
+                  and (name in self.HEAVY_MODULES or name.split('.')[0] in self.HEAVY_MODULES)]
+        self.assertEqual(loaded, [])
+        self.assertLess(times['jaydebeapiarrow'], self.MAX_IMPORT_US)
+
+    def test_version_and_exports_resolve_lazily(self):
+        code = (
+            'import sys, jaydebeapiarrow\n'
+            'assert "pyarrow" not in sys.modules\n'
+            'assert isinstance(jaydebeapiarrow.__version__, str)\n'
+            'assert len(jaydebeapiarrow.__version_info__) == 3\n'
+            'assert jaydebeapiarrow.StringInternCache is not None\n'
+            'assert "pyarrow" in sys.modules\n')
+        self._import_times(code)
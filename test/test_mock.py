@@ -22,6 +22,7 @@ from datetime import datetime
 from decimal import Decimal
 import os
 import sys
+import tempfile
 import threading
 from functools import partial
 
@@ -35,6 +36,13 @@ try:
 except ImportError:
     import unittest
 
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:
+    TracerProvider = None
+
 class MockTest(unittest.TestCase):
 
     def setUp(self):
@@ -80,6 +88,26 @@ class MockTest(unittest.TestCase):
             result = cursor.fetchone()
         self.assertEqual(result[0], date)
 
+    def test_time_keeps_fractional_seconds(self):
+        self.conn.jconn.mockType('TIME')
+        with self.conn.cursor() as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertEqual(result[0], datetime(2000, 1, 1, 8, 20, 45, 600000).time())
+
+    def test_time_unit_selects_arrow_time_type(self):
+        import pyarrow as pa
+        for time_unit, arrow_type in (('ms', pa.time32('ms')), ('us', pa.time64('us'))):
+            self.conn.jconn.mockType('TIME')
+            with self.conn.cursor(time_unit=time_unit) as cursor:
+                cursor.execute("dummy stmt")
+                batches = cursor.fetch_arrow_batches()
+                batch = next(batches)
+                batches.close()
+            self.assertEqual(batch.column(0).type, arrow_type)
+            self.assertEqual(batch.column(0)[0].as_py(),
+                             datetime(2000, 1, 1, 8, 20, 45, 600000).time())
+
     def test_decimal_scale_zero(self):
         self.conn.jconn.mockBigDecimalResult(12345, 0)
         with self.conn.cursor() as cursor:
@@ -181,6 +209,52 @@ class MockTest(unittest.TestCase):
         self.assertIn("CAST(column AS DECIMAL(38, 0))", message)
         self.assertIn("cast it to VARCHAR", message)
 
+    def test_decimal_long_path_rounds_to_vector_scale(self):
+        """Columns with precision <= 18 are written from the unscaled long
+        value; rounding to the vector scale still uses HALF_UP."""
+        import jpype
+        BigDecimal = jpype.JClass("java.math.BigDecimal")
+        self.conn.jconn.mockHighPrecisionDecimalResult(BigDecimal("-1234.565"), 10, 2)
+        with self.conn.cursor() as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertEqual(result[0], Decimal("-1234.57"))
+
+    def test_decimal_long_path_rounds_scale_zero(self):
+        """Fractional values in a scale-0 column are rounded HALF_UP, not
+        truncated."""
+        import jpype
+        BigDecimal = jpype.JClass("java.math.BigDecimal")
+        self.conn.jconn.mockHighPrecisionDecimalResult(BigDecimal("2.7"), 10, 0)
+        with self.conn.cursor() as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertEqual(result[0], Decimal("3"))
+
+    def test_decimal_scale_zero_reads_get_long_after_exact_first_value(self):
+        """Once the first value is a BigDecimal without fraction digits, the
+        following values of a scale-0 column are read with getLong()."""
+        import jpype
+        Mockito = jpype.JClass("org.mockito.Mockito")
+        self.conn.jconn.mockIntegerDecimalResult(12345, 10, 0)
+        with self.conn.cursor() as cursor:
+            cursor.execute("dummy stmt")
+            rows = cursor.fetchmany(3)
+            # The mock has no last row, so one batch of rows was read.
+            Mockito.verify(cursor._rs, Mockito.times(1)).getObject(1)
+            Mockito.verify(cursor._rs, Mockito.atLeast(2)).getLong(1)
+        self.assertEqual(rows, [(Decimal("12345"),)] * 3)
+
+    def test_decimal_long_path_overflow_has_actionable_error(self):
+        self.conn.jconn.mockIntegerDecimalResult(123456, 5, 0)
+        with self.conn.cursor() as cursor:
+            cursor.execute("dummy stmt")
+            with self.assertRaises(Exception) as cm:
+                cursor.fetchone()
+        message = str(cm.exception)
+        self.assertIn("Could not convert DECIMAL/NUMERIC value", message)
+        self.assertIn("Arrow DECIMAL(5, 0)", message)
+
     def test_decimal_cast_shaped_value_can_be_consumed(self):
         """After SQL casts constrain precision and scale to an Arrow-compatible
         shape, values should be consumed as Decimal."""
@@ -206,6 +280,90 @@ class MockTest(unittest.TestCase):
             result = cursor.fetchone()
         self.assertEqual(result[0], Decimal("42"))
 
+    def test_decimal_mode_int_when_scale0(self):
+        self.conn.jconn.mockIntegerDecimalResult(42, 10, 0)
+        with self.conn.cursor(decimal_mode='int_when_scale0') as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertEqual(result[0], 42)
+        self.assertIsInstance(result[0], int)
+
+    def test_decimal_mode_int_when_scale0_keeps_fractional_decimal(self):
+        import jpype
+        self.conn.jconn.mockNumericTypeResult(
+            jpype.JClass("java.math.BigDecimal")("99.99"), 10, 2)
+        with self.conn.cursor(decimal_mode='int_when_scale0') as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertEqual(result[0], Decimal("99.99"))
+
+    def test_decimal_mode_float64(self):
+        import jpype
+        self.conn.jconn.mockNumericTypeResult(
+            jpype.JClass("java.math.BigDecimal")("99.99"), 10, 2)
+        with self.conn.cursor(decimal_mode='float64') as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertIsInstance(result[0], float)
+        self.assertAlmostEqual(result[0], 99.99)
+
+    def test_decimal_mode_rejects_unknown_mode(self):
+        with self.assertRaises(jaydebeapiarrow.ProgrammingError):
+            self.conn.cursor(decimal_mode='fast')
+
+    def test_driver_profile_defaults_for_unknown_driver(self):
+        self.assertIs(self.conn.driver_profile, jaydebeapiarrow.DEFAULT_PROFILE)
+        self.assertIsNone(self.conn._java_profile())
+
+    def test_driver_profile_selected_from_jclassname(self):
+        profile = jaydebeapiarrow.select_driver_profile(jclassname='org.sqlite.JDBC')
+        self.assertEqual(profile.name, 'sqlite')
+        self.assertTrue(profile.stringify_dates)
+        self.assertIsNone(jaydebeapiarrow.select_driver_profile(jclassname='com.example.Driver'))
+
+    def test_driver_profile_selected_from_product_name(self):
+        self.assertIsNone(jaydebeapiarrow.select_driver_profile(
+            jclassname='com.example.Driver', product_name=lambda: self.fail("product name requested")))
+        jaydebeapiarrow.register_driver_profile(jaydebeapiarrow.DriverProfile(
+            'example', product_names=['example db']))
+        try:
+            profile = jaydebeapiarrow.select_driver_profile(
+                jclassname='com.example.Driver', product_name=lambda: 'Example DB 2.1')
+        finally:
+            jaydebeapiarrow.unregister_driver_profile('example')
+        self.assertEqual(profile.name, 'example')
+
+    def test_driver_profile_skips_metadata_without_product_name_profiles(self):
+        import jpype
+        Mockito = jpype.JClass("org.mockito.Mockito")
+        Mockito.verify(self.conn.jconn, Mockito.never()).getMetaData()
+
+    def test_driver_profile_type_spec_normalized(self):
+        profile = jaydebeapiarrow.DriverProfile(
+            'custom', type_overrides={'number(19)': 'int64', ' Number ( 10 , 2 ) ': 'float64'})
+        self.assertEqual(profile.type_overrides, {'NUMBER(19,0)': 'int64', 'NUMBER(10,2)': 'float64'})
+        with self.assertRaises(ValueError):
+            jaydebeapiarrow.DriverProfile('custom', type_overrides={'NUMBER': 'uint128'})
+
+    def test_driver_profile_type_override_reads_decimal_as_int64(self):
+        jaydebeapiarrow.register_driver_profile(jaydebeapiarrow.DriverProfile(
+            'mock', jclassnames=['mockdriver'], type_overrides={'DECIMAL(10,0)': 'int64'}))
+        try:
+            conn = jaydebeapiarrow.connect('org.jaydebeapi.mockdriver.MockDriver',
+                                           'jdbc:jaydebeapi://dummyurl')
+        finally:
+            jaydebeapiarrow.unregister_driver_profile('mock')
+        try:
+            self.assertEqual(conn.driver_profile.name, 'mock')
+            conn.jconn.mockIntegerDecimalResult(42, 10, 0)
+            with conn.cursor() as cursor:
+                cursor.execute("dummy stmt")
+                result = cursor.fetchone()
+            self.assertEqual(result[0], 42)
+            self.assertNotIsInstance(result[0], Decimal)
+        finally:
+            conn.close()
+
     def test_numeric_type_mapping(self):
         """Types.NUMERIC should follow the same DECIMAL code path in
         ExplicitTypeMapper and DecimalConsumer."""
@@ -731,6 +889,7 @@ class MockTest(unittest.TestCase):
         captured = self.conn.jconn.getCapturedSetObjectArgs()
         self.assertEqual(len(captured), 1)
         self.assertIsInstance(captured[0][1], Time)
+        self.assertEqual(captured[0][1].getTime() % 1000, 999)
 
     def test_to_java_decimal(self):
         """Decimal should convert to java.math.BigDecimal."""
@@ -852,6 +1011,63 @@ class MockTest(unittest.TestCase):
             cursor.execute("SELECT real_column AS alias_col FROM t")
             self.assertEqual(cursor.description[0][0], "alias_col")
 
+    def test_column_metadata_read_once_per_result_set(self):
+        """description and the Arrow type mapping share one metadata snapshot."""
+        import jpype
+        Mockito = jpype.JClass("org.mockito.Mockito")
+        self.conn.jconn.mockType("INTEGER")
+        with self.conn.cursor() as cursor:
+            cursor.execute("dummy stmt")
+            first = cursor.description
+            cursor.fetchone()
+            self.assertEqual(cursor.description, first)
+            self.assertEqual(first[0][0], "DummyColumn")
+            self.assertEqual(first[0][1], jaydebeapiarrow.NUMBER)
+            meta = cursor._rs.getMetaData()
+            Mockito.verify(meta, Mockito.times(1)).getColumnDisplaySize(1)
+
+    def test_arrow_description_matches_jdbc_description(self):
+        """experimental arrow_description builds the same description from
+        the Arrow schema field metadata."""
+        import jpype
+        Types = jpype.java.sql.Types
+        column_types = [Types.INTEGER, Types.VARCHAR, Types.DOUBLE]
+
+        arrow_conn = jaydebeapiarrow.connect(
+            'org.jaydebeapi.mockdriver.MockDriver', 'jdbc:jaydebeapi://dummyurl',
+            experimental={'arrow_description': True})
+        try:
+            self.conn.jconn.mockMultiColumnResult(column_types, [1, "a", 2.5])
+            arrow_conn.jconn.mockMultiColumnResult(column_types, [1, "a", 2.5])
+            with self.conn.cursor() as cursor, arrow_conn.cursor() as arrow_cursor:
+                cursor.execute("dummy stmt")
+                arrow_cursor.execute("dummy stmt")
+                self.assertEqual(arrow_cursor.description, cursor.description)
+                self.assertEqual(arrow_cursor.fetchone(), (1, "a", 2.5))
+        finally:
+            arrow_conn.close()
+
+    def test_arrow_fields_carry_jdbc_type_metadata(self):
+        """Fetched Arrow fields record the driver-reported JDBC type code
+        only with experimental arrow_description."""
+        self.conn.jconn.mockType("INTEGER")
+        with self.conn.cursor() as cursor:
+            cursor.execute("dummy stmt")
+            batch = next(cursor.fetch_arrow_batches())
+        self.assertFalse(batch.schema.field(0).metadata)
+
+        arrow_conn = jaydebeapiarrow.connect(
+            'org.jaydebeapi.mockdriver.MockDriver', 'jdbc:jaydebeapi://dummyurl',
+            experimental={'arrow_description': True})
+        try:
+            arrow_conn.jconn.mockType("INTEGER")
+            with arrow_conn.cursor() as cursor:
+                cursor.execute("dummy stmt")
+                batch = next(cursor.fetch_arrow_batches())
+            self.assertEqual(batch.schema.field(0).metadata[b'JDBC_TYPE'], b'4')
+        finally:
+            arrow_conn.close()
+
     def test_dbapi_type_other_maps_to_string(self):
         """JDBC OTHER should map to STRING type code."""
         import jpype
@@ -1127,6 +1343,158 @@ class MockTest(unittest.TestCase):
             result = cursor.fetchone()
         self.assertEqual(result[0], "Hello 🌍🌍")
 
+    # --- Dictionary-encoded string columns ---
+
+    def test_dictionary_encode_columns_rows(self):
+        self.conn.jconn.mockStringResult("active")
+        with self.conn.cursor(dictionary_encode_columns=["dummycolumn"]) as cursor:
+            cursor.execute("dummy stmt")
+            rows = cursor.fetchmany(3)
+        self.assertEqual(rows, [("active",)] * 3)
+
+    def test_dictionary_encode_columns_arrow_batch(self):
+        import pyarrow as pa
+        self.conn.jconn.mockStringResult("active")
+        with self.conn.cursor(dictionary_encode_columns="DummyColumn") as cursor:
+            cursor.execute("dummy stmt")
+            batches = cursor.fetch_arrow_batches()
+            batch = next(batches)
+            batches.close()
+        column = batch.column(0)
+        self.assertTrue(pa.types.is_dictionary(column.type))
+        self.assertEqual(column.dictionary.to_pylist(), ["active"])
+        self.assertEqual(set(column.indices.to_pylist()), {0})
+
+    def test_dictionary_encode_columns_ignores_other_columns(self):
+        import pyarrow as pa
+        self.conn.jconn.mockStringResult("active")
+        with self.conn.cursor(dictionary_encode_columns=["other"]) as cursor:
+            cursor.execute("dummy stmt")
+            batches = cursor.fetch_arrow_batches()
+            batch = next(batches)
+            batches.close()
+        self.assertEqual(batch.column(0).type, pa.string())
+
+    def test_intern_strings_shares_repeated_values(self):
+        self.conn.jconn.mockStringResult("label")
+        with self.conn.cursor(intern_strings=True) as cursor:
+            cursor.execute("dummy stmt")
+            rows = cursor.fetchmany(3000)
+        self.assertEqual(len(rows), 3000)
+        self.assertEqual(rows[0][0], "label")
+        # Rows span several batches and still share one object.
+        self.assertTrue(all(row[0] is rows[0][0] for row in rows))
+
+    def test_string_intern_cache_evicts_least_recently_used(self):
+        from jaydebeapiarrow.lib.arrow_utils import StringInternCache
+        cache = StringInternCache(maxsize=2)
+        a = cache.intern("".join(["a", "b"]))
+        cache.intern("c")
+        self.assertIs(cache.intern("".join(["a", "b"])), a)
+        cache.intern("d")
+        self.assertEqual(len(cache), 2)
+        cache.intern("c")  # evicts "ab", the least recently used
+        self.assertIsNot(cache.intern("".join(["a", "b"])), a)
+
+    # --- Large-object handling ---
+
+    def test_lob_max_length_truncates_clob(self):
+        self.conn.jconn.mockClobResult("x" * 100)
+        with self.conn.cursor(lob_max_length=10) as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertEqual(result[0], "x" * 10)
+
+    def test_lob_max_length_truncates_blob(self):
+        self.conn.jconn.mockBlobResult(bytes(range(100)))
+        with self.conn.cursor(lob_max_length=20000) as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertEqual(result[0], bytes(range(100)))
+        self.conn.jconn.mockBlobResult(bytes(range(100)))
+        with self.conn.cursor(lob_max_length=7) as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertEqual(result[0], bytes(range(7)))
+
+    def test_lob_max_length_leaves_varchar_alone(self):
+        self.conn.jconn.mockStringResult("y" * 50)
+        with self.conn.cursor(lob_max_length=10) as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertEqual(result[0], "y" * 50)
+
+    def test_lob_batch_size_applies_to_lob_result_sets(self):
+        self.conn.jconn.mockClobResult("text")
+        with self.conn.cursor(lob_batch_size=16) as cursor:
+            cursor.execute("dummy stmt")
+            self.assertEqual(cursor._batch_size(), 16)
+        self.conn.jconn.mockStringResult("text")
+        with self.conn.cursor(lob_batch_size=16) as cursor:
+            cursor.execute("dummy stmt")
+            self.assertEqual(cursor._batch_size(), 1024)
+
+    def test_large_types_lob_reads_clob_as_large_string(self):
+        import pyarrow as pa
+        self.conn.jconn.mockClobResult("text")
+        with self.conn.cursor(large_types='lob') as cursor:
+            cursor.execute("dummy stmt")
+            batches = cursor.fetch_arrow_batches()
+            batch = next(batches)
+            batches.close()
+        self.assertEqual(batch.column(0).type, pa.large_string())
+        self.assertEqual(batch.column(0)[0].as_py(), "text")
+
+    def test_large_types_lob_reads_whole_blob(self):
+        """Large binary values are streamed in chunks and not truncated."""
+        import pyarrow as pa
+        value = bytes(i % 251 for i in range(20000))
+        self.conn.jconn.mockBlobResult(value)
+        with self.conn.cursor(large_types='lob') as cursor:
+            cursor.execute("dummy stmt")
+            batches = cursor.fetch_arrow_batches()
+            batch = next(batches)
+            batches.close()
+        self.assertEqual(batch.column(0).type, pa.large_binary())
+        self.assertEqual(batch.column(0)[0].as_py(), value)
+        self.assertEqual(batch.column(0)[batch.num_rows - 1].as_py(), value)
+
+    def test_large_types_lob_keeps_varchar(self):
+        import pyarrow as pa
+        self.conn.jconn.mockStringResult("text")
+        with self.conn.cursor(large_types='lob') as cursor:
+            cursor.execute("dummy stmt")
+            batches = cursor.fetch_arrow_batches()
+            batch = next(batches)
+            batches.close()
+        self.assertEqual(batch.column(0).type, pa.string())
+
+    def test_large_types_all(self):
+        import pyarrow as pa
+        self.conn.jconn.mockStringResult("text")
+        with self.conn.cursor(large_types='all') as cursor:
+            cursor.execute("dummy stmt")
+            result = cursor.fetchone()
+        self.assertEqual(result[0], "text")
+        self.conn.jconn.mockBlobResult(b"\x00\x01")
+        with self.conn.cursor(large_types='all', lob_max_length=1) as cursor:
+            cursor.execute("dummy stmt")
+            batches = cursor.fetch_arrow_batches()
+            batch = next(batches)
+            batches.close()
+        self.assertEqual(batch.column(0).type, pa.large_binary())
+        self.assertEqual(batch.column(0)[0].as_py(), b"\x00")
+
+    def test_invalid_lob_options_rejected(self):
+        with self.assertRaises(jaydebeapiarrow.ProgrammingError):
+            self.conn.cursor(lob_max_length=-1)
+        with self.assertRaises(jaydebeapiarrow.ProgrammingError):
+            self.conn.cursor(lob_batch_size=0)
+        with self.assertRaises(jaydebeapiarrow.ProgrammingError):
+            self.conn.cursor(large_types='huge')
+        with self.assertRaises(jaydebeapiarrow.ProgrammingError):
+            self.conn.cursor(time_unit='ns')
+
     # --- Long query string tests (legacy issue #91) ---
 
     def test_long_query_string_18k_characters(self):
@@ -1260,6 +1628,51 @@ class MockTest(unittest.TestCase):
         self.conn.jconn.mockAutoCommit(False)
         self.conn.rollback()
 
+    # --- Streaming cursor tests ---
+
+    def test_streaming_cursor_sets_fetch_size(self):
+        """A streaming cursor should bound the driver fetch size."""
+        self.conn.jconn.mockType("INTEGER")
+        with self.conn.cursor(streaming=True, fetch_size=500) as cursor:
+            cursor.execute("dummy stmt")
+            self.assertEqual(cursor.fetchone(), (1,))
+        self.conn.jconn.verifyPreparedStatement().setFetchSize(500)
+
+    def test_streaming_cursor_restores_autocommit(self):
+        """Autocommit is switched off while streaming and restored on close,
+        or as soon as the result set is exhausted."""
+        import jpype
+        Mockito = jpype.JClass("org.mockito.Mockito")
+        self.conn.jconn.mockAutoCommit(True)
+        self.conn.jconn.mockType("INTEGER")
+        cursor = self.conn.cursor(streaming=True)
+        cursor.execute("dummy stmt")
+        self.conn.jconn.verifyConnection().setAutoCommit(False)
+        cursor.fetchone()
+        cursor.close()
+        self.conn.jconn.verifyConnection().setAutoCommit(True)
+
+        cursor = self.conn.cursor(streaming=True)
+        cursor.execute("dummy stmt")
+        Mockito.doReturn(False).when(cursor._rs).next()
+        self.assertEqual(cursor.fetchall(), [])
+        # Restored before the cursor is closed, so DML on other cursors of
+        # the connection is committed again.
+        Mockito.verify(self.conn.jconn, Mockito.times(2)).setAutoCommit(True)
+        cursor.close()
+        Mockito.verify(self.conn.jconn, Mockito.times(2)).setAutoCommit(True)
+
+    def test_streaming_cursor_keeps_manual_transaction(self):
+        """An already open transaction must not be committed by a streaming cursor."""
+        import jpype
+        Mockito = jpype.JClass("org.mockito.Mockito")
+        self.conn.jconn.mockAutoCommit(False)
+        self.conn.jconn.mockType("INTEGER")
+        with self.conn.cursor(streaming=True) as cursor:
+            cursor.execute("dummy stmt")
+            cursor.fetchone()
+        Mockito.verify(self.conn.jconn, Mockito.never()).setAutoCommit(True)
+
     def test_lastrowid_exists_and_is_none(self):
         """PEP-249: lastrowid attribute must exist on cursor (fixes #84)."""
         with self.conn.cursor() as cursor:
@@ -1284,6 +1697,166 @@ class MockTest(unittest.TestCase):
         """lastrowid should be None after executemany (mock driver limitation: skip)."""
         self.skipTest("Mock driver executeBatch returns None; covered by integration test")
 
+    # --- Query statistics and trace hooks ---
+
+    def test_cursor_stats_phase_timings(self):
+        self.conn.jconn.mockBigIntResult(1)
+        with self.conn.cursor() as cursor:
+            self.assertIsNone(cursor.stats)
+            cursor.execute("dummy stmt", [1])
+            cursor.fetchone()
+            stats = cursor.stats
+        self.assertEqual(stats.operation, "dummy stmt")
+        self.assertEqual(stats.bind_path, 'arrow')
+        self.assertEqual(stats.batches, 1)
+        self.assertEqual(stats.rows, 1024)
+        self.assertGreater(stats.bytes, 0)
+        for phase in ('prepare', 'bind', 'execute', 'fetch', 'export', 'import', 'rows'):
+            self.assertGreater(stats.durations[phase], 0, phase)
+        self.assertEqual(stats.as_dict()['rows'], 1024)
+
+    def test_trace_hooks_receive_events(self):
+        events = []
+
+        def hook(event, stats):
+            events.append((event, stats.batches))
+
+        def failing_hook(event, stats):
+            raise ValueError("ignored")
+
+        self.conn.jconn.mockBigIntResult(1)
+        jaydebeapiarrow.add_trace_hook(hook)
+        jaydebeapiarrow.add_trace_hook(failing_hook)
+        try:
+            with self.assertLogs('jaydebeapiarrow.lib.stats', level='WARNING'):
+                with self.conn.cursor() as cursor:
+                    cursor.execute("dummy stmt")
+                    cursor.fetchmany(2)
+                    cursor.fetchone()
+        finally:
+            jaydebeapiarrow.remove_trace_hook(hook)
+            jaydebeapiarrow.remove_trace_hook(failing_hook)
+        self.assertEqual(events, [('execute', 0), ('fetchmany', 1), ('fetchone', 1)])
+
+    # --- Metrics registry ---
+
+    def test_metrics_count_queries_and_batches(self):
+        before = jaydebeapiarrow.METRICS.as_dict()
+        self.conn.jconn.mockBigIntResult(1)
+        with self.conn.cursor() as cursor:
+            cursor.execute("dummy stmt", [1])
+            cursor.fetchall()
+            nbytes = cursor.stats.bytes
+        after = jaydebeapiarrow.METRICS.as_dict()
+
+        def delta(name):
+            return after[name] - before[name]
+        self.assertEqual(delta('jaydebeapiarrow_queries_total'), 1)
+        self.assertEqual(delta('jaydebeapiarrow_rows_fetched_total'), 1024)
+        self.assertEqual(delta('jaydebeapiarrow_batches_fetched_total'), 1)
+        self.assertEqual(delta('jaydebeapiarrow_arrow_bytes_imported_total'), nbytes)
+        self.assertGreater(delta('jaydebeapiarrow_fetch_seconds_total'), 0)
+        self.assertEqual(after['jaydebeapiarrow_execute_seconds']['count']
+                         - before['jaydebeapiarrow_execute_seconds']['count'], 1)
+        self.assertEqual(sorted(after['jaydebeapiarrow_legacy_temporal_fallbacks_total']),
+                         ['date', 'time', 'timestamp'])
+        self.assertGreater(after['jaydebeapiarrow_allocator_peak_bytes'], 0)
+        self.assertGreaterEqual(after['jaydebeapiarrow_allocator_allocated_bytes'], 0)
+        text = jaydebeapiarrow.METRICS.to_prometheus()
+        self.assertIn('jaydebeapiarrow_legacy_temporal_fallbacks_total{kind="date"} ', text)
+
+    def test_metrics_count_driver_cache_hits(self):
+        hits = jaydebeapiarrow.METRICS.get('jaydebeapiarrow_driver_cache_hits_total').value
+        with jaydebeapiarrow.connect('org.jaydebeapi.mockdriver.MockDriver', 'jdbc:jaydebeapi://dummyurl'):
+            pass
+        self.assertEqual(jaydebeapiarrow.METRICS.get('jaydebeapiarrow_driver_cache_hits_total').value,
+                         hits + 1)
+
+    # --- Slow-query and large-result logging ---
+
+    def test_query_log_thresholds(self):
+        with jaydebeapiarrow.connect('org.jaydebeapi.mockdriver.MockDriver', 'jdbc:jaydebeapi://dummyurl',
+                                     slow_query_ms=0, large_result_rows=1000) as conn:
+            conn.jconn.mockBigIntResult(1)
+            with conn.cursor() as cursor:
+                with self.assertLogs('jaydebeapiarrow.queries', level='WARNING') as logs:
+                    cursor.execute("dummy stmt", [1, 'a'])
+                    cursor.fetchone()
+                    cursor.fetchone()
+                self.assertEqual(len(logs.records), 1)
+                self.assertIn("Large result (1024 rows): dummy stmt; parameters: 2 (int, str)",
+                              logs.output[0])
+                self.assertEqual(logs.records[0].query_stats['rows'], 1024)
+                with self.assertLogs('jaydebeapiarrow.queries', level='WARNING') as logs:
+                    cursor.execute("dummy stmt")
+                self.assertEqual(len(logs.records), 1)
+                self.assertIn("Slow query (", logs.output[0])
+                self.assertIn("QueryStats(rows=1024, batches=1", logs.output[0])
+
+    def test_query_log_below_thresholds(self):
+        with jaydebeapiarrow.connect('org.jaydebeapi.mockdriver.MockDriver', 'jdbc:jaydebeapi://dummyurl',
+                                     slow_query_ms=60000, large_result_rows=2000) as conn:
+            conn.jconn.mockBigIntResult(1)
+            with self.assertRaises(AssertionError):
+                with self.assertLogs('jaydebeapiarrow.queries', level='WARNING'):
+                    with conn.cursor() as cursor:
+                        cursor.execute("dummy stmt")
+                        cursor.fetchall()
+
+    # --- OpenTelemetry spans ---
+
+    def _enable_tracing(self):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        jaydebeapiarrow.enable_tracing(provider)
+        self.addCleanup(jaydebeapiarrow.disable_tracing)
+        return exporter
+
+    @unittest.skipIf(TracerProvider is None, "opentelemetry-sdk is not installed")
+    def test_spans_for_execute_and_fetch(self):
+        exporter = self._enable_tracing()
+        self.conn.jconn.mockBigIntResult(1)
+        with self.conn.cursor() as cursor:
+            cursor.execute("SELECT x FROM t WHERE a = 'secret' AND b = 42", [1])
+            cursor.fetchone()
+            cursor.fetchall()
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        self.assertEqual(sorted(spans), ['Cursor.execute', 'Cursor.fetchall', 'Cursor.fetchone'])
+        execute = spans['Cursor.execute'].attributes
+        self.assertEqual(execute['db.query.text'], "SELECT x FROM t WHERE a = ? AND b = ?")
+        self.assertEqual(execute['jaydebeapiarrow.bind_path'], 'arrow')
+        self.assertEqual(execute['db.response.returned_rows'], 0)
+        fetch = spans['Cursor.fetchone'].attributes
+        self.assertEqual(fetch['db.response.returned_rows'], 1024)
+        self.assertEqual(fetch['jaydebeapiarrow.batches'], 1)
+        self.assertGreater(fetch['jaydebeapiarrow.bytes'], 0)
+
+    @unittest.skipIf(TracerProvider is None, "opentelemetry-sdk is not installed")
+    def test_spans_for_connect_arrow_fetch_and_errors(self):
+        exporter = self._enable_tracing()
+        with jaydebeapiarrow.connect('org.jaydebeapi.mockdriver.MockDriver',
+                                     'jdbc:jaydebeapi://dummyurl') as conn:
+            conn.jconn.mockBigIntResult(1)
+            with conn.cursor() as cursor:
+                cursor.execute("dummy stmt")
+                cursor.fetch_arrow_table()
+            conn.jconn.mockExceptionOnExecute("java.sql.SQLException", "expected")
+            with conn.cursor() as cursor:
+                with self.assertRaises(jaydebeapiarrow.DatabaseError):
+                    cursor.execute("dummy stmt")
+        spans = exporter.get_finished_spans()
+        names = [span.name for span in spans]
+        self.assertEqual(names, ['Connection.connect', 'Cursor.execute', 'Cursor.fetch_arrow_batches',
+                                 'Cursor.fetch_arrow_table', 'Cursor.execute'])
+        self.assertEqual(spans[0].attributes['db.jdbc.driver_classname'],
+                         'org.jaydebeapi.mockdriver.MockDriver')
+        self.assertEqual(spans[2].parent.span_id, spans[3].context.span_id)
+        self.assertEqual(spans[2].attributes['jaydebeapiarrow.batches'], 1)
+        self.assertTrue(spans[2].status.is_ok)
+        self.assertFalse(spans[4].status.is_ok)
+        self.assertEqual(spans[4].events[0].name, 'exception')
+
     # --- JDBC exception during fetch tests (legacy #58) ---
 
     def test_sql_exception_on_fetch_raises_database_error(self):
@@ -1350,6 +1923,86 @@ class ParallelConnectTest(unittest.TestCase):
 
         self.assertEqual(errors, [], f"Thread errors: {errors}")
 
+    def test_temporal_legacy_fallback_probed_once_per_driver(self):
+        """A driver rejecting getObject(..., LocalDateTime.class) switches the
+        shared TemporalSupport of its result set class to the legacy path."""
+        import jpype
+        from datetime import timezone
+        TemporalSupport = jpype.JClass("org.jaydebeapiarrow.extension.TemporalSupport")
+        LocalDateTime = jpype.JClass("java.time.LocalDateTime")
+        self.conn.jconn.mockCalendarTimestampTZResult(LocalDateTime.of(2020, 5, 6, 7, 8, 9))
+        with self.conn.cursor() as cursor:
+            cursor.execute("dummy stmt")
+            support = TemporalSupport.forDriver(cursor._rs)
+            result = cursor.fetchone()
+        self.assertEqual(result[0], datetime(2020, 5, 6, 7, 8, 9, tzinfo=timezone.utc))
+        self.assertTrue(support.legacyTimestampTZ().isLegacy())
+        self.assertFalse(support.legacyTimestamp().isLegacy())
+
+    def test_null_pointer_on_null_temporal_probed_once(self):
+        """A driver throwing NullPointerException from getObject() for NULL
+        dates (DB2) is switched to getDate() after the first NULL, without
+        counting it as a legacy fallback."""
+        import jpype
+        TimeUtils = jpype.JClass("org.jaydebeapiarrow.extension.TimeUtils")
+        LocalDate = jpype.JClass("java.time.LocalDate")
+        Calendar = jpype.JClass("java.util.Calendar")
+        Mockito = jpype.JClass("org.mockito.Mockito")
+        fallbacks = list(TimeUtils.getLegacyFallbackCounts())
+        self.conn.jconn.mockNullPointerOnNullDateResult()
+        with self.conn.cursor() as cursor:
+            cursor.execute("dummy stmt")
+            rows = cursor.fetchmany(5)
+            # The mock has no last row, so one batch of rows was read.
+            Mockito.verify(cursor._rs, Mockito.times(1)).getObject(1, LocalDate.class_)
+            Mockito.verify(cursor._rs, Mockito.atLeast(5)).getDate(
+                Mockito.eq(1), Mockito.any(Calendar.class_))
+        self.assertEqual(rows, [(None,)] * 5)
+        self.assertEqual(list(TimeUtils.getLegacyFallbackCounts()), fallbacks)
+
+    def test_concurrent_temporal_reads(self):
+        """Result sets read concurrently must not share Calendar state in the
+        temporal consumers."""
+        import jpype
+        from datetime import timezone
+        errors = []
+
+        def read_thread(idx):
+            try:
+                expected = datetime(2000 + idx, idx + 1, idx + 1, idx, idx, idx)
+                conn = jaydebeapiarrow.connect(
+                    'org.jaydebeapi.mockdriver.MockDriver',
+                    'jdbc:jaydebeapi://dummyurl%d' % idx)
+                try:
+                    LocalDateTime = jpype.JClass("java.time.LocalDateTime")
+                    conn.jconn.mockCalendarTimestampTZResult(LocalDateTime.of(
+                        expected.year, expected.month, expected.day,
+                        expected.hour, expected.minute, expected.second))
+                    expected = expected.replace(tzinfo=timezone.utc)
+                    for _ in range(5):
+                        with conn.cursor() as cursor:
+                            cursor.execute("dummy stmt")
+                            rows = cursor.fetchmany(2000)
+                        wrong = [r[0] for r in rows if r[0] != expected]
+                        if wrong:
+                            errors.append((idx, wrong[0]))
+                            return
+                finally:
+                    conn.close()
+            except Exception as e:
+                errors.append((idx, e))
+            finally:
+                if jpype.java.lang.Thread.isAttached():
+                    jpype.java.lang.Thread.detach()
+
+        threads = [threading.Thread(target=partial(read_thread, i)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [], f"Thread errors: {errors}")
+
     def test_jvm_startup_lock_exists(self):
         """The _jvm_startup_lock should be a threading.Lock."""
         self.assertTrue(hasattr(jaydebeapiarrow, '_jvm_startup_lock'))
@@ -1377,3 +2030,283 @@ class ConnectValidationTest(unittest.TestCase):
                 {'user': 'sa', 'password': ''}
             )
         self.assertIn('url', str(ctx.exception).lower())
+
+    def test_query_log_thresholds_must_be_non_negative(self):
+        for kwargs in ({'slow_query_ms': -1}, {'large_result_rows': '100'}):
+            with self.assertRaises(jaydebeapiarrow.ProgrammingError):
+                jaydebeapiarrow.connect('org.jaydebeapi.mockdriver.MockDriver',
+                                        'jdbc:jaydebeapi://dummyurl', **kwargs)
+
+
+class JvmStartupArgsTest(unittest.TestCase):
+    """Tests for JVM startup: classpath, arguments and start_jvm()."""
+
+    def test_classpath_order_is_stable(self):
+        jars = ['/b/driver.jar', '/a/other.jar', '/b/driver.jar']
+        class_path = jaydebeapiarrow._build_classpath(jars)
+        self.assertEqual(class_path[:2], ['/b/driver.jar', '/a/other.jar'])
+        self.assertEqual(len(class_path), len(set(class_path)))
+        self.assertEqual(class_path, jaydebeapiarrow._build_classpath(jars))
+
+    def test_cds_archive_is_passed_to_jvm(self):
+        with tempfile.NamedTemporaryFile(suffix='.jsa') as archive:
+            args = jaydebeapiarrow._jvm_startup_args([], ['-Xmx1g'], jvm_cds=archive.name)
+        self.assertIn('-XX:SharedArchiveFile=%s' % archive.name, args)
+        self.assertEqual(args[-1], '-Xmx1g')
+
+    def test_missing_cds_archive_is_skipped(self):
+        with self.assertLogs('jaydebeapiarrow', level='WARNING'):
+            args = jaydebeapiarrow._jvm_startup_args([], None, jvm_cds='/nonexistent/app.jsa')
+        self.assertFalse(any(a.startswith('-XX:SharedArchiveFile') for a in args))
+
+    def test_start_jvm_then_connect(self):
+        thread = jaydebeapiarrow.start_jvm(jvm_args=_SUPPRESS_LOGGING_ARGS)
+        if thread is not None:
+            thread.join()
+        self.assertTrue(jaydebeapiarrow._is_jvm_started())
+        self.assertIsNone(jaydebeapiarrow.start_jvm())
+        with jaydebeapiarrow.connect('org.jaydebeapi.mockdriver.MockDriver',
+                                     'jdbc:jaydebeapi://dummyurl') as conn:
+            self.assertIsNotNone(conn.jconn)
+
+    def test_wait_for_jvm_returns_when_start_is_done(self):
+        done = threading.Event()
+        timer = threading.Timer(0.05, done.set)
+        timer.start()
+        try:
+            jaydebeapiarrow._wait_for_jvm(done)
+        finally:
+            timer.join()
+        self.assertTrue(done.is_set())
+
+
+class ClasspathCacheTest(unittest.TestCase):
+    """Tests for the persistent cache of expanded CLASSPATH entries."""
+
+    def setUp(self):
+        from jaydebeapiarrow.lib import classpath_cache
+        self.cache = classpath_cache
+        self.tmp = tempfile.TemporaryDirectory()
+        self.jar_dir = os.path.join(self.tmp.name, 'jars')
+        os.makedirs(self.jar_dir)
+        open(os.path.join(self.jar_dir, 'a.jar'), 'w').close()
+        self.old_env = os.environ.get('JAYDEBEAPIARROW_CACHE_DIR')
+        os.environ['JAYDEBEAPIARROW_CACHE_DIR'] = os.path.join(self.tmp.name, 'cache')
+        self.classpath = os.path.join(self.jar_dir, '*')
+        self.expansions = 0
+
+    def _bump_mtime(self, path):
+        # Bump the mtime explicitly; a coarse file system clock may not.
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def tearDown(self):
+        if self.old_env is None:
+            del os.environ['JAYDEBEAPIARROW_CACHE_DIR']
+        else:
+            os.environ['JAYDEBEAPIARROW_CACHE_DIR'] = self.old_env
+        self.tmp.cleanup()
+
+    def _expand(self, jars):
+        self.expansions += 1
+        return jaydebeapiarrow._deduplicate_jars(jars)
+
+    def test_expansion_is_reused(self):
+        first = self.cache.resolve(self.classpath, self._expand)
+        second = self.cache.resolve(self.classpath, self._expand)
+        self.assertEqual(first, [os.path.join(self.jar_dir, 'a.jar')])
+        self.assertEqual(second, first)
+        self.assertEqual(self.expansions, 1)
+
+    def test_entry_checks_directories_and_duplicated_jars_only(self):
+        sub_dir = os.path.join(self.jar_dir, 'sub')
+        os.makedirs(sub_dir)
+        for name in ('a.jar', 'b.jar'):
+            open(os.path.join(sub_dir, name), 'w').close()
+        _, mtimes = self.cache.expand(self.classpath)
+        self.assertEqual(sorted(mtimes), sorted([
+            self.jar_dir, sub_dir,
+            os.path.join(self.jar_dir, 'a.jar'), os.path.join(sub_dir, 'a.jar')]))
+
+    def test_directory_change_invalidates_entry(self):
+        self.cache.resolve(self.classpath, self._expand)
+        open(os.path.join(self.jar_dir, 'b.jar'), 'w').close()
+        self._bump_mtime(self.jar_dir)
+        jars = self.cache.resolve(self.classpath, self._expand)
+        self.assertEqual(sorted(os.path.basename(j) for j in jars), ['a.jar', 'b.jar'])
+        self.assertEqual(self.expansions, 2)
+
+    def test_overwritten_jar_invalidates_entry(self):
+        """The newer of two jars with the same basename is kept, so a jar
+        overwritten in place can change the classpath."""
+        sub_dir = os.path.join(self.jar_dir, 'sub')
+        os.makedirs(sub_dir)
+        newer = os.path.join(sub_dir, 'a.jar')
+        open(newer, 'w').close()
+        self._bump_mtime(newer)
+        self.assertEqual(self.cache.resolve(self.classpath, self._expand), [newer])
+        stat = os.stat(newer)
+        os.utime(os.path.join(self.jar_dir, 'a.jar'),
+                 ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(self.cache.resolve(self.classpath, self._expand),
+                         [os.path.join(self.jar_dir, 'a.jar')])
+        self.assertEqual(self.expansions, 2)
+
+    def test_expansion_follows_symlinked_directories(self):
+        """Like glob, the walk follows symlinked directories, and their
+        contents invalidate the entry."""
+        target = os.path.join(self.tmp.name, 'linked')
+        os.makedirs(target)
+        open(os.path.join(target, 'c.jar'), 'w').close()
+        try:
+            os.symlink(target, os.path.join(self.jar_dir, 'link'))
+        except (OSError, NotImplementedError):
+            self.skipTest("symlinks are not supported")
+        jars = self.cache.resolve(self.classpath, self._expand)
+        self.assertEqual(sorted(os.path.basename(j) for j in jars), ['a.jar', 'c.jar'])
+        open(os.path.join(target, 'd.jar'), 'w').close()
+        self._bump_mtime(target)
+        jars = self.cache.resolve(self.classpath, self._expand)
+        self.assertEqual(sorted(os.path.basename(j) for j in jars), ['a.jar', 'c.jar', 'd.jar'])
+        self.assertEqual(self.expansions, 2)
+
+    def test_clear_and_disable(self):
+        self.cache.resolve(self.classpath, self._expand)
+        jaydebeapiarrow.clear_classpath_cache()
+        self.assertFalse(os.path.exists(self.cache.cache_path()))
+        os.environ['JAYDEBEAPIARROW_CLASSPATH_CACHE'] = '0'
+        try:
+            self.cache.resolve(self.classpath, self._expand)
+            self.cache.resolve(self.classpath, self._expand)
+        finally:
+            del os.environ['JAYDEBEAPIARROW_CLASSPATH_CACHE']
+        self.assertEqual(self.expansions, 3)
+
+    def test_resolved_classpath_lists_jars_first(self):
+        classpath = jaydebeapiarrow.resolved_classpath('/drivers/x.jar')
+        self.assertEqual(classpath[0], '/drivers/x.jar')
+        self.assertTrue(any('arrow-jdbc-extension' in os.path.basename(j) for j in classpath))
+
+
+class DriverCacheTest(unittest.TestCase):
+    """Tests for the per-process cache of loaded JDBC drivers."""
+
+    DRIVER = 'org.jaydebeapi.mockdriver.MockDriver'
+
+    def _connect(self):
+        return jaydebeapiarrow.connect(self.DRIVER, 'jdbc:jaydebeapi://dummyurl',
+                                       jvm_args=_SUPPRESS_LOGGING_ARGS)
+
+    def test_driver_is_loaded_once(self):
+        with self._connect():
+            pass
+        entry = jaydebeapiarrow._driver_cache[(self.DRIVER, None)]
+        class_loader, driver = entry
+        self.assertIsNone(class_loader)
+        self.assertEqual(driver.getClass().getName(), self.DRIVER)
+        with self._connect():
+            pass
+        self.assertIs(jaydebeapiarrow._driver_cache[(self.DRIVER, None)], entry)
+
+    def test_url_not_accepted_by_driver_falls_back_to_driver_manager(self):
+        with self._connect():
+            pass
+        # MockDriver.connect() returns null for the URL; DriverManager then
+        # reports that no registered driver accepts it.
+        with self.assertRaises(Exception) as ctx:
+            jaydebeapiarrow.connect(self.DRIVER, 'jdbc:unknown://dummyurl')
+        self.assertIn('suitable driver', str(ctx.exception))
+
+    def test_driver_properties(self):
+        with self._connect():
+            pass
+        info = jaydebeapiarrow._driver_properties(['sa', 'secret'])
+        self.assertEqual(info.getProperty('user'), 'sa')
+        self.assertEqual(info.getProperty('password'), 'secret')
+        self.assertEqual(jaydebeapiarrow._driver_properties({'user': 'sa'}).getProperty('user'), 'sa')
+        self.assertIsNone(jaydebeapiarrow._driver_properties(['a', 'b', 'c']))
+
+
+class MetricsRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        from jaydebeapiarrow.lib.metrics import MetricsRegistry
+        self.registry = MetricsRegistry()
+
+    def test_counter_and_histogram(self):
+        counter = self.registry.counter('test_events_total', 'Events.')
+        histogram = self.registry.histogram('test_size', 'Sizes.', buckets=(1, 10))
+        counter.inc()
+        counter.inc(2)
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+        self.assertEqual(self.registry.as_dict(), {
+            'test_events_total': 3,
+            'test_size': {'buckets': {'1.0': 2, '10.0': 3, '+Inf': 4}, 'sum': 56.5, 'count': 4},
+        })
+        self.registry.reset()
+        self.assertEqual(self.registry.as_dict()['test_events_total'], 0)
+        self.assertEqual(self.registry.as_dict()['test_size']['count'], 0)
+
+    def test_prometheus_text(self):
+        self.registry.counter('test_events_total', 'Events.').inc(3)
+        self.registry.histogram('test_size', 'Sizes.', buckets=(1,)).observe(2)
+        self.registry.callback('test_kinds_total', 'Kinds.', 'counter',
+                               lambda: [((('kind', 'a"b'),), 1)])
+        self.registry.callback('test_unavailable', 'Not yet known.', 'gauge', lambda: None)
+        self.assertEqual(self.registry.to_prometheus(), (
+            '# HELP test_events_total Events.\n'
+            '# TYPE test_events_total counter\n'
+            'test_events_total 3\n'
+            '# HELP test_size Sizes.\n'
+            '# TYPE test_size histogram\n'
+            'test_size_bucket{le="1.0"} 0\n'
+            'test_size_bucket{le="+Inf"} 1\n'
+            'test_size_sum 2\n'
+            'test_size_count 1\n'
+            '# HELP test_kinds_total Kinds.\n'
+            '# TYPE test_kinds_total counter\n'
+            'test_kinds_total{kind="a\\"b"} 1\n'
+            '# HELP test_unavailable Not yet known.\n'
+            '# TYPE test_unavailable gauge\n'))
+
+    def test_duplicate_name_is_rejected(self):
+        self.registry.counter('test_events_total', 'Events.')
+        with self.assertRaises(ValueError):
+            self.registry.counter('test_events_total', 'Events.')
+
+
+class SummarizeParametersTest(unittest.TestCase):
+
+    def test_counts_and_types(self):
+        from jaydebeapiarrow.lib.stats import summarize_parameters
+        self.assertEqual(summarize_parameters(()), 'none')
+        self.assertEqual(summarize_parameters([1, 'secret', None]), '3 (int, str, NoneType)')
+        self.assertEqual(summarize_parameters([(1, 2.5)] * 3, is_batch=True), '3 rows of 2 (int, float)')
+        self.assertEqual(summarize_parameters(iter([(1,)]), is_batch=True), 'batch of unknown size')
+        self.assertEqual(summarize_parameters(list(range(12))), '12 (%s, ...)' % ', '.join(['int'] * 10))
+
+
+class SqlFingerprintTest(unittest.TestCase):
+
+    def test_literals_are_replaced(self):
+        from jaydebeapiarrow.lib.tracing import sql_fingerprint
+        self.assertEqual(
+            sql_fingerprint("SELECT * FROM t1 WHERE name = 'O''Brien' AND id IN (1, 2.5, 3e10)"),
+            "SELECT * FROM t1 WHERE name = ? AND id IN (?, ?, ?)")
+
+    def test_comments_and_whitespace_are_removed(self):
+        from jaydebeapiarrow.lib.tracing import sql_fingerprint
+        self.assertEqual(
+            sql_fingerprint("SELECT a, -- the key\n  b /* x = 1 */\nFROM t WHERE c = '--'"),
+            "SELECT a, b FROM t WHERE c = ?")
+
+    def test_enable_tracing_without_opentelemetry(self):
+        try:
+            import opentelemetry  # noqa: F401
+        except ImportError:
+            with self.assertRaises(ImportError) as ctx:
+                jaydebeapiarrow.enable_tracing()
+            self.assertIn('jaydebeapiarrow[opentelemetry]', str(ctx.exception))
+        else:
+            self.skipTest("opentelemetry is installed")
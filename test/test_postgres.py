@@ -288,3 +288,14 @@ class PostgresTest(IntegrationTestBase, unittest.TestCase):
         # ACCOUNT_ID_TZ (TIMESTAMPTZ) should be timezone-aware (UTC)
         self.assertEqual(result[1], datetime(2024, 6, 15, 10, 30, 0, tzinfo=timezone.utc))
         self.assertIsNotNone(result[1].tzinfo)
+
+    def test_streaming_cursor_fetch_arrow_batches(self):
+        """A streaming cursor runs inside a transaction while the result is
+        open and restores autocommit once it is closed."""
+        self.conn.jconn.setAutoCommit(True)
+        with self.conn.cursor(streaming=True, fetch_size=1) as cursor:
+            cursor.execute("select ACCOUNT_NO from ACCOUNT order by ACCOUNT_NO")
+            self.assertFalse(self.conn.jconn.getAutoCommit())
+            table = cursor.fetch_arrow_table()
+        self.assertEqual(table.column(0).to_pylist(), [18, 19])
+        self.assertTrue(self.conn.jconn.getAutoCommit())